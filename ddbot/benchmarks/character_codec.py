@@ -0,0 +1,81 @@
+import argparse
+import random
+import typing
+
+import orjson
+
+import benchmarks.character_derivation as character_derivation_benchmark
+import lib.character.clients as character_clients
+import lib.character.codec as character_codec
+import lib.character.models as character_models
+import tests.utils.character as character_utils
+
+
+def _orjson_encode(character: character_models.Character) -> bytes:
+    return orjson.dumps(
+        {
+            "id": character.id,
+            "name": character.name,
+            "ability_scores": character.ability_scores,
+            "saving_throw_modifiers": character.saving_throw_modifiers,
+            "skill_modifiers": character.skill_modifiers,
+            "initiative_modifier": character.initiative_modifier,
+            "death_saving_throw_modifier": character.death_saving_throw_modifier,
+        }
+    )
+
+
+def _orjson_decode(data: bytes) -> character_models.Character:
+    raw_data = orjson.loads(data)
+
+    return character_models.Character(
+        id=raw_data["id"],
+        name=raw_data["name"],
+        ability_scores=tuple(raw_data["ability_scores"]),
+        saving_throw_modifiers=tuple(raw_data["saving_throw_modifiers"]),
+        skill_modifiers=tuple(raw_data["skill_modifiers"]),
+        initiative_modifier=raw_data["initiative_modifier"],
+        death_saving_throw_modifier=raw_data["death_saving_throw_modifier"],
+    )
+
+
+def run(sizes: typing.Sequence[int], repeat: int) -> None:
+    rng = random.Random(42)
+    measure = character_derivation_benchmark.measure
+
+    print(
+        f"{'characters':>10} | {'codec':>7} | {'encode, s':>10} | {'decode, s':>10} | {'bytes/char':>10}",
+    )
+    for size in sizes:
+        raw_datas = [character_utils.make_character_data(entity_id, rng=rng) for entity_id in range(size)]
+        characters = typing.cast(list[character_models.Character], character_clients.derive_characters(raw_datas))
+
+        codecs = (
+            ("orjson", _orjson_encode, _orjson_decode),
+            ("binary", character_codec.CharacterCodec.encode, character_codec.CharacterCodec.decode),
+        )
+        for name, encode, decode in codecs:
+            encoded = [encode(character) for character in characters]
+            assert [decode(data) for data in encoded] == characters
+
+            encode_time = measure(
+                lambda encode=encode, characters=characters: [encode(character) for character in characters],
+                repeat,
+            )
+            decode_time = measure(lambda decode=decode, encoded=encoded: [decode(data) for data in encoded], repeat)
+            average_size = sum(len(data) for data in encoded) / size
+
+            print(f"{size:>10} | {name:>7} | {encode_time:>10.4f} | {decode_time:>10.4f} | {average_size:>10.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Binary vs orjson character codec benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    run(sizes=args.sizes, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import argparse
+import random
+import time
+import typing
+
+import lib.character.clients as character_clients
+import tests.utils.character as character_utils
+
+
+def measure(callback: typing.Callable[[], typing.Any], repeat: int) -> float:
+    best = float("inf")
+
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        callback()
+        best = min(best, time.perf_counter() - started_at)
+
+    return best
+
+
+def run(sizes: typing.Sequence[int], repeat: int) -> None:
+    rng = random.Random(42)
+
+    print(f"{'characters':>10} | {'single, s':>10} | {'batch, s':>10} | {'speedup':>8}")
+    for size in sizes:
+        raw_datas = [character_utils.make_character_data(entity_id, rng=rng) for entity_id in range(size)]
+
+        single = measure(
+            lambda raw_datas=raw_datas: [character_clients.derive_character(raw_data) for raw_data in raw_datas],
+            repeat,
+        )
+        batch = measure(lambda raw_datas=raw_datas: character_clients.derive_characters(raw_datas), repeat)
+
+        print(f"{size:>10} | {single:>10.4f} | {batch:>10.4f} | {single / batch:>7.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Single vs batch character derivation benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    run(sizes=args.sizes, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
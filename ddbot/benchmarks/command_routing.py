@@ -0,0 +1,89 @@
+import argparse
+import asyncio
+import datetime
+import time
+import typing
+
+import aiogram
+import aiogram.filters as aiogram_filters
+import aiogram.types as aiogram_types
+
+import lib.utils.aiogram as aiogram_utils
+
+BOT_TOKEN = "123456:ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghi"
+
+
+async def _noop(message: aiogram_types.Message, **kwargs: typing.Any) -> None:
+    pass
+
+
+def _make_per_command_dispatcher(commands: typing.Sequence[str]) -> aiogram.Dispatcher:
+    dispatcher = aiogram.Dispatcher()
+    for command in commands:
+        dispatcher.message.register(_noop, aiogram_filters.Command(command))
+
+    return dispatcher
+
+
+def _make_table_dispatcher(commands: typing.Sequence[str]) -> aiogram.Dispatcher:
+    dispatcher = aiogram.Dispatcher()
+    dispatcher.message.register(
+        _noop,
+        aiogram_utils.CommandTableMessageFilter[str](
+            table={command: command for command in commands},
+            result_key="command",
+        ),
+    )
+
+    return dispatcher
+
+
+def _make_update(update_id: int, text: str) -> aiogram_types.Update:
+    return aiogram_types.Update(
+        update_id=update_id,
+        message=aiogram_types.Message(
+            message_id=update_id,
+            date=datetime.datetime.now(),
+            chat=aiogram_types.Chat(id=1, type="private"),
+            from_user=aiogram_types.User(id=1, is_bot=False, first_name="User"),
+            text=text,
+        ),
+    )
+
+
+async def _measure(dispatcher: aiogram.Dispatcher, bot: aiogram.Bot, updates: list[aiogram_types.Update]) -> float:
+    started_at = time.perf_counter()
+    for update in updates:
+        await dispatcher.feed_update(bot, update)
+
+    return (time.perf_counter() - started_at) / len(updates)
+
+
+async def run(sizes: typing.Sequence[int], updates_count: int) -> None:
+    bot = aiogram.Bot(token=BOT_TOKEN)
+
+    print(f"{'commands':>8} | {'per-command, us':>15} | {'table, us':>10} | {'speedup':>8}")
+    try:
+        for size in sizes:
+            commands = [f"command_{index}" for index in range(size)]
+            updates = [_make_update(index, f"/{commands[index % size]} args") for index in range(updates_count)]
+
+            per_command = await _measure(_make_per_command_dispatcher(commands), bot, updates)
+            table = await _measure(_make_table_dispatcher(commands), bot, updates)
+
+            print(f"{size:>8} | {per_command * 1e6:>15.1f} | {table * 1e6:>10.1f} | {per_command / table:>7.1f}x")
+    finally:
+        await bot.session.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-command filters vs command table routing benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 33, 100, 300])
+    parser.add_argument("--updates", type=int, default=3_000)
+    args = parser.parse_args()
+
+    asyncio.run(run(sizes=args.sizes, updates_count=args.updates))
+
+
+if __name__ == "__main__":
+    main()
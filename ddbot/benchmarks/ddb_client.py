@@ -0,0 +1,65 @@
+import argparse
+import asyncio
+import statistics
+import time
+import typing
+
+import aiohttp
+
+import lib.character.clients as character_clients
+import tests.utils.ddb as ddb_utils
+
+
+async def _timed_get(client: character_clients.CharacterDdbClient, entity_id: int) -> float | None:
+    started_at = time.perf_counter()
+
+    try:
+        await client.get(entity_id)
+    except client.BaseError:
+        return None
+
+    return time.perf_counter() - started_at
+
+
+async def run(profile_name: str, count: int, concurrencies: typing.Sequence[int]) -> None:
+    server = ddb_utils.FakeDdbServer(
+        synthetic_characters_enabled=True,
+        profile=ddb_utils.PROFILES[profile_name],
+    )
+
+    print(f"profile: {profile_name}, characters: {count}")
+    print(f"{'concurrency':>11} | {'total, s':>8} | {'req/s':>7} | {'p50, ms':>8} | {'p95, ms':>8} | {'errors':>6}")
+    async with ddb_utils.run_fake_ddb_server(server) as base_url, aiohttp.ClientSession() as base_client:
+        for concurrency in concurrencies:
+            client = character_clients.CharacterDdbClient(
+                base_client=base_client,
+                base_url=base_url,
+                max_concurrency=concurrency,
+            )
+
+            started_at = time.perf_counter()
+            results = await asyncio.gather(*(_timed_get(client, entity_id) for entity_id in range(count)))
+            total = time.perf_counter() - started_at
+
+            latencies = sorted(result for result in results if result is not None)
+            errors = len(results) - len(latencies)
+            p50 = statistics.median(latencies) * 1000 if latencies else float("nan")
+            p95 = latencies[int(len(latencies) * 0.95) - 1] * 1000 if latencies else float("nan")
+
+            print(
+                f"{concurrency:>11} | {total:>8.2f} | {count / total:>7.1f} | {p50:>8.1f} | {p95:>8.1f} | {errors:>6}",
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Character client benchmark against the local D&D Beyond stand-in")
+    parser.add_argument("--profile", choices=sorted(ddb_utils.PROFILES), default="realistic")
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument("--concurrencies", type=int, nargs="+", default=[4, 16, 64])
+    args = parser.parse_args()
+
+    asyncio.run(run(profile_name=args.profile, count=args.count, concurrencies=args.concurrencies))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import argparse
+import asyncio
+import json
+import time
+import typing
+
+import aiogram
+import aiogram.types as aiogram_types
+
+import lib.utils.aiogram as aiogram_utils
+import lib.utils.json as json_utils
+
+BOT_TOKEN = "123456:ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghi"
+COMMANDS = [f"command_{index}" for index in range(33)]
+
+
+async def _noop(message: aiogram_types.Message, **kwargs: typing.Any) -> None:
+    pass
+
+
+def _make_body(update_id: int, text: str) -> bytes:
+    return json_utils.dumps_bytes(
+        {
+            "update_id": update_id,
+            "message": {
+                "message_id": update_id,
+                "date": 0,
+                "chat": {"id": -1, "type": "supergroup", "title": "Party"},
+                "from": {"id": update_id, "is_bot": False, "first_name": "User", "language_code": "en"},
+                "text": text,
+            },
+        }
+    )
+
+
+async def _measure_dispatch(dispatcher: aiogram.Dispatcher, bot: aiogram.Bot, bodies: list[bytes]) -> float:
+    started_at = time.perf_counter()
+    for body in bodies:
+        await dispatcher.feed_raw_update(bot, json.loads(body))
+
+    return (time.perf_counter() - started_at) / len(bodies)
+
+
+def _measure_prefilter(prefilter: aiogram_utils.CommandUpdatePrefilter, bodies: list[bytes]) -> float:
+    started_at = time.perf_counter()
+    for body in bodies:
+        prefilter(json_utils.loads_bytes(body))
+
+    return (time.perf_counter() - started_at) / len(bodies)
+
+
+async def run(updates_count: int) -> None:
+    bot = aiogram.Bot(token=BOT_TOKEN)
+    dispatcher = aiogram.Dispatcher()
+    dispatcher.message.register(
+        _noop,
+        aiogram_utils.CommandTableMessageFilter[str](table={command: command for command in COMMANDS}, result_key="c"),
+    )
+    prefilter = aiogram_utils.CommandUpdatePrefilter(commands=frozenset(COMMANDS))
+    bodies = [_make_body(index, f"regular group chatter number {index}") for index in range(updates_count)]
+
+    try:
+        dispatch = await _measure_dispatch(dispatcher, bot, bodies)
+        prefiltered = _measure_prefilter(prefilter, bodies)
+    finally:
+        await bot.session.close()
+
+    print(f"{'dispatch, us':>12} | {'prefilter, us':>13} | {'speedup':>8}")
+    print(f"{dispatch * 1e6:>12.1f} | {prefiltered * 1e6:>13.1f} | {dispatch / prefiltered:>7.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Full dispatch vs raw prefilter of non-command webhook updates")
+    parser.add_argument("--updates", type=int, default=10_000)
+    args = parser.parse_args()
+
+    asyncio.run(run(updates_count=args.updates))
+
+
+if __name__ == "__main__":
+    main()
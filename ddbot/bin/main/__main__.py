@@ -1,16 +1,22 @@
 import asyncio
 import logging
 import os
+import signal
 
 import lib.app as app
 
 logger = logging.getLogger(__name__)
 
 
-async def run() -> None:
+async def run(worker_index: int = 0) -> None:
+    # Treat SIGTERM like SIGINT: cancel the main task only, so the application can drain before other tasks stop
+    main_task = asyncio.current_task()
+    assert main_task is not None
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, main_task.cancel)
+
     settings = app.Settings()
     try:
-        application = app.Application.from_settings(settings)
+        application = app.Application.from_settings(settings, worker_index=worker_index)
     except Exception as exc:
         logger.exception("Failed to initialize application settings")
         raise app.ServerStartError("Failed to initialize application settings") from exc
@@ -21,9 +27,9 @@ async def run() -> None:
         await application.dispose()
 
 
-def main() -> None:
+def run_worker(worker_index: int = 0) -> None:
     try:
-        asyncio.run(run())
+        asyncio.run(run(worker_index))
         exit(os.EX_OK)
     except SystemExit:
         exit(os.EX_OK)
@@ -37,5 +43,19 @@ def main() -> None:
         exit(os.EX_SOFTWARE)
 
 
+def main() -> None:
+    settings = app.Settings()
+    if settings.server.workers == 1:
+        run_worker()
+        return
+
+    try:
+        app.Supervisor.from_settings(settings, worker_target=run_worker).run()
+        exit(os.EX_OK)
+    except app.ApplicationError:
+        logger.exception("Supervisor has failed")
+        exit(os.EX_SOFTWARE)
+
+
 if __name__ == "__main__":
     main()
@@ -1,3 +1,5 @@
 from .app import *
 from .errors import *
+from .rederive import *
 from .settings import *
+from .supervisor import *
@@ -6,13 +6,12 @@ import typing
 
 import aiogram
 import aiogram.types as aiogram_types
-import aiogram.webhook.aiohttp_server as aiogram_aiohttp_webhook
 import aiohttp
 import aiohttp.typedefs as aiohttp_typedefs
 import aiohttp.web as aiohttp_web
-import redis.asyncio as redis_asyncio
 
 import lib.app.errors as app_errors
+import lib.app.factories as app_factories
 import lib.app.settings as app_settings
 import lib.character.clients as character_clients
 import lib.character.models as character_models
@@ -20,11 +19,15 @@ import lib.character.services as character_services
 import lib.context.repositories as context_repositories
 import lib.context.services as context_services
 import lib.telegram.command_handlers as telegram_command_handlers
+import lib.telegram.context as telegram_context
+import lib.telegram.inline_query_handlers as telegram_inline_query_handlers
+import lib.telegram.messages as telegram_messages
 import lib.utils.aiogram as aiogram_utils
 import lib.utils.aiohttp as aiohttp_utils
 import lib.utils.cache as cache_utils
 import lib.utils.lifecycle as lifecycle_utils
 import lib.utils.logging as logging_utils
+import lib.utils.rate_limit as rate_limit_utils
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +37,7 @@ class Application:
     lifecycle: lifecycle_utils.Lifecycle
 
     @classmethod
-    def from_settings(cls, settings: app_settings.Settings) -> typing.Self:
+    def from_settings(cls, settings: app_settings.Settings, worker_index: int = 0) -> typing.Self:
         log_level = "DEBUG" if settings.app.is_debug else settings.logs.level
         logging_config = logging_utils.create_config(
             log_level=log_level,
@@ -54,9 +57,12 @@ class Application:
         lifecycle_main_tasks: list[asyncio.Task[typing.Any]] = []
         lifecycle_startup_callbacks: list[lifecycle_utils.Callback] = []
         lifecycle_shutdown_callbacks: list[lifecycle_utils.Callback] = []
+        lifecycle_drain_callbacks: list[lifecycle_utils.Callback] = []
 
         logger.info("Initializing global dependencies")
 
+        redis_clients = app_factories.RedisClients(shutdown_callbacks=lifecycle_shutdown_callbacks)
+
         aiohttp_client = aiohttp.ClientSession()
         lifecycle_shutdown_callbacks.append(
             lifecycle_utils.Callback(
@@ -68,8 +74,21 @@ class Application:
 
         logger.info("Initializing clients")
 
+        character_archive = app_factories.create_character_archive(
+            settings=settings.character.archive,
+            redis_clients=redis_clients,
+        )
         character_client = character_clients.CharacterDdbClient(
             base_client=aiohttp_client,
+            archive=character_archive,
+            base_url=settings.character.ddb_base_url,
+            campaign_base_url=settings.character.ddb_campaign_base_url,
+            max_concurrency=settings.character.ddb_max_concurrency,
+            max_response_bytes=settings.character.ddb_max_response_bytes,
+            rate_limiter=rate_limit_utils.TokenBucket(
+                rate=settings.character.ddb_rate_limit_per_second,
+                capacity=settings.character.ddb_rate_limit_burst,
+            ),
         )
 
         logger.info("Initializing repositories")
@@ -79,28 +98,31 @@ class Application:
             context_repository = context_repositories.LocalContextRepository()
         elif isinstance(settings.context, app_settings.RedisContextRepositorySettings):
             logger.info("Using redis context repository")
-            context_redis_client = redis_asyncio.Redis(
+            context_redis_client = redis_clients.get(
                 host=settings.context.host,
                 port=settings.context.port,
                 db=settings.context.db,
                 password=settings.context.password,
             )
-            lifecycle_shutdown_callbacks.append(
-                lifecycle_utils.Callback(
-                    awaitable=context_redis_client.aclose(),
-                    error_message="Error while closing redis client",
-                    success_message="Redis client has been closed",
-                ),
-            )
             context_repository = context_repositories.RedisContextRepository(
                 redis_client=context_redis_client,
             )
         else:
             raise ValueError(f"Unknown context repository type: {settings.context.type}")
 
-        character_cache = cache_utils.LocalCache[character_models.Character](
-            ttl=datetime.timedelta(seconds=settings.character.cache_ttl_seconds),
-        )
+        character_cache: cache_utils.CacheProtocol[character_models.Character]
+        if settings.character.cache_adaptive_ttl_enabled:
+            logger.info("Using adaptive ttl character cache")
+            character_cache = cache_utils.AdaptiveLocalCache[character_models.Character](
+                ttl=datetime.timedelta(seconds=settings.character.cache_ttl_seconds),
+                min_ttl=datetime.timedelta(seconds=settings.character.cache_min_ttl_seconds),
+                max_ttl=datetime.timedelta(seconds=settings.character.cache_max_ttl_seconds),
+                growth_factor=settings.character.cache_ttl_growth_factor,
+            )
+        else:
+            character_cache = cache_utils.LocalCache[character_models.Character](
+                ttl=datetime.timedelta(seconds=settings.character.cache_ttl_seconds),
+            )
 
         logger.info("Initializing services")
 
@@ -111,9 +133,181 @@ class Application:
         )
         roll_service = character_services.RollService()
 
-        logger.info("Initializing aiogram")
+        if character_archive is not None and settings.character.archive_warmup_enabled:
+            character_rederive_service = character_services.CharacterRederiveService(
+                archive=character_archive,
+                derive=character_clients.derive_characters,
+                max_workers=settings.character.rederive_max_workers,
+            )
+            character_cache_warmup_task = lifecycle_utils.BackgroundTask(
+                logger=logger,
+                awaitable=character_service.warmup(
+                    rederive_service=character_rederive_service,
+                    max_characters=settings.character.archive_warmup_max_characters,
+                ),
+                name="character_cache_warmup",
+                error_message="Failed to warm up character cache from archive",
+                success_message="Character cache has been warmed up from archive",
+            )
+            lifecycle_startup_callbacks.append(
+                lifecycle_utils.Callback(
+                    awaitable=character_cache_warmup_task.start(),
+                    error_message="Failed to start character cache warmup",
+                    success_message="Character cache warmup has been started",
+                    name="character_cache_warmup",
+                ),
+            )
+            lifecycle_shutdown_callbacks.append(
+                lifecycle_utils.Callback(
+                    awaitable=character_cache_warmup_task.cancel(),
+                    error_message="Failed to cancel character cache warmup",
+                    success_message="Character cache warmup has been cancelled",
+                ),
+            )
+
+        logger.info("Initializing aiohttp")
+
+        aiohttp_url_dispatcher = aiohttp_web.UrlDispatcher()
+
+        logger.info("Initializing aiohttp middlewares")
+
+        aiohttp_middlewares: list[aiohttp_typedefs.Middleware] = []
+
+        logger.info("Initializing aiohttp handlers")
+
+        aiohttp_liveness_probe_handler = aiohttp_utils.LivenessProbeHandler()
+        aiohttp_url_dispatcher.add_route("GET", "/api/v1/health/liveness", aiohttp_liveness_probe_handler.process)
+
+        aiohttp_readiness_probe_handler = aiohttp_utils.ReadinessProbeHandler(
+            subsystems=[],
+        )
+        aiohttp_url_dispatcher.add_route("GET", "/api/v1/health/readiness", aiohttp_readiness_probe_handler.process)
+
+        roll_reply_coalescers: list[aiogram_utils.ReplyCoalescer] = []
+        for bot_index, telegram_settings in enumerate(settings.telegram_bots):
+            roll_reply_coalescer = cls._init_telegram_bot(
+                settings=settings,
+                telegram_settings=telegram_settings,
+                bot_index=bot_index,
+                worker_index=worker_index,
+                context_service=context_service,
+                character_service=character_service,
+                character_cache=character_cache,
+                roll_service=roll_service,
+                redis_clients=redis_clients,
+                aiohttp_url_dispatcher=aiohttp_url_dispatcher,
+                lifecycle_main_tasks=lifecycle_main_tasks,
+                lifecycle_startup_callbacks=lifecycle_startup_callbacks,
+                lifecycle_shutdown_callbacks=lifecycle_shutdown_callbacks,
+                lifecycle_drain_callbacks=lifecycle_drain_callbacks,
+            )
+            if roll_reply_coalescer is not None:
+                roll_reply_coalescers.append(roll_reply_coalescer)
+
+        logger.info("Initializing aiohttp application")
+
+        aiohttp_app = aiohttp_web.Application(
+            middlewares=aiohttp_middlewares,
+            router=aiohttp_url_dispatcher,
+        )
+        aiohttp_app_task = asyncio.create_task(
+            coro=aiohttp_web._run_app(  # pyright: ignore[reportPrivateUsage]
+                app=aiohttp_app,
+                host=settings.server.host,
+                port=settings.server.port,
+                reuse_port=settings.server.workers > 1,
+                shutdown_timeout=settings.server.drain_timeout_seconds,
+                print=aiohttp_utils.PrintLogger(),
+            ),
+            name="aiohttp_app",
+        )
+        lifecycle_main_tasks.append(aiohttp_app_task)
+        # Stop accepting requests before waiting for the queued updates
+        lifecycle_drain_callbacks.insert(
+            0,
+            lifecycle_utils.Callback(
+                awaitable=lifecycle_utils.cancel_task(aiohttp_app_task),
+                error_message="Failed to stop aiohttp server",
+                success_message="Aiohttp server has been stopped",
+            ),
+        )
+
+        # Flush coalesced replies after the queued updates of all bots have been processed
+        for roll_reply_coalescer in roll_reply_coalescers:
+            lifecycle_drain_callbacks.append(
+                lifecycle_utils.Callback(
+                    awaitable=roll_reply_coalescer.drain(),
+                    error_message="Failed to flush coalesced roll replies",
+                    success_message="Coalesced roll replies have been flushed",
+                ),
+            )
+
+        logger.info("Initializing lifecycle manager")
+
+        lifecycle = lifecycle_utils.Lifecycle(
+            logger=logger,
+            main_tasks=lifecycle_main_tasks,
+            startup_callbacks=lifecycle_startup_callbacks,
+            shutdown_callbacks=list(reversed(lifecycle_shutdown_callbacks)),
+            drain_callbacks=lifecycle_drain_callbacks,
+            drain_timeout_seconds=settings.server.drain_timeout_seconds,
+        )
 
-        aiogram_bot = aiogram.Bot(token=settings.telegram.token)
+        logger.info("Creating application")
+        application = cls(
+            lifecycle=lifecycle,
+        )
+
+        logger.info("Initializing application finished")
+
+        return application
+
+    @classmethod
+    def _init_telegram_bot(
+        cls,
+        settings: app_settings.Settings,
+        telegram_settings: app_settings.TelegramSettings,
+        bot_index: int,
+        worker_index: int,
+        context_service: context_services.LocalContextService,
+        character_service: character_services.CharacterService,
+        character_cache: cache_utils.CacheProtocol[character_models.Character],
+        roll_service: character_services.RollService,
+        redis_clients: app_factories.RedisClients,
+        aiohttp_url_dispatcher: aiohttp_web.UrlDispatcher,
+        lifecycle_main_tasks: list[asyncio.Task[typing.Any]],
+        lifecycle_startup_callbacks: list[lifecycle_utils.Callback],
+        lifecycle_shutdown_callbacks: list[lifecycle_utils.Callback],
+        lifecycle_drain_callbacks: list[lifecycle_utils.Callback],
+    ) -> aiogram_utils.ReplyCoalescer | None:
+        """
+        Creates a bot and dispatcher for one token on top of the services shared by all bots.
+        """
+        logger.info("Initializing aiogram bot %s", bot_index)
+
+        aiogram_bot = aiogram.Bot(
+            token=telegram_settings.token,
+            session=aiogram_utils.TunedAiohttpSession(
+                api_base_url=telegram_settings.api_base_url,
+                api_local_mode=telegram_settings.api_local_mode,
+                limit=telegram_settings.session_connection_limit,
+                keepalive_timeout_seconds=telegram_settings.session_keepalive_timeout_seconds,
+                timeout_seconds=telegram_settings.session_timeout_seconds,
+            ),
+        )
+        if telegram_settings.outbound_rate_limit_enabled:
+            aiogram_outbound_rate_scheduler = aiogram_utils.OutboundRateScheduler(
+                logger=logger,
+                # Every worker process gets an equal share of the global budget
+                global_rate=telegram_settings.outbound_global_rate_per_second / settings.server.workers,
+                global_burst=telegram_settings.outbound_global_rate_per_second / settings.server.workers,
+                private_chat_rate=telegram_settings.outbound_private_chat_rate_per_second,
+                group_chat_rate=telegram_settings.outbound_group_chat_rate_per_minute / 60,
+                chat_burst=telegram_settings.outbound_chat_burst,
+                max_retries=telegram_settings.outbound_max_retries,
+            )
+            aiogram_bot.session.middleware(aiogram_outbound_rate_scheduler)
+            lifecycle_main_tasks.append(aiogram_outbound_rate_scheduler.get_main_task())
         aiogram_dispatcher = aiogram.Dispatcher()
 
         aiogram_general_commands: list[aiogram_types.BotCommand] = []
@@ -144,85 +338,159 @@ class Application:
         )
         aiogram_general_commands.extend(character_cache_clear_command_handler.bot_commands)
 
-        for command_factory in telegram_command_handlers.ABILITY_CHECK_COMMAND_FACTORIES:
-            roll_command_handler = telegram_command_handlers.RollCommandHandler(
-                context_service=context_service,
-                character_service=character_service,
-                command=command_factory.make(callback=roll_service.roll_ability_check),
-            )
-            aiogram_dispatcher.message.register(
-                roll_command_handler.process,
-                *roll_command_handler.filters,
-            )
-            aiogram_ability_check_commands.extend(roll_command_handler.bot_commands)
-
-        for command_factory in telegram_command_handlers.ABILITY_SAVE_COMMAND_FACTORIES:
-            roll_command_handler = telegram_command_handlers.RollCommandHandler(
-                context_service=context_service,
-                character_service=character_service,
-                command=command_factory.make(callback=roll_service.roll_saving_throw),
-            )
-            aiogram_dispatcher.message.register(
-                roll_command_handler.process,
-                *roll_command_handler.filters,
-            )
-            aiogram_saving_throw_commands.extend(roll_command_handler.bot_commands)
-
-        for command_factory in telegram_command_handlers.SKILL_CHECK_COMMAND_FACTORIES:
-            roll_command_handler = telegram_command_handlers.RollCommandHandler(
-                context_service=context_service,
-                character_service=character_service,
-                command=command_factory.make(callback=roll_service.roll_skill_check),
-            )
-            aiogram_dispatcher.message.register(
-                roll_command_handler.process,
-                *roll_command_handler.filters,
-            )
-            aiogram_skill_check_commands.extend(roll_command_handler.bot_commands)
-
-        roll_command_handler = telegram_command_handlers.RollCommandHandler(
-            context_service=context_service,
+        campaign_set_command_handler = telegram_command_handlers.CampaignSetCommandHandler(
             character_service=character_service,
-            command=telegram_command_handlers.INITIATIVE_COMMAND_FACTORY.make(roll_service.roll_initiative),
         )
         aiogram_dispatcher.message.register(
-            roll_command_handler.process,
-            *roll_command_handler.filters,
+            campaign_set_command_handler.process,
+            *campaign_set_command_handler.filters,
         )
-        aiogram_miscellaneous_check_commands.extend(roll_command_handler.bot_commands)
+        aiogram_general_commands.extend(campaign_set_command_handler.bot_commands)
 
-        roll_command_handler = telegram_command_handlers.RollCommandHandler(
+        roll_reply_coalescer = (
+            aiogram_utils.ReplyCoalescer(
+                logger=logger,
+                bot=aiogram_bot,
+                window_seconds=telegram_settings.roll_reply_coalescing_window_seconds,
+            )
+            if telegram_settings.roll_reply_coalescing_enabled
+            else None
+        )
+        roll_command_router = telegram_command_handlers.RollCommandRouter(
             context_service=context_service,
             character_service=character_service,
-            command=telegram_command_handlers.DEATH_SAVE_COMMAND_FACTORY.make(roll_service.roll_death_saving_throw),
+            roll_service=roll_service,
+            commands=[
+                *telegram_command_handlers.ABILITY_CHECK_COMMANDS,
+                *telegram_command_handlers.ABILITY_SAVE_COMMANDS,
+                *telegram_command_handlers.SKILL_CHECK_COMMANDS,
+                telegram_command_handlers.INITIATIVE_COMMAND,
+                telegram_command_handlers.DEATH_SAVE_COMMAND,
+            ],
+            reply_coalescer=roll_reply_coalescer,
         )
         aiogram_dispatcher.message.register(
-            roll_command_handler.process,
-            *roll_command_handler.filters,
+            roll_command_router.process,
+            *roll_command_router.filters,
+        )
+        aiogram_ability_check_commands.extend(
+            command.bot_command for command in telegram_command_handlers.ABILITY_CHECK_COMMANDS
+        )
+        aiogram_saving_throw_commands.extend(
+            command.bot_command for command in telegram_command_handlers.ABILITY_SAVE_COMMANDS
+        )
+        aiogram_skill_check_commands.extend(
+            command.bot_command for command in telegram_command_handlers.SKILL_CHECK_COMMANDS
+        )
+        aiogram_miscellaneous_check_commands.extend(
+            [
+                telegram_command_handlers.INITIATIVE_COMMAND.bot_command,
+                telegram_command_handlers.DEATH_SAVE_COMMAND.bot_command,
+            ]
         )
-        aiogram_miscellaneous_check_commands.extend(roll_command_handler.bot_commands)
+
+        roll_panel_command_handler: telegram_command_handlers.RollPanelCommandHandler | None = None
+        if telegram_settings.roll_panel_enabled:
+            roll_panel_command_handler = telegram_command_handlers.RollPanelCommandHandler(
+                roll_command_router=roll_command_router,
+                row_width=telegram_settings.roll_panel_row_width,
+            )
+            aiogram_dispatcher.message.register(
+                roll_panel_command_handler.process,
+                *roll_panel_command_handler.filters,
+            )
+            aiogram_dispatcher.callback_query.register(
+                roll_command_router.process_callback_query,
+                *roll_command_router.callback_query_filters,
+            )
+            aiogram_general_commands.extend(roll_panel_command_handler.bot_commands)
+
+        if telegram_settings.inline_query_enabled:
+            character_inline_query_handler = telegram_inline_query_handlers.CharacterInlineQueryHandler(
+                context_service=context_service,
+                character_service=character_service,
+                cache_time_seconds=telegram_settings.inline_query_cache_time_seconds,
+            )
+            aiogram_dispatcher.inline_query.register(character_inline_query_handler.process)
 
         help_command_handler = telegram_command_handlers.HelpCommandHandler(
             text=telegram_command_handlers.render_help_message(
-                template=settings.telegram.help_message_template,
+                template=telegram_settings.help_message_template,
                 general_commands=aiogram_general_commands,
                 ability_check_commands=aiogram_ability_check_commands,
                 saving_throw_commands=aiogram_saving_throw_commands,
                 skill_check_commands=aiogram_skill_check_commands,
                 miscellaneous_check_commands=aiogram_miscellaneous_check_commands,
-                escape_characters=settings.telegram.help_message_escape_characters,
+                escape_characters=telegram_settings.help_message_escape_characters,
             ),
         )
         aiogram_dispatcher.message.register(help_command_handler.process, *help_command_handler.filters)
         aiogram_general_commands.extend(help_command_handler.bot_commands)
 
+        throttle_storage = app_factories.create_throttle_storage(
+            settings=telegram_settings.throttling,
+            redis_clients=redis_clients,
+        )
+        if throttle_storage is not None:
+            throttling_settings = telegram_settings.throttling
+            throttling_command_handlers: dict[str, typing.Sequence[aiogram_types.BotCommand]] = {
+                "roll": [command.bot_command for command in roll_command_router.commands],
+                "character": character_set_command_handler.bot_commands,
+                "campaign": campaign_set_command_handler.bot_commands,
+                "cache_clear": character_cache_clear_command_handler.bot_commands,
+                "help": [
+                    *help_command_handler.bot_commands,
+                    *(roll_panel_command_handler.bot_commands if roll_panel_command_handler is not None else []),
+                ],
+            }
+
+            def get_throttle_key(message: aiogram_types.Message) -> str:
+                # Throttle storages may be shared by bots, so keys are namespaced by bot
+                return f"{aiogram_bot.id}:{telegram_context.get_context_key_from_message(message)}"
+
+            aiogram_dispatcher.message.outer_middleware(
+                aiogram_utils.ThrottlingMiddleware(
+                    logger=logger,
+                    storage=throttle_storage,
+                    limits={
+                        "roll": aiogram_utils.ThrottleLimit(
+                            rate=throttling_settings.roll_rate_per_minute / 60,
+                            capacity=throttling_settings.roll_burst,
+                        ),
+                        "character": aiogram_utils.ThrottleLimit(
+                            rate=throttling_settings.character_rate_per_minute / 60,
+                            capacity=throttling_settings.character_burst,
+                        ),
+                        "campaign": aiogram_utils.ThrottleLimit(
+                            rate=throttling_settings.campaign_rate_per_minute / 60,
+                            capacity=throttling_settings.campaign_burst,
+                        ),
+                        "cache_clear": aiogram_utils.ThrottleLimit(
+                            rate=throttling_settings.cache_clear_rate_per_minute / 60,
+                            capacity=throttling_settings.cache_clear_burst,
+                        ),
+                        "help": aiogram_utils.ThrottleLimit(
+                            rate=throttling_settings.help_rate_per_minute / 60,
+                            capacity=throttling_settings.help_burst,
+                        ),
+                    },
+                    commands={
+                        bot_command.command: limit_name
+                        for limit_name, bot_commands in throttling_command_handlers.items()
+                        for bot_command in bot_commands
+                    },
+                    get_key=get_throttle_key,
+                    throttled_text=telegram_messages.THROTTLED if throttling_settings.answer_enabled else None,
+                ),
+            )
+
         aiogram_lifecycle = aiogram_utils.Lifecycle(
             dispatcher=aiogram_dispatcher,
             bot=aiogram_bot,
             logger=logger,
-            name=settings.telegram.bot_name,
-            description=settings.telegram.bot_description,
-            short_description=settings.telegram.bot_short_description,
+            name=telegram_settings.bot_name,
+            description=telegram_settings.bot_description,
+            short_description=telegram_settings.bot_short_description,
             commands=[
                 *aiogram_general_commands,
                 *aiogram_ability_check_commands,
@@ -232,83 +500,95 @@ class Application:
             ],
             webhook=(
                 aiogram_utils.Lifecycle.Webhook(
-                    url=f"{settings.server.public_host}{settings.telegram.webhook_url}",
-                    secret_token=settings.telegram.webhook_secret_token,
+                    url=f"{settings.server.public_host}{telegram_settings.webhook_url}",
+                    secret_token=telegram_settings.webhook_secret_token,
+                    max_connections=telegram_settings.webhook_max_connections,
                 )
-                if settings.telegram.webhook_enabled
+                if telegram_settings.webhook_enabled
                 else None
             ),
+            setup_lock=app_factories.create_setup_lock(
+                settings=telegram_settings.setup_lock,
+                bot_id=aiogram_bot.id,
+                redis_clients=redis_clients,
+            ),
         )
-        lifecycle_startup_callbacks.extend(aiogram_lifecycle.get_startup_callbacks())
+        if worker_index == 0:
+            lifecycle_startup_callbacks.extend(aiogram_lifecycle.get_startup_callbacks())
         lifecycle_shutdown_callbacks.extend(aiogram_lifecycle.get_shutdown_callbacks())
-        if not settings.telegram.webhook_enabled:
-            lifecycle_main_tasks.append(aiogram_lifecycle.get_main_task())
-
-        logger.info("Initializing aiohttp")
-
-        aiohttp_url_dispatcher = aiohttp_web.UrlDispatcher()
-
-        logger.info("Initializing aiohttp middlewares")
-
-        aiohttp_middlewares: list[aiohttp_typedefs.Middleware] = []
-
-        logger.info("Initializing aiohttp handlers")
-
-        aiohttp_liveness_probe_handler = aiohttp_utils.LivenessProbeHandler()
-        aiohttp_url_dispatcher.add_route("GET", "/api/v1/health/liveness", aiohttp_liveness_probe_handler.process)
-
-        aiohttp_readiness_probe_handler = aiohttp_utils.ReadinessProbeHandler(
-            subsystems=[],
-        )
-        aiohttp_url_dispatcher.add_route("GET", "/api/v1/health/readiness", aiohttp_readiness_probe_handler.process)
+        if not telegram_settings.webhook_enabled:
+            aiogram_polling = aiogram_utils.ShardedPolling(
+                logger=logger,
+                bot=aiogram_bot,
+                dispatcher=aiogram_dispatcher,
+                workers_count=telegram_settings.polling_workers,
+                shard_queue_size=telegram_settings.polling_shard_queue_size,
+                allowed_updates=aiogram_dispatcher.resolve_used_update_types(),
+            )
+            lifecycle_main_tasks.extend(aiogram_polling.get_main_tasks())
+            lifecycle_drain_callbacks.append(
+                lifecycle_utils.Callback(
+                    awaitable=aiogram_polling.drain(),
+                    error_message="Failed to drain telegram polling",
+                    success_message="Telegram polling has been drained",
+                ),
+            )
 
-        if settings.telegram.webhook_enabled:
-            aiohttp_telegram_webhook_handler = aiogram_aiohttp_webhook.SimpleRequestHandler(
+        if telegram_settings.webhook_enabled:
+            aiohttp_telegram_webhook_handler = aiogram_utils.QueuedWebhookHandler(
+                logger=logger,
                 bot=aiogram_bot,
                 dispatcher=aiogram_dispatcher,
-                secret_token=settings.telegram.webhook_secret_token,
+                secret_token=telegram_settings.webhook_secret_token,
+                max_size=telegram_settings.webhook_queue_max_size,
+                workers_count=telegram_settings.webhook_workers,
+                overflow_policy=aiogram_utils.QueuedWebhookHandler.OverflowPolicy(
+                    telegram_settings.webhook_queue_overflow_policy
+                ),
+                overflow_timeout_seconds=telegram_settings.webhook_queue_overflow_timeout_seconds,
+                response_timeout_seconds=(
+                    telegram_settings.webhook_response_timeout_seconds
+                    if telegram_settings.webhook_reply_in_response_enabled
+                    else None
+                ),
+                update_prefilter=(
+                    aiogram_utils.CommandUpdatePrefilter(
+                        commands=frozenset(command.command for command in aiogram_lifecycle.commands),
+                    )
+                    if telegram_settings.webhook_prefilter_enabled
+                    else None
+                ),
+                deduplicator=app_factories.create_update_deduplicator(
+                    settings=telegram_settings.update_dedup,
+                    bot_id=aiogram_bot.id,
+                    redis_clients=redis_clients,
+                ),
+            )
+            lifecycle_main_tasks.extend(aiohttp_telegram_webhook_handler.get_main_tasks())
+            lifecycle_drain_callbacks.append(
+                lifecycle_utils.Callback(
+                    awaitable=aiohttp_telegram_webhook_handler.drain(),
+                    error_message="Failed to drain telegram webhook queue",
+                    success_message="Telegram webhook queue has been drained",
+                ),
             )
             aiohttp_url_dispatcher.add_route(
                 "POST",
-                settings.telegram.webhook_url,
+                telegram_settings.webhook_url,
                 aiohttp_telegram_webhook_handler.handle,
             )
-
-        logger.info("Initializing aiohttp application")
-
-        aiohttp_app = aiohttp_web.Application(
-            middlewares=aiohttp_middlewares,
-            router=aiohttp_url_dispatcher,
-        )
-        lifecycle_main_tasks.append(
-            asyncio.create_task(
-                coro=aiohttp_web._run_app(  # pyright: ignore[reportPrivateUsage]
-                    app=aiohttp_app,
-                    host=settings.server.host,
-                    port=settings.server.port,
-                    print=aiohttp_utils.PrintLogger(),
+            aiohttp_url_dispatcher.add_route(
+                "GET",
+                # The first bot keeps the single bot path
+                (
+                    "/api/v1/metrics/telegram/webhook"
+                    if bot_index == 0
+                    else f"/api/v1/metrics/telegram/webhook/{bot_index}"
                 ),
-                name="aiohttp_app",
+                aiohttp_telegram_webhook_handler.process_metrics,
             )
-        )
-
-        logger.info("Initializing lifecycle manager")
-
-        lifecycle = lifecycle_utils.Lifecycle(
-            logger=logger,
-            main_tasks=lifecycle_main_tasks,
-            startup_callbacks=lifecycle_startup_callbacks,
-            shutdown_callbacks=list(reversed(lifecycle_shutdown_callbacks)),
-        )
 
-        logger.info("Creating application")
-        application = cls(
-            lifecycle=lifecycle,
-        )
-
-        logger.info("Initializing application finished")
-
-        return application
+        return roll_reply_coalescer
 
     async def start(self) -> None:
         try:
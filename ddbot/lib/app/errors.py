@@ -15,6 +15,10 @@ class ServerStartError(ApplicationError):
     pass
 
 
+class RederiveError(ApplicationError):
+    pass
+
+
 class ServerRuntimeError(ApplicationError):
     pass
 
@@ -22,6 +26,7 @@ class ServerRuntimeError(ApplicationError):
 __all__ = [
     "ApplicationError",
     "DisposeError",
+    "RederiveError",
     "ServerRuntimeError",
     "ServerStartError",
 ]
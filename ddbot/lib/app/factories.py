@@ -0,0 +1,166 @@
+import dataclasses
+import logging
+import pathlib
+
+import redis.asyncio as redis_asyncio
+
+import lib.app.settings as app_settings
+import lib.character.archives as character_archives
+import lib.character.protocols as character_protocols
+import lib.utils.aiogram as aiogram_utils
+import lib.utils.lifecycle as lifecycle_utils
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class RedisClients:
+    """
+    Shares one client, and its connection pool, between all components and bots using the same redis database.
+    """
+
+    shutdown_callbacks: list[lifecycle_utils.Callback]
+
+    _clients: dict[tuple[str, int, int, str], redis_asyncio.Redis] = dataclasses.field(
+        init=False,
+        default_factory=dict,
+    )
+
+    def get(self, host: str, port: int, db: int, password: str) -> redis_asyncio.Redis:
+        key = (host, port, db, password)
+
+        client = self._clients.get(key)
+        if client is None:
+            logger.info("Creating redis client for %s:%s/%s", host, port, db)
+            client = redis_asyncio.Redis(host=host, port=port, db=db, password=password)
+            self._clients[key] = client
+            self.shutdown_callbacks.append(
+                lifecycle_utils.Callback(
+                    awaitable=client.aclose(),
+                    error_message=f"Error while closing redis client for {host}:{port}/{db}",
+                    success_message=f"Redis client for {host}:{port}/{db} has been closed",
+                ),
+            )
+
+        return client
+
+
+def create_character_archive(
+    settings: app_settings.BaseCharacterArchiveSettings,
+    redis_clients: RedisClients,
+) -> character_protocols.CharacterArchiveProtocol | None:
+    if isinstance(settings, app_settings.NoCharacterArchiveSettings):
+        logger.info("Character archive is disabled")
+        return None
+
+    if isinstance(settings, app_settings.LocalCharacterArchiveSettings):
+        logger.info("Using local character archive")
+        return character_archives.LocalCharacterArchive(path=pathlib.Path(settings.path))
+
+    if isinstance(settings, app_settings.RedisCharacterArchiveSettings):
+        logger.info("Using redis character archive")
+        archive_redis_client = redis_clients.get(
+            host=settings.host,
+            port=settings.port,
+            db=settings.db,
+            password=settings.password,
+        )
+        return character_archives.RedisCharacterArchive(redis_client=archive_redis_client)
+
+    raise ValueError(f"Unknown character archive type: {settings.type}")
+
+
+def create_update_deduplicator(
+    settings: app_settings.BaseUpdateDedupSettings,
+    bot_id: int,
+    redis_clients: RedisClients,
+) -> aiogram_utils.UpdateDeduplicatorProtocol:
+    local_deduplicator = aiogram_utils.LocalUpdateDeduplicator(window_size=settings.window_size)
+
+    if isinstance(settings, app_settings.LocalUpdateDedupSettings):
+        logger.info("Using local telegram update deduplicator")
+        return local_deduplicator
+
+    if isinstance(settings, app_settings.RedisUpdateDedupSettings):
+        logger.info("Using redis telegram update deduplicator")
+        update_dedup_redis_client = redis_clients.get(
+            host=settings.host,
+            port=settings.port,
+            db=settings.db,
+            password=settings.password,
+        )
+        return aiogram_utils.RedisUpdateDeduplicator(
+            logger=logger,
+            redis_client=update_dedup_redis_client,
+            bot_id=bot_id,
+            ttl_seconds=settings.ttl_seconds,
+            local=local_deduplicator,
+        )
+
+    raise ValueError(f"Unknown update dedup type: {settings.type}")
+
+
+def create_throttle_storage(
+    settings: app_settings.BaseThrottlingSettings,
+    redis_clients: RedisClients,
+) -> aiogram_utils.ThrottleStorageProtocol | None:
+    if isinstance(settings, app_settings.NoThrottlingSettings):
+        logger.info("Telegram throttling is disabled")
+        return None
+
+    if isinstance(settings, app_settings.LocalThrottlingSettings):
+        logger.info("Using local telegram throttle storage")
+        return aiogram_utils.LocalThrottleStorage()
+
+    if isinstance(settings, app_settings.RedisThrottlingSettings):
+        logger.info("Using redis telegram throttle storage")
+        throttling_redis_client = redis_clients.get(
+            host=settings.host,
+            port=settings.port,
+            db=settings.db,
+            password=settings.password,
+        )
+        return aiogram_utils.RedisThrottleStorage(logger=logger, redis_client=throttling_redis_client)
+
+    raise ValueError(f"Unknown throttling type: {settings.type}")
+
+
+def create_setup_lock(
+    settings: app_settings.BaseSetupLockSettings,
+    bot_id: int,
+    redis_clients: RedisClients,
+) -> aiogram_utils.SetupLockProtocol | None:
+    if isinstance(settings, app_settings.NoSetupLockSettings):
+        logger.info("Telegram setup lock is disabled")
+        return None
+
+    if isinstance(settings, app_settings.LocalSetupLockSettings):
+        logger.info("Using local telegram setup lock")
+        return aiogram_utils.LocalSetupLock(logger=logger, path=pathlib.Path(settings.path), bot_id=bot_id)
+
+    if isinstance(settings, app_settings.RedisSetupLockSettings):
+        logger.info("Using redis telegram setup lock")
+        setup_lock_redis_client = redis_clients.get(
+            host=settings.host,
+            port=settings.port,
+            db=settings.db,
+            password=settings.password,
+        )
+        return aiogram_utils.RedisSetupLock(
+            logger=logger,
+            redis_client=setup_lock_redis_client,
+            bot_id=bot_id,
+            lease_seconds=settings.lease_seconds,
+            done_ttl_seconds=settings.done_ttl_seconds,
+        )
+
+    raise ValueError(f"Unknown setup lock type: {settings.type}")
+
+
+__all__ = [
+    "RedisClients",
+    "create_character_archive",
+    "create_setup_lock",
+    "create_throttle_storage",
+    "create_update_deduplicator",
+]
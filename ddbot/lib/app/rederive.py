@@ -0,0 +1,82 @@
+import dataclasses
+import logging
+import typing
+
+import lib.app.errors as app_errors
+import lib.app.factories as app_factories
+import lib.app.settings as app_settings
+import lib.character.clients as character_clients
+import lib.character.services as character_services
+import lib.utils.lifecycle as lifecycle_utils
+import lib.utils.logging as logging_utils
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True)
+class RederiveApplication:
+    lifecycle: lifecycle_utils.Lifecycle
+    rederive_service: character_services.CharacterRederiveService
+
+    @classmethod
+    def from_settings(cls, settings: app_settings.Settings) -> typing.Self:
+        log_level = "DEBUG" if settings.app.is_debug else settings.logs.level
+        logging_config = logging_utils.create_config(
+            log_level=log_level,
+            log_format=settings.logs.format,
+        )
+        logging_utils.initialize(config=logging_config)
+        logger.info("Logging has been initialized with config: %s", logging_config)
+
+        logger.info("Initializing rederive application")
+
+        lifecycle_shutdown_callbacks: list[lifecycle_utils.Callback] = []
+        redis_clients = app_factories.RedisClients(shutdown_callbacks=lifecycle_shutdown_callbacks)
+
+        character_archive = app_factories.create_character_archive(
+            settings=settings.character.archive,
+            redis_clients=redis_clients,
+        )
+        if character_archive is None:
+            raise ValueError("Character archive is not configured")
+
+        rederive_service = character_services.CharacterRederiveService(
+            archive=character_archive,
+            derive=character_clients.derive_characters,
+            max_workers=settings.character.rederive_max_workers,
+        )
+
+        lifecycle = lifecycle_utils.Lifecycle(
+            logger=logger,
+            shutdown_callbacks=list(reversed(lifecycle_shutdown_callbacks)),
+        )
+
+        logger.info("Initializing rederive application finished")
+
+        return cls(
+            lifecycle=lifecycle,
+            rederive_service=rederive_service,
+        )
+
+    async def start(self) -> None:
+        try:
+            result = await self.rederive_service.rederive_all()
+        except Exception as unexpected_error:
+            logger.exception("Rederive runtime error")
+            raise app_errors.RederiveError("Rederive runtime error") from unexpected_error
+
+        if len(result.failed_entity_ids) != 0:
+            logger.error("Failed to rederive characters: %s", result.failed_entity_ids)
+            raise app_errors.RederiveError("Failed to rederive some characters, see logs above")
+
+    async def dispose(self) -> None:
+        try:
+            await self.lifecycle.on_shutdown()
+        except lifecycle_utils.Lifecycle.ShutdownError as dispose_error:
+            logger.error("Rederive application has shut down with errors")
+            raise app_errors.DisposeError("Rederive application has shut down with errors") from dispose_error
+
+
+__all__ = [
+    "RederiveApplication",
+]
@@ -34,6 +34,139 @@ class ServerSettings(pydantic_utils.BaseSettingsModel):
     host: str = "localhost"
     port: int = 8080
     public_host: str = NotImplemented
+    workers: int = pydantic.Field(default=1, ge=1)
+    drain_timeout_seconds: float = 30
+
+
+class BaseUpdateDedupSettings(pydantic_utils.BaseSettingsModel):
+    type: typing.Any
+    window_size: int = 10_000
+
+
+class LocalUpdateDedupSettings(BaseUpdateDedupSettings):
+    type: typing.Literal["local"] = "local"
+
+
+class RedisUpdateDedupSettings(BaseUpdateDedupSettings):
+    type: typing.Literal["redis"] = "redis"
+    host: str = NotImplemented
+    port: int = NotImplemented
+    password: str = NotImplemented
+    db: int = 0
+    ttl_seconds: int = 60 * 60
+
+
+UPDATE_DEDUP_SETTINGS = {
+    "local": LocalUpdateDedupSettings,
+    "redis": RedisUpdateDedupSettings,
+}
+
+
+def _update_dedup_settings_factory(data: typing.Any) -> BaseUpdateDedupSettings:
+    if isinstance(data, BaseUpdateDedupSettings):
+        return data
+
+    assert isinstance(data, dict), "UpdateDedupSettings must be a dict"
+    assert "type" in data, "UpdateDedupSettings must have a 'type' key"
+    assert data["type"] in UPDATE_DEDUP_SETTINGS, f"Unknown update dedup type: {data['type']}"
+
+    settings_class = UPDATE_DEDUP_SETTINGS[data["type"]]
+
+    return settings_class.model_validate(data)
+
+
+class BaseThrottlingSettings(pydantic_utils.BaseSettingsModel):
+    type: typing.Any
+    answer_enabled: bool = True
+    roll_rate_per_minute: float = 30
+    roll_burst: int = 5
+    character_rate_per_minute: float = 6
+    character_burst: int = 3
+    campaign_rate_per_minute: float = 1
+    campaign_burst: int = 2
+    cache_clear_rate_per_minute: float = 2
+    cache_clear_burst: int = 2
+    help_rate_per_minute: float = 6
+    help_burst: int = 3
+
+
+class NoThrottlingSettings(BaseThrottlingSettings):
+    type: typing.Literal["none"] = "none"
+
+
+class LocalThrottlingSettings(BaseThrottlingSettings):
+    type: typing.Literal["local"] = "local"
+
+
+class RedisThrottlingSettings(BaseThrottlingSettings):
+    type: typing.Literal["redis"] = "redis"
+    host: str = NotImplemented
+    port: int = NotImplemented
+    password: str = NotImplemented
+    db: int = 0
+
+
+THROTTLING_SETTINGS = {
+    "none": NoThrottlingSettings,
+    "local": LocalThrottlingSettings,
+    "redis": RedisThrottlingSettings,
+}
+
+
+def _throttling_settings_factory(data: typing.Any) -> BaseThrottlingSettings:
+    if isinstance(data, BaseThrottlingSettings):
+        return data
+
+    assert isinstance(data, dict), "ThrottlingSettings must be a dict"
+    assert "type" in data, "ThrottlingSettings must have a 'type' key"
+    assert data["type"] in THROTTLING_SETTINGS, f"Unknown throttling type: {data['type']}"
+
+    settings_class = THROTTLING_SETTINGS[data["type"]]
+
+    return settings_class.model_validate(data)
+
+
+class BaseSetupLockSettings(pydantic_utils.BaseSettingsModel):
+    type: typing.Any
+
+
+class NoSetupLockSettings(BaseSetupLockSettings):
+    type: typing.Literal["none"] = "none"
+
+
+class LocalSetupLockSettings(BaseSetupLockSettings):
+    type: typing.Literal["local"] = "local"
+    path: str = NotImplemented
+
+
+class RedisSetupLockSettings(BaseSetupLockSettings):
+    type: typing.Literal["redis"] = "redis"
+    host: str = NotImplemented
+    port: int = NotImplemented
+    password: str = NotImplemented
+    db: int = 0
+    lease_seconds: int = 60
+    done_ttl_seconds: int = 24 * 60 * 60
+
+
+SETUP_LOCK_SETTINGS = {
+    "none": NoSetupLockSettings,
+    "local": LocalSetupLockSettings,
+    "redis": RedisSetupLockSettings,
+}
+
+
+def _setup_lock_settings_factory(data: typing.Any) -> BaseSetupLockSettings:
+    if isinstance(data, BaseSetupLockSettings):
+        return data
+
+    assert isinstance(data, dict), "SetupLockSettings must be a dict"
+    assert "type" in data, "SetupLockSettings must have a 'type' key"
+    assert data["type"] in SETUP_LOCK_SETTINGS, f"Unknown setup lock type: {data['type']}"
+
+    settings_class = SETUP_LOCK_SETTINGS[data["type"]]
+
+    return settings_class.model_validate(data)
 
 
 class TelegramSettings(pydantic_utils.BaseSettingsModel):
@@ -43,10 +176,55 @@ class TelegramSettings(pydantic_utils.BaseSettingsModel):
     bot_description: str = "Telegram bot for rolling dices using DnD Beyond character sheets"
     help_message_template: str = help_command.DEFAULT_HELP_MESSAGE_TEMPLATE
     help_message_escape_characters: str = "_-."
+    setup_lock: typing.Annotated[
+        BaseSetupLockSettings,
+        pydantic.BeforeValidator(_setup_lock_settings_factory),
+    ] = pydantic.Field(default_factory=NoSetupLockSettings)
+
+    api_base_url: str | None = None
+    api_local_mode: bool = False
+    session_connection_limit: int = 100
+    session_keepalive_timeout_seconds: float = 60
+    session_timeout_seconds: float = 60
+
+    polling_workers: int = 8
+    polling_shard_queue_size: int = 100
 
     webhook_enabled: bool = True
     webhook_url: str = "/api/v1/telegram/webhook"
     webhook_secret_token: str = NotImplemented
+    webhook_max_connections: int = 40
+    webhook_queue_max_size: int = 1000
+    webhook_queue_overflow_policy: typing.Literal["reject", "wait"] = "reject"
+    webhook_queue_overflow_timeout_seconds: float = 5
+    webhook_workers: int = 16
+    webhook_reply_in_response_enabled: bool = False
+    webhook_response_timeout_seconds: float = 1
+    webhook_prefilter_enabled: bool = True
+    update_dedup: typing.Annotated[
+        BaseUpdateDedupSettings,
+        pydantic.BeforeValidator(_update_dedup_settings_factory),
+    ] = pydantic.Field(default_factory=LocalUpdateDedupSettings)
+    throttling: typing.Annotated[
+        BaseThrottlingSettings,
+        pydantic.BeforeValidator(_throttling_settings_factory),
+    ] = pydantic.Field(default_factory=LocalThrottlingSettings)
+
+    roll_panel_enabled: bool = True
+    roll_panel_row_width: int = 2
+
+    inline_query_enabled: bool = True
+    inline_query_cache_time_seconds: int = 300
+
+    roll_reply_coalescing_enabled: bool = False
+    roll_reply_coalescing_window_seconds: float = 0.3
+
+    outbound_rate_limit_enabled: bool = True
+    outbound_global_rate_per_second: float = 30
+    outbound_private_chat_rate_per_second: float = 1
+    outbound_group_chat_rate_per_minute: float = 20
+    outbound_chat_burst: int = 3
+    outbound_max_retries: int = 3
 
 
 class BaseContextRepositorySettings(pydantic_utils.BaseSettingsModel):
@@ -84,8 +262,77 @@ def _context_repository_settings_factory(data: typing.Any) -> BaseContextReposit
     return settings_class.model_validate(data)
 
 
+class BaseCharacterArchiveSettings(pydantic_utils.BaseSettingsModel):
+    type: typing.Any
+
+
+class NoCharacterArchiveSettings(BaseCharacterArchiveSettings):
+    type: typing.Literal["none"] = "none"
+
+
+class LocalCharacterArchiveSettings(BaseCharacterArchiveSettings):
+    type: typing.Literal["local"] = "local"
+    path: str = NotImplemented
+
+
+class RedisCharacterArchiveSettings(BaseCharacterArchiveSettings):
+    type: typing.Literal["redis"] = "redis"
+    host: str = NotImplemented
+    port: int = NotImplemented
+    password: str = NotImplemented
+    db: int = 0
+
+
+CHARACTER_ARCHIVE_SETTINGS = {
+    "none": NoCharacterArchiveSettings,
+    "local": LocalCharacterArchiveSettings,
+    "redis": RedisCharacterArchiveSettings,
+}
+
+
+def _character_archive_settings_factory(data: typing.Any) -> BaseCharacterArchiveSettings:
+    if isinstance(data, BaseCharacterArchiveSettings):
+        return data
+
+    assert isinstance(data, dict), "CharacterArchiveSettings must be a dict"
+    assert "type" in data, "CharacterArchiveSettings must have a 'type' key"
+    assert data["type"] in CHARACTER_ARCHIVE_SETTINGS, f"Unknown character archive type: {data['type']}"
+
+    settings_class = CHARACTER_ARCHIVE_SETTINGS[data["type"]]
+
+    return settings_class.model_validate(data)
+
+
 class CharacterSettings(pydantic_utils.BaseSettingsModel):
+    archive: typing.Annotated[
+        BaseCharacterArchiveSettings,
+        pydantic.BeforeValidator(_character_archive_settings_factory),
+    ] = pydantic.Field(default_factory=NoCharacterArchiveSettings)
+    archive_warmup_enabled: bool = True
+    archive_warmup_max_characters: int = 1000
+    rederive_max_workers: int | None = None
+
+    ddb_base_url: str = "https://character-service.dndbeyond.com"
+    ddb_campaign_base_url: str = "https://www.dndbeyond.com"
+    ddb_max_concurrency: int = 8
+    ddb_max_response_bytes: int = 16 * 1024 * 1024
+    ddb_rate_limit_per_second: float = 5.0
+    ddb_rate_limit_burst: int = 10
+
     cache_ttl_seconds: int = 60 * 60
+    cache_adaptive_ttl_enabled: bool = False
+    cache_min_ttl_seconds: int = 5 * 60
+    cache_max_ttl_seconds: int = 24 * 60 * 60
+    cache_ttl_growth_factor: float = pydantic.Field(default=2.0, ge=1)
+
+    @pydantic.model_validator(mode="after")
+    def validate_cache_ttl(self) -> typing.Self:
+        if self.cache_adaptive_ttl_enabled and not (
+            self.cache_min_ttl_seconds <= self.cache_ttl_seconds <= self.cache_max_ttl_seconds
+        ):
+            raise ValueError("Character cache ttl must be between min and max ttl")
+
+        return self
 
 
 class Settings(pydantic_utils.BaseSettings):
@@ -93,12 +340,29 @@ class Settings(pydantic_utils.BaseSettings):
     logs: LoggingSettings = pydantic.Field(default_factory=LoggingSettings)
     server: ServerSettings = pydantic.Field(default_factory=ServerSettings)
     telegram: TelegramSettings = pydantic.Field(default_factory=TelegramSettings)
+    extra_telegram_bots: list[TelegramSettings] = pydantic.Field(default_factory=list)
     context: typing.Annotated[
         BaseContextRepositorySettings,
         pydantic.BeforeValidator(_context_repository_settings_factory),
     ] = pydantic.Field(default_factory=LocalContextRepositorySettings)
     character: CharacterSettings = pydantic.Field(default_factory=CharacterSettings)
 
+    @property
+    def telegram_bots(self) -> list[TelegramSettings]:
+        return [self.telegram, *self.extra_telegram_bots]
+
+    @pydantic.model_validator(mode="after")
+    def validate_telegram_bots(self) -> typing.Self:
+        tokens = [bot.token for bot in self.telegram_bots]
+        if len(set(tokens)) != len(tokens):
+            raise ValueError("Telegram bot tokens must be unique")
+
+        webhook_urls = [bot.webhook_url for bot in self.telegram_bots if bot.webhook_enabled]
+        if len(set(webhook_urls)) != len(webhook_urls):
+            raise ValueError("Telegram bot webhook urls must be unique")
+
+        return self
+
 
 __all__ = [
     "Settings",
@@ -0,0 +1,113 @@
+import dataclasses
+import logging
+import multiprocessing
+import multiprocessing.connection
+import multiprocessing.process
+import os
+import signal
+import typing
+
+import lib.app.errors as app_errors
+import lib.app.settings as app_settings
+import lib.utils.logging as logging_utils
+
+logger = logging.getLogger(__name__)
+
+WorkerTarget = typing.Callable[[int], None]
+
+
+def _run_worker(worker_target: WorkerTarget, worker_index: int) -> None:
+    # Interrupts are handled by the supervisor, workers are stopped with SIGTERM
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    worker_target(worker_index)
+
+
+@dataclasses.dataclass(frozen=True)
+class Supervisor:
+    """
+    Forks worker processes serving the same port with SO_REUSEPORT and stops all of them
+    as soon as one exits. Worker 0 is the only one running one-time startup work.
+    """
+
+    workers_count: int
+    worker_target: WorkerTarget
+    shutdown_timeout_seconds: float = 30
+
+    @classmethod
+    def from_settings(cls, settings: app_settings.Settings, worker_target: WorkerTarget) -> typing.Self:
+        log_level = "DEBUG" if settings.app.is_debug else settings.logs.level
+        logging_config = logging_utils.create_config(
+            log_level=log_level,
+            log_format=settings.logs.format,
+        )
+        logging_utils.initialize(config=logging_config)
+        logger.info("Logging has been initialized with config: %s", logging_config)
+
+        if settings.server.workers < 1:
+            raise app_errors.ServerStartError("Server requires at least one worker")
+        if not all(telegram_settings.webhook_enabled for telegram_settings in settings.telegram_bots):
+            raise app_errors.ServerStartError("Multiple workers require telegram webhook to be enabled")
+        if isinstance(settings.context, app_settings.LocalContextRepositorySettings):
+            raise app_errors.ServerStartError("Multiple workers require a shared context repository")
+        for telegram_settings in settings.telegram_bots:
+            if isinstance(telegram_settings.update_dedup, app_settings.LocalUpdateDedupSettings):
+                raise app_errors.ServerStartError("Multiple workers require a shared update deduplication")
+            if isinstance(telegram_settings.throttling, app_settings.LocalThrottlingSettings):
+                raise app_errors.ServerStartError("Multiple workers require a shared or disabled throttling")
+
+        return cls(
+            workers_count=settings.server.workers,
+            worker_target=worker_target,
+            # Leave workers time to close connections after draining
+            shutdown_timeout_seconds=settings.server.drain_timeout_seconds + 10,
+        )
+
+    def _stop(self, processes: list[multiprocessing.process.BaseProcess]) -> None:
+        for process in processes:
+            if process.is_alive():
+                assert process.pid is not None
+                os.kill(process.pid, signal.SIGTERM)
+
+        for process in processes:
+            process.join(self.shutdown_timeout_seconds)
+            if process.is_alive():
+                logger.error("Worker %s has not stopped in time, killing it", process.name)
+                process.kill()
+                process.join()
+
+    def run(self) -> None:
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+        context = multiprocessing.get_context("fork")
+        processes: list[multiprocessing.process.BaseProcess] = []
+
+        try:
+            for worker_index in range(self.workers_count):
+                process = context.Process(
+                    target=_run_worker,
+                    args=(self.worker_target, worker_index),
+                    name=f"worker_{worker_index}",
+                )
+                process.start()
+                processes.append(process)
+                logger.info("Worker %s has been started with pid %s", process.name, process.pid)
+
+            multiprocessing.connection.wait([process.sentinel for process in processes])
+        except KeyboardInterrupt:
+            logger.info("Supervisor has been interrupted, stopping workers")
+            self._stop(processes)
+            return
+
+        for process in processes:
+            if not process.is_alive():
+                logger.error("Worker %s has exited with code %s", process.name, process.exitcode)
+
+        self._stop(processes)
+        raise app_errors.ServerRuntimeError("One of the workers has unexpectedly exited")
+
+
+__all__ = [
+    "Supervisor",
+]
@@ -0,0 +1,2 @@
+from .local import *
+from .redis import *
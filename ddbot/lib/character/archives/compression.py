@@ -0,0 +1,20 @@
+import typing
+import zlib
+
+import lib.utils.json as json_utils
+
+COMPRESSION_LEVEL = 6
+
+
+def compress_raw_data(raw_data: dict[str, typing.Any]) -> bytes:
+    return zlib.compress(json_utils.dumps_bytes(raw_data), COMPRESSION_LEVEL)
+
+
+def decompress_raw_data(data: bytes) -> dict[str, typing.Any]:
+    return json_utils.loads_bytes(zlib.decompress(data))
+
+
+__all__ = [
+    "compress_raw_data",
+    "decompress_raw_data",
+]
@@ -0,0 +1,64 @@
+import asyncio
+import dataclasses
+import logging
+import os
+import pathlib
+import typing
+
+import lib.character.archives.compression as compression
+import lib.character.protocols as protocols
+
+logger = logging.getLogger(__name__)
+
+FILE_SUFFIX = ".json.zlib"
+
+
+@dataclasses.dataclass
+class LocalCharacterArchive(protocols.CharacterArchiveProtocol):
+    path: pathlib.Path
+
+    def _get_file_path(self, entity_id: int) -> pathlib.Path:
+        return self.path / f"{entity_id}{FILE_SUFFIX}"
+
+    def _read(self, entity_id: int) -> dict[str, typing.Any]:
+        file_path = self._get_file_path(entity_id)
+        try:
+            data = file_path.read_bytes()
+        except FileNotFoundError:
+            raise protocols.CharacterArchiveProtocol.NotFoundError
+
+        return compression.decompress_raw_data(data)
+
+    def _write(self, entity_id: int, raw_data: dict[str, typing.Any]) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        file_path = self._get_file_path(entity_id)
+        temp_file_path = file_path.with_name(f".{file_path.name}.tmp")
+        temp_file_path.write_bytes(compression.compress_raw_data(raw_data))
+        os.replace(temp_file_path, file_path)
+
+    def _list(self) -> list[int]:
+        if not self.path.exists():
+            return []
+
+        return [
+            int(file_path.name.removesuffix(FILE_SUFFIX))
+            for file_path in self.path.glob(f"*{FILE_SUFFIX}")
+            if not file_path.name.startswith(".")
+        ]
+
+    async def get(self, entity_id: int) -> dict[str, typing.Any]:
+        logger.debug("LocalCharacterArchive.get: %s", entity_id)
+        return await asyncio.to_thread(self._read, entity_id)
+
+    async def set(self, entity_id: int, raw_data: dict[str, typing.Any]) -> None:
+        logger.debug("LocalCharacterArchive.set: %s", entity_id)
+        await asyncio.to_thread(self._write, entity_id, raw_data)
+
+    async def get_entity_ids(self) -> list[int]:
+        return await asyncio.to_thread(self._list)
+
+
+__all__ = [
+    "LocalCharacterArchive",
+]
@@ -0,0 +1,47 @@
+import dataclasses
+import logging
+import typing
+
+import redis.asyncio as redis_asyncio
+
+import lib.character.archives.compression as compression
+import lib.character.protocols as protocols
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "character_archive:"
+
+
+@dataclasses.dataclass
+class RedisCharacterArchive(protocols.CharacterArchiveProtocol):
+    redis_client: redis_asyncio.Redis
+
+    @staticmethod
+    def _get_full_key(entity_id: int) -> str:
+        return f"{KEY_PREFIX}{entity_id}"
+
+    async def get(self, entity_id: int) -> dict[str, typing.Any]:
+        full_key = self._get_full_key(entity_id)
+        data = await self.redis_client.get(full_key)
+        if data is None:
+            raise protocols.CharacterArchiveProtocol.NotFoundError
+
+        return compression.decompress_raw_data(data)
+
+    async def set(self, entity_id: int, raw_data: dict[str, typing.Any]) -> None:
+        full_key = self._get_full_key(entity_id)
+        await self.redis_client.set(full_key, compression.compress_raw_data(raw_data))
+
+    async def get_entity_ids(self) -> list[int]:
+        result: list[int] = []
+
+        async for raw_key in self.redis_client.scan_iter(match=f"{KEY_PREFIX}*"):
+            key = raw_key.decode() if isinstance(raw_key, bytes) else raw_key
+            result.append(int(key.removeprefix(KEY_PREFIX)))
+
+        return result
+
+
+__all__ = [
+    "RedisCharacterArchive",
+]
@@ -1,5 +1,8 @@
-from .ddb import CharacterDdbClient
+from .ddb import CharacterDdbClient, derive_character
+from .ddb_batch import derive_characters
 
 __all__ = [
     "CharacterDdbClient",
+    "derive_character",
+    "derive_characters",
 ]
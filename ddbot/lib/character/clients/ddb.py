@@ -1,3 +1,4 @@
+import asyncio
 import copy
 import dataclasses
 import enum
@@ -6,10 +7,13 @@ import logging
 import typing
 
 import aiohttp
+import orjson
 import pydantic
 
 import lib.character.models as models
 import lib.character.protocols as protocols
+import lib.utils.json as json_utils
+import lib.utils.rate_limit as rate_limit_utils
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +25,18 @@ class Response(pydantic.BaseModel):
     raw_data: dict[str, typing.Any] = pydantic.Field(alias="data")
 
 
+class CampaignCharacterData(pydantic.BaseModel):
+    id: int
+    name: str
+    user_name: str = pydantic.Field(alias="userName")
+
+
+class CampaignResponse(pydantic.BaseModel):
+    success: bool
+    message: str
+    raw_data: list[CampaignCharacterData] | dict[str, typing.Any] = pydantic.Field(alias="data")
+
+
 class ErrorData(pydantic.BaseModel):
     server_message: str = pydantic.Field(alias="serverMessage")
     error_code: str = pydantic.Field(alias="errorCode")
@@ -348,7 +364,7 @@ class CharacterData(pydantic.BaseModel):
         return 0
 
     def to_dataclass(self) -> models.Character:
-        return models.Character(
+        return models.Character.from_mappings(
             id=self.id,
             name=self.name,
             abilities=self._get_abilities(),
@@ -359,50 +375,148 @@ class CharacterData(pydantic.BaseModel):
         )
 
 
+def derive_character(raw_data: dict[str, typing.Any]) -> models.Character:
+    """
+    :raises CharacterRepositoryProtocol.ResponseParseError
+    """
+    try:
+        data = CharacterData(**raw_data)
+    except pydantic.ValidationError as e:
+        logger.error("Failed to parse character: %s", raw_data)
+        raise protocols.CharacterRepositoryProtocol.ResponseParseError from e
+
+    try:
+        return data.to_dataclass()
+    except data.ToDataclassError as e:
+        logger.error("Failed to convert to dataclass: %s", data)
+        raise protocols.CharacterRepositoryProtocol.ResponseParseError from e
+
+
 @dataclasses.dataclass(frozen=True)
 class CharacterDdbClient(protocols.CharacterRepositoryProtocol):
     base_client: aiohttp.ClientSession
+    archive: protocols.CharacterArchiveProtocol | None = None
+    base_url: str = "https://character-service.dndbeyond.com"
+    campaign_base_url: str = "https://www.dndbeyond.com"
+    max_concurrency: int = 8
+    max_response_bytes: int = 16 * 1024 * 1024
+    rate_limiter: rate_limit_utils.TokenBucket | None = None
+    _semaphore: asyncio.Semaphore = dataclasses.field(init=False, repr=False, compare=False)
 
-    async def get(self, entity_id: int) -> models.Character:
-        url = f"https://character-service.dndbeyond.com/character/v5/character/{entity_id}"
+    def __post_init__(self) -> None:
+        assert self.max_concurrency > 0, "max_concurrency must be positive"
+
+        object.__setattr__(self, "_semaphore", asyncio.Semaphore(self.max_concurrency))
+
+    async def _archive(self, entity_id: int, raw_data: dict[str, typing.Any]) -> None:
+        if self.archive is None:
+            return
+
+        try:
+            await self.archive.set(entity_id, raw_data)
+        except Exception:
+            logger.exception("Failed to archive character: %s", entity_id)
+
+    async def _read_body(self, response: aiohttp.ClientResponse) -> bytes:
+        if response.content_length is not None and response.content_length > self.max_response_bytes:
+            logger.error("Response is too large: url(%s) size(%s)", response.url, response.content_length)
+            raise self.ResponseParseError
+
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            body.extend(chunk)
+            if len(body) > self.max_response_bytes:
+                logger.error("Response is too large: url(%s)", response.url)
+                raise self.ResponseParseError
+
+        return bytes(body)
 
-        async with self.base_client.get(url) as response:
-            raw_response = await response.json()
+    async def _fetch(self, url: str) -> typing.Any:
+        async with self._semaphore:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+
+            async with self.base_client.get(url) as response:
+                body = await self._read_body(response)
 
         try:
-            response = Response(**raw_response)
+            return json_utils.loads_bytes(body)
+        except orjson.JSONDecodeError as e:
+            logger.error("Failed to decode response: url(%s) status(%s) body(%.200s)", url, response.status, body)
+            raise self.ResponseParseError from e
+
+    def _raise_for_error_data(self, raw_data: typing.Any) -> None:
+        try:
+            error_data = ErrorData.model_validate(raw_data)
+        except pydantic.ValidationError as e:
+            logger.error("Failed to parse raw data: %s", raw_data)
+            raise self.ResponseParseError from e
+
+        if error_data.server_message == "The resource requested was not found.":
+            raise self.NotFoundError
+
+        if error_data.server_message == "Unauthorized Access Attempt.":
+            raise self.AccessError
+
+    async def get(self, entity_id: int) -> models.Character:
+        url = f"{self.base_url}/character/v5/character/{entity_id}"
+        raw_response = await self._fetch(url)
+
+        try:
+            response = Response.model_validate(raw_response)
         except pydantic.ValidationError as e:
             logger.error("Failed to parse response: %s", raw_response)
             raise self.ResponseParseError from e
 
         if not response.success:
             logger.error("Failed to get character: message(%s) data(%s)", response.message, response.raw_data)
+            self._raise_for_error_data(response.raw_data)
+
+        character = derive_character(response.raw_data)
+        await self._archive(entity_id, response.raw_data)
+
+        return character
+
+    async def get_many(
+        self, entity_ids: typing.Sequence[int]
+    ) -> list[models.Character | protocols.CharacterRepositoryProtocol.BaseError]:
+        results = await asyncio.gather(*(self.get(entity_id) for entity_id in entity_ids), return_exceptions=True)
 
-            try:
-                error_data = ErrorData(**response.raw_data)
-            except pydantic.ValidationError as e:
-                logger.error("Failed to parse raw data: %s", response.raw_data)
-                raise self.ResponseParseError from e
+        for entity_id, result in zip(entity_ids, results):
+            if isinstance(result, BaseException) and not isinstance(result, self.BaseError):
+                logger.error("Unexpected error while getting character %s: %r", entity_id, result)
+                raise result
 
-            if error_data.server_message == "The resource requested was not found.":
-                raise self.NotFoundError
+        return typing.cast(list[models.Character | protocols.CharacterRepositoryProtocol.BaseError], results)
 
-            if error_data.server_message == "Unauthorized Access Attempt.":
-                raise self.AccessError
+    async def get_campaign(self, campaign_id: int) -> models.Campaign:
+        url = f"{self.campaign_base_url}/api/campaign/stt/active-short-characters/{campaign_id}"
+        raw_response = await self._fetch(url)
 
         try:
-            data = CharacterData(**response.raw_data)
+            response = CampaignResponse.model_validate(raw_response)
         except pydantic.ValidationError as e:
-            logger.error("Failed to parse character: %s", response.raw_data)
+            logger.error("Failed to parse campaign response: %s", raw_response)
             raise self.ResponseParseError from e
 
-        try:
-            return data.to_dataclass()
-        except data.ToDataclassError as e:
-            logger.error("Failed to convert to dataclass: %s", data)
-            raise self.ResponseParseError from e
+        if not response.success:
+            logger.error("Failed to get campaign: message(%s) data(%s)", response.message, response.raw_data)
+            self._raise_for_error_data(response.raw_data)
+
+        if not isinstance(response.raw_data, list):
+            logger.error("Unexpected campaign data: %s", response.raw_data)
+            raise self.ResponseParseError
+
+        return models.Campaign(
+            id=campaign_id,
+            characters=[
+                models.CampaignCharacter(id=character.id, name=character.name, user_name=character.user_name)
+                for character in response.raw_data
+            ],
+        )
 
 
 __all__ = [
     "CharacterDdbClient",
+    "derive_character",
 ]
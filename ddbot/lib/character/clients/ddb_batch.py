@@ -0,0 +1,264 @@
+import dataclasses
+import logging
+import typing
+
+import numpy
+import numpy.typing as numpy_typing
+
+import lib.character.clients.ddb as ddb
+import lib.character.models as models
+import lib.character.protocols as protocols
+
+logger = logging.getLogger(__name__)
+
+Type = ddb.CharacterData.Modifiers.Type
+SubType = ddb.CharacterData.Modifiers.SubType
+
+MODIFIER_GROUPS = ("race", "class", "background", "item", "feat")
+PROFICIENCY_BONUS_TYPE = ddb.CharacterData.Modifiers.Modifier.BonusType.PROFICIENCY.value
+
+TYPE_CODES = {type_.value: code for code, type_ in enumerate(Type)}
+SUB_TYPE_CODES = {sub_type.value: code for code, sub_type in enumerate(SubType)}
+SUB_TYPE_COUNT = len(SUB_TYPE_CODES)
+
+BONUS_CODE = TYPE_CODES[Type.BONUS.value]
+PROFICIENCY_CODE = TYPE_CODES[Type.PROFICIENCY.value]
+EXPERTISE_CODE = TYPE_CODES[Type.EXPERTISE.value]
+
+STAT_COUNT = len(models.ABILITIES)
+ARRAY_DTYPE = numpy.dtype(numpy.int16)
+
+SCORE_SUB_TYPE_CODES = [SUB_TYPE_CODES[SubType[f"{stat_id.name}_SCORE"].value] for stat_id in ddb.StatId]
+SAVING_THROW_SUB_TYPE_CODES = [SUB_TYPE_CODES[SubType[f"{stat_id.name}_SAVING_THROW"].value] for stat_id in ddb.StatId]
+SKILL_SUB_TYPE_CODES = [SUB_TYPE_CODES[SubType[f"{skill.name}_SKILL"].value] for skill in models.SKILLS]
+INITIATIVE_SUB_TYPE_CODE = SUB_TYPE_CODES[SubType.INITIATIVE.value]
+
+IntArray = numpy_typing.NDArray[numpy.int64]
+BoolArray = numpy_typing.NDArray[numpy.bool_]
+
+
+class FlattenError(Exception): ...
+
+
+@dataclasses.dataclass
+class _FlatCharacter:
+    id: int
+    name: str
+    stats: list[int]
+    bonus_stats: list[int]
+    override_stats: list[int | None]
+    levels: list[int]
+    type_codes: list[int]
+    sub_type_codes: list[int]
+    values: list[int]
+    has_values: list[bool]
+    proficiency_bonus_types: list[bool]
+
+
+def _get_int(value: typing.Any) -> int:
+    # Anything but a plain int is left to pydantic coercion in the single derivation fallback
+    if type(value) is not int:
+        raise FlattenError(f"Value is not an integer: {value!r}")
+
+    return value
+
+
+def _get_optional_int(value: typing.Any) -> int | None:
+    if value is None:
+        return None
+
+    return _get_int(value)
+
+
+def _get_str(value: typing.Any) -> str:
+    if not isinstance(value, str):
+        raise FlattenError(f"Value is not a string: {value!r}")
+
+    return value
+
+
+def _get_stat_values(raw_stats: typing.Any) -> list[int | None]:
+    result: list[int | None] = [None] * STAT_COUNT
+    found = [False] * STAT_COUNT
+
+    for raw_stat in raw_stats:
+        index = _get_int(raw_stat["id"]) - 1
+        if not 0 <= index < STAT_COUNT:
+            raise FlattenError(f"Unknown stat id: {raw_stat['id']}")
+        if found[index]:
+            continue
+
+        result[index] = _get_optional_int(raw_stat["value"])
+        found[index] = True
+
+    if not all(found):
+        raise FlattenError("Not all stats found")
+
+    return result
+
+
+def _flatten(raw_data: dict[str, typing.Any]) -> _FlatCharacter:
+    """
+    :raises FlattenError
+    """
+    try:
+        stats = _get_stat_values(raw_data["stats"])
+        if any(value is None for value in stats):
+            raise FlattenError("Stat value is not set")
+
+        flat_character = _FlatCharacter(
+            id=_get_int(raw_data["id"]),
+            name=_get_str(raw_data["name"]),
+            stats=typing.cast(list[int], stats),
+            bonus_stats=[value or 0 for value in _get_stat_values(raw_data["bonusStats"])],
+            override_stats=_get_stat_values(raw_data["overrideStats"]),
+            levels=[_get_int(raw_class["level"]) for raw_class in raw_data["classes"]],
+            type_codes=[],
+            sub_type_codes=[],
+            values=[],
+            has_values=[],
+            proficiency_bonus_types=[],
+        )
+
+        raw_modifiers = raw_data["modifiers"]
+        for group in MODIFIER_GROUPS:
+            for raw_modifier in raw_modifiers[group]:
+                value = _get_optional_int(raw_modifier["value"])
+                bonus_types = [_get_int(bonus_type) for bonus_type in raw_modifier["bonusTypes"]]
+                if any(bonus_type != PROFICIENCY_BONUS_TYPE for bonus_type in bonus_types):
+                    raise FlattenError(f"Unknown bonus types: {bonus_types}")
+                _get_str(raw_modifier["friendlyTypeName"])
+                _get_str(raw_modifier["friendlySubtypeName"])
+
+                type_code = TYPE_CODES.get(_get_str(raw_modifier["type"]))
+                sub_type_code = SUB_TYPE_CODES.get(_get_str(raw_modifier["subType"]))
+                if type_code is None or sub_type_code is None:
+                    continue
+
+                flat_character.type_codes.append(type_code)
+                flat_character.sub_type_codes.append(sub_type_code)
+                flat_character.values.append(0 if value is None else value)
+                flat_character.has_values.append(value is not None)
+                flat_character.proficiency_bonus_types.append(len(bonus_types) != 0)
+    except (KeyError, TypeError, ValueError) as e:
+        raise FlattenError from e
+
+    return flat_character
+
+
+def _get_proficiency_bonuses(total_levels: IntArray) -> IntArray:
+    return 2 + (total_levels >= 5) + (total_levels >= 9) + (total_levels >= 13) + (total_levels >= 17)
+
+
+def _count_by_key(keys: IntArray, mask: BoolArray, size: int, weights: IntArray | None = None) -> IntArray:
+    counts = numpy.bincount(
+        keys[mask],
+        weights=None if weights is None else weights[mask],
+        minlength=size,
+    )
+    return counts.astype(numpy.int64)
+
+
+def _derive_flat(flat_characters: typing.Sequence[_FlatCharacter]) -> list[models.Character]:
+    count = len(flat_characters)
+
+    modifier_counts = numpy.fromiter((len(flat.type_codes) for flat in flat_characters), numpy.int64, count)
+    character_indexes = numpy.repeat(numpy.arange(count, dtype=numpy.int64), modifier_counts)
+    type_codes = numpy.fromiter((code for flat in flat_characters for code in flat.type_codes), numpy.int64)
+    sub_type_codes = numpy.fromiter((code for flat in flat_characters for code in flat.sub_type_codes), numpy.int64)
+    values = numpy.fromiter((value for flat in flat_characters for value in flat.values), numpy.int64)
+    has_values = numpy.fromiter((value for flat in flat_characters for value in flat.has_values), numpy.bool_)
+    proficiency_bonus_types = numpy.fromiter(
+        (value for flat in flat_characters for value in flat.proficiency_bonus_types),
+        numpy.bool_,
+    )
+
+    keys = character_indexes * SUB_TYPE_COUNT + sub_type_codes
+    size = count * SUB_TYPE_COUNT
+
+    is_bonus = type_codes == BONUS_CODE
+    bonuses = _count_by_key(keys, is_bonus & has_values, size, weights=values).reshape(count, SUB_TYPE_COUNT)
+    proficiencies = (
+        _count_by_key(keys, (type_codes == PROFICIENCY_CODE) | (is_bonus & proficiency_bonus_types), size) > 0
+    ).reshape(count, SUB_TYPE_COUNT)
+    expertises = (_count_by_key(keys, type_codes == EXPERTISE_CODE, size) > 0).reshape(count, SUB_TYPE_COUNT)
+
+    total_levels = numpy.fromiter((sum(flat.levels) for flat in flat_characters), numpy.int64, count)
+    proficiency_bonuses = _get_proficiency_bonuses(total_levels)[:, numpy.newaxis]
+    sub_type_proficiency_bonuses = numpy.where(
+        expertises,
+        2 * proficiency_bonuses,
+        numpy.where(proficiencies, proficiency_bonuses, 0),
+    )
+
+    stats = numpy.array([flat.stats for flat in flat_characters], dtype=numpy.int64).reshape(count, STAT_COUNT)
+    bonus_stats = numpy.array([flat.bonus_stats for flat in flat_characters], dtype=numpy.int64).reshape(
+        count, STAT_COUNT
+    )
+    override_stats = numpy.array(
+        [[0 if value is None else value for value in flat.override_stats] for flat in flat_characters],
+        dtype=numpy.int64,
+    ).reshape(count, STAT_COUNT)
+    has_override_stats = numpy.array(
+        [[value is not None for value in flat.override_stats] for flat in flat_characters],
+        dtype=numpy.bool_,
+    ).reshape(count, STAT_COUNT)
+
+    ability_scores = numpy.where(
+        has_override_stats,
+        override_stats,
+        stats + bonus_stats + bonuses[:, SCORE_SUB_TYPE_CODES],
+    ).astype(ARRAY_DTYPE)
+    saving_throw_modifiers = sub_type_proficiency_bonuses[:, SAVING_THROW_SUB_TYPE_CODES].astype(ARRAY_DTYPE)
+    skill_modifiers = sub_type_proficiency_bonuses[:, SKILL_SUB_TYPE_CODES].astype(ARRAY_DTYPE)
+    initiative_modifiers = sub_type_proficiency_bonuses[:, INITIATIVE_SUB_TYPE_CODE].tolist()
+
+    return [
+        models.Character(
+            id=flat.id,
+            name=flat.name,
+            ability_scores=tuple(ability_scores[index].tolist()),
+            saving_throw_modifiers=tuple(saving_throw_modifiers[index].tolist()),
+            skill_modifiers=tuple(skill_modifiers[index].tolist()),
+            initiative_modifier=initiative_modifiers[index],
+            death_saving_throw_modifier=0,
+        )
+        for index, flat in enumerate(flat_characters)
+    ]
+
+
+def derive_characters(
+    raw_datas: typing.Sequence[dict[str, typing.Any]],
+) -> list[models.Character | protocols.CharacterRepositoryProtocol.ResponseParseError]:
+    """
+    Batch equivalent of `derive_character`, payloads that can not be flattened fall back to it.
+    """
+    result: list[models.Character | protocols.CharacterRepositoryProtocol.ResponseParseError] = []
+    flat_indexes: list[int] = []
+    flat_characters: list[_FlatCharacter] = []
+
+    for raw_data in raw_datas:
+        try:
+            flat_characters.append(_flatten(raw_data))
+        except FlattenError:
+            logger.debug("Failed to flatten character, falling back to single derivation")
+            try:
+                result.append(ddb.derive_character(raw_data))
+            except protocols.CharacterRepositoryProtocol.ResponseParseError as e:
+                result.append(e)
+        else:
+            flat_indexes.append(len(result))
+            result.append(protocols.CharacterRepositoryProtocol.ResponseParseError())
+
+    if len(flat_characters) == 0:
+        return result
+
+    for index, character in zip(flat_indexes, _derive_flat(flat_characters)):
+        result[index] = character
+
+    return result
+
+
+__all__ = [
+    "derive_characters",
+]
@@ -0,0 +1,95 @@
+import struct
+import typing
+
+import lib.character.models as models
+
+# Version 1 layout, little endian:
+# version (uint8), id (int64), ability scores, saving throw and skill modifiers (int8 each),
+# initiative and death saving throw modifiers (int8), name length (uint16), utf-8 name.
+_V1_STRUCT = struct.Struct(f"<Bq{len(models.ABILITIES)}b{len(models.ABILITIES)}b{len(models.SKILLS)}bbbH")
+
+_ABILITY_SCORES_SLICE = slice(2, 2 + len(models.ABILITIES))
+_SAVING_THROW_MODIFIERS_SLICE = slice(_ABILITY_SCORES_SLICE.stop, _ABILITY_SCORES_SLICE.stop + len(models.ABILITIES))
+_SKILL_MODIFIERS_SLICE = slice(
+    _SAVING_THROW_MODIFIERS_SLICE.stop,
+    _SAVING_THROW_MODIFIERS_SLICE.stop + len(models.SKILLS),
+)
+_INITIATIVE_MODIFIER_INDEX = _SKILL_MODIFIERS_SLICE.stop
+_DEATH_SAVING_THROW_MODIFIER_INDEX = _INITIATIVE_MODIFIER_INDEX + 1
+_NAME_LENGTH_INDEX = _DEATH_SAVING_THROW_MODIFIER_INDEX + 1
+
+
+class CharacterCodec:
+    class BaseError(Exception): ...
+
+    class EncodeError(BaseError): ...
+
+    class DecodeError(BaseError): ...
+
+    class UnsupportedVersionError(DecodeError): ...
+
+    VERSION: typing.ClassVar[int] = 1
+
+    @classmethod
+    def encode(cls, character: models.Character) -> bytes:
+        """
+        :raises EncodeError
+        """
+        name = character.name.encode("utf-8")
+
+        try:
+            header = _V1_STRUCT.pack(
+                cls.VERSION,
+                character.id,
+                *character.ability_scores,
+                *character.saving_throw_modifiers,
+                *character.skill_modifiers,
+                character.initiative_modifier,
+                character.death_saving_throw_modifier,
+                len(name),
+            )
+        except struct.error as e:
+            raise cls.EncodeError(f"Failed to encode character {character.id}") from e
+
+        return header + name
+
+    @classmethod
+    def decode(cls, data: bytes) -> models.Character:
+        """
+        :raises DecodeError
+        :raises UnsupportedVersionError
+        """
+        if len(data) == 0:
+            raise cls.DecodeError("Empty data")
+
+        if data[0] != cls.VERSION:
+            raise cls.UnsupportedVersionError(f"Unsupported version: {data[0]}")
+
+        try:
+            values = _V1_STRUCT.unpack_from(data)
+        except struct.error as e:
+            raise cls.DecodeError("Truncated header") from e
+
+        name_length = values[_NAME_LENGTH_INDEX]
+        if len(data) != _V1_STRUCT.size + name_length:
+            raise cls.DecodeError(f"Expected {_V1_STRUCT.size + name_length} bytes, got {len(data)}")
+
+        try:
+            name = data[_V1_STRUCT.size :].decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise cls.DecodeError("Invalid name") from e
+
+        return models.Character(
+            id=values[1],
+            name=name,
+            ability_scores=values[_ABILITY_SCORES_SLICE],
+            saving_throw_modifiers=values[_SAVING_THROW_MODIFIERS_SLICE],
+            skill_modifiers=values[_SKILL_MODIFIERS_SLICE],
+            initiative_modifier=values[_INITIATIVE_MODIFIER_INDEX],
+            death_saving_throw_modifier=values[_DEATH_SAVING_THROW_MODIFIER_INDEX],
+        )
+
+
+__all__ = [
+    "CharacterCodec",
+]
@@ -33,15 +33,126 @@ class CharacterSkill(enum.Enum):
     SURVIVAL = enum.auto()
 
 
-@dataclasses.dataclass
+ABILITIES: tuple[CharacterAbility, ...] = tuple(CharacterAbility)
+SKILLS: tuple[CharacterSkill, ...] = tuple(CharacterSkill)
+
+ABILITY_INDEXES: typing.Mapping[CharacterAbility, int] = {ability: index for index, ability in enumerate(ABILITIES)}
+SKILL_INDEXES: typing.Mapping[CharacterSkill, int] = {skill: index for index, skill in enumerate(SKILLS)}
+
+SKILL_ABILITIES: typing.Mapping[CharacterSkill, CharacterAbility] = {
+    CharacterSkill.ACROBATICS: CharacterAbility.DEXTERITY,
+    CharacterSkill.ANIMAL_HANDLING: CharacterAbility.WISDOM,
+    CharacterSkill.ARCANA: CharacterAbility.INTELLIGENCE,
+    CharacterSkill.ATHLETICS: CharacterAbility.STRENGTH,
+    CharacterSkill.DECEPTION: CharacterAbility.CHARISMA,
+    CharacterSkill.HISTORY: CharacterAbility.INTELLIGENCE,
+    CharacterSkill.INSIGHT: CharacterAbility.WISDOM,
+    CharacterSkill.INTIMIDATION: CharacterAbility.CHARISMA,
+    CharacterSkill.INVESTIGATION: CharacterAbility.INTELLIGENCE,
+    CharacterSkill.MEDICINE: CharacterAbility.WISDOM,
+    CharacterSkill.NATURE: CharacterAbility.INTELLIGENCE,
+    CharacterSkill.PERCEPTION: CharacterAbility.WISDOM,
+    CharacterSkill.PERFORMANCE: CharacterAbility.CHARISMA,
+    CharacterSkill.PERSUASION: CharacterAbility.CHARISMA,
+    CharacterSkill.RELIGION: CharacterAbility.INTELLIGENCE,
+    CharacterSkill.SLEIGHT_OF_HAND: CharacterAbility.DEXTERITY,
+    CharacterSkill.STEALTH: CharacterAbility.DEXTERITY,
+    CharacterSkill.SURVIVAL: CharacterAbility.WISDOM,
+}
+
+# Roll modifiers table layout: ability checks, saving throws, skill checks, initiative, death saving throw
+ABILITY_CHECK_ROLL_OFFSET = 0
+SAVING_THROW_ROLL_OFFSET = ABILITY_CHECK_ROLL_OFFSET + len(ABILITIES)
+SKILL_CHECK_ROLL_OFFSET = SAVING_THROW_ROLL_OFFSET + len(ABILITIES)
+INITIATIVE_ROLL_INDEX = SKILL_CHECK_ROLL_OFFSET + len(SKILLS)
+DEATH_SAVING_THROW_ROLL_INDEX = INITIATIVE_ROLL_INDEX + 1
+ROLL_COUNT = DEATH_SAVING_THROW_ROLL_INDEX + 1
+
+
+def get_ability_check_roll_index(ability: CharacterAbility) -> int:
+    return ABILITY_CHECK_ROLL_OFFSET + ABILITY_INDEXES[ability]
+
+
+def get_saving_throw_roll_index(ability: CharacterAbility) -> int:
+    return SAVING_THROW_ROLL_OFFSET + ABILITY_INDEXES[ability]
+
+
+def get_skill_check_roll_index(skill: CharacterSkill) -> int:
+    return SKILL_CHECK_ROLL_OFFSET + SKILL_INDEXES[skill]
+
+
+def get_modifier_from_ability_score(ability_score: int) -> int:
+    return (ability_score - 10) // 2
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class Character:
     id: int
     name: str
-    abilities: typing.Mapping[CharacterAbility, int]
-    saving_throw_modifiers: typing.Mapping[CharacterAbility, int]
-    skill_modifiers: typing.Mapping[CharacterSkill, int]
+    ability_scores: tuple[int, ...]
+    saving_throw_modifiers: tuple[int, ...]
+    skill_modifiers: tuple[int, ...]
     initiative_modifier: int
     death_saving_throw_modifier: int
+    roll_modifiers: tuple[int, ...] = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        assert len(self.ability_scores) == len(ABILITIES), "ability_scores must be ordered by ABILITIES"
+        assert len(self.saving_throw_modifiers) == len(ABILITIES), "saving_throw_modifiers must be ordered by ABILITIES"
+        assert len(self.skill_modifiers) == len(SKILLS), "skill_modifiers must be ordered by SKILLS"
+
+        object.__setattr__(self, "roll_modifiers", self._get_roll_modifiers())
+
+    def _get_roll_modifiers(self) -> tuple[int, ...]:
+        ability_modifiers = [get_modifier_from_ability_score(score) for score in self.ability_scores]
+        dexterity_modifier = ability_modifiers[ABILITY_INDEXES[CharacterAbility.DEXTERITY]]
+
+        return (
+            *ability_modifiers,
+            *(
+                ability_modifier + saving_throw_modifier
+                for ability_modifier, saving_throw_modifier in zip(ability_modifiers, self.saving_throw_modifiers)
+            ),
+            *(
+                ability_modifiers[ABILITY_INDEXES[SKILL_ABILITIES[skill]]] + skill_modifier
+                for skill, skill_modifier in zip(SKILLS, self.skill_modifiers)
+            ),
+            dexterity_modifier + self.initiative_modifier,
+            self.death_saving_throw_modifier,
+        )
+
+    @classmethod
+    def from_mappings(
+        cls,
+        id: int,
+        name: str,
+        abilities: typing.Mapping[CharacterAbility, int],
+        saving_throw_modifiers: typing.Mapping[CharacterAbility, int],
+        skill_modifiers: typing.Mapping[CharacterSkill, int],
+        initiative_modifier: int,
+        death_saving_throw_modifier: int,
+    ) -> typing.Self:
+        return cls(
+            id=id,
+            name=name,
+            ability_scores=tuple(abilities[ability] for ability in ABILITIES),
+            saving_throw_modifiers=tuple(saving_throw_modifiers[ability] for ability in ABILITIES),
+            skill_modifiers=tuple(skill_modifiers[skill] for skill in SKILLS),
+            initiative_modifier=initiative_modifier,
+            death_saving_throw_modifier=death_saving_throw_modifier,
+        )
+
+    def get_ability_score(self, ability: CharacterAbility) -> int:
+        return self.ability_scores[ABILITY_INDEXES[ability]]
+
+    def get_saving_throw_modifier(self, ability: CharacterAbility) -> int:
+        return self.saving_throw_modifiers[ABILITY_INDEXES[ability]]
+
+    def get_skill_modifier(self, skill: CharacterSkill) -> int:
+        return self.skill_modifiers[SKILL_INDEXES[skill]]
+
+    def get_roll_modifier(self, roll_index: int) -> int:
+        return self.roll_modifiers[roll_index]
 
 
 @dataclasses.dataclass
@@ -50,9 +161,51 @@ class RollResult:
     details: str
 
 
+@dataclasses.dataclass(frozen=True)
+class CampaignCharacter:
+    id: int
+    name: str
+    user_name: str
+
+
+@dataclasses.dataclass(frozen=True)
+class Campaign:
+    id: int
+    characters: list[CampaignCharacter]
+
+
+@dataclasses.dataclass
+class CampaignImportResult:
+    campaign: Campaign
+    characters: dict[int, Character] = dataclasses.field(default_factory=dict)
+    failed_entity_ids: list[int] = dataclasses.field(default_factory=list)
+
+
+@dataclasses.dataclass
+class RederiveResult:
+    characters: dict[int, Character] = dataclasses.field(default_factory=dict)
+    failed_entity_ids: list[int] = dataclasses.field(default_factory=list)
+
+
 __all__ = [
+    "ABILITIES",
+    "ABILITY_INDEXES",
+    "DEATH_SAVING_THROW_ROLL_INDEX",
+    "INITIATIVE_ROLL_INDEX",
+    "ROLL_COUNT",
+    "SKILLS",
+    "SKILL_ABILITIES",
+    "SKILL_INDEXES",
+    "Campaign",
+    "CampaignCharacter",
+    "CampaignImportResult",
     "Character",
     "CharacterAbility",
     "CharacterSkill",
+    "RederiveResult",
     "RollResult",
+    "get_ability_check_roll_index",
+    "get_modifier_from_ability_score",
+    "get_saving_throw_roll_index",
+    "get_skill_check_roll_index",
 ]
@@ -20,6 +20,32 @@ class CharacterRepositoryProtocol(typing.Protocol):
         """
         ...
 
+    async def get_many(self, entity_ids: typing.Sequence[int]) -> list[models.Character | BaseError]: ...
+
+    async def get_campaign(self, campaign_id: int) -> models.Campaign:
+        """
+        :raises NotFoundError
+        :raises AccessError
+        :raises ResponseParseError
+        """
+        ...
+
+
+class CharacterArchiveProtocol(typing.Protocol):
+    class BaseError(Exception): ...
+
+    class NotFoundError(BaseError): ...
+
+    async def get(self, entity_id: int) -> dict[str, typing.Any]:
+        """
+        :raises NotFoundError
+        """
+        ...
+
+    async def set(self, entity_id: int, raw_data: dict[str, typing.Any]) -> None: ...
+
+    async def get_entity_ids(self) -> list[int]: ...
+
 
 class CharacterServiceProtocol(typing.Protocol):
     class BaseError(Exception): ...
@@ -38,8 +64,17 @@ class CharacterServiceProtocol(typing.Protocol):
         """
         ...
 
+    async def import_campaign(self, campaign_id: int) -> models.CampaignImportResult:
+        """
+        :raises NotFoundError
+        :raises AccessError
+        :raises RepositoryError
+        """
+        ...
+
 
 __all__ = [
+    "CharacterArchiveProtocol",
     "CharacterRepositoryProtocol",
     "CharacterServiceProtocol",
 ]
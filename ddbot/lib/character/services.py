@@ -1,6 +1,10 @@
+import asyncio
+import concurrent.futures
 import dataclasses
 import logging
+import multiprocessing
 import random
+import typing
 
 import lib.character.models as models
 import lib.character.protocols as protocols
@@ -9,6 +13,84 @@ import lib.utils.cache as cache_utils
 logger = logging.getLogger(__name__)
 
 
+class DeriveCallbackProtocol(typing.Protocol):
+    def __call__(
+        self,
+        raw_datas: typing.Sequence[dict[str, typing.Any]],
+    ) -> typing.Sequence[models.Character | Exception]: ...
+
+
+@dataclasses.dataclass
+class CharacterRederiveService:
+    archive: protocols.CharacterArchiveProtocol
+    derive: DeriveCallbackProtocol
+    max_workers: int | None = None
+    batch_size: int = 256
+
+    async def _rederive_batch(
+        self,
+        entity_ids: typing.Sequence[int],
+        executor: concurrent.futures.Executor,
+    ) -> list[models.Character | BaseException]:
+        raw_datas = await asyncio.gather(
+            *(self.archive.get(entity_id) for entity_id in entity_ids),
+            return_exceptions=True,
+        )
+
+        result: list[models.Character | BaseException] = list(raw_datas)  # pyright: ignore[reportAssignmentType]
+        loaded_indexes = [index for index, raw_data in enumerate(raw_datas) if not isinstance(raw_data, BaseException)]
+        loaded_raw_datas = [raw_datas[index] for index in loaded_indexes]
+
+        loop = asyncio.get_running_loop()
+        characters = await loop.run_in_executor(executor, self.derive, loaded_raw_datas)
+
+        for index, character in zip(loaded_indexes, characters):
+            result[index] = character
+
+        return result
+
+    async def rederive_all(self) -> models.RederiveResult:
+        return await self.rederive(await self.archive.get_entity_ids())
+
+    async def rederive(self, entity_ids: typing.Sequence[int]) -> models.RederiveResult:
+        logger.info("Rederiving %d archived characters", len(entity_ids))
+
+        result = models.RederiveResult()
+        if len(entity_ids) == 0:
+            return result
+
+        batches = [entity_ids[index : index + self.batch_size] for index in range(0, len(entity_ids), self.batch_size)]
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            batch_results = await asyncio.gather(
+                *(self._rederive_batch(batch, executor) for batch in batches),
+                return_exceptions=True,
+            )
+
+        for batch, batch_result in zip(batches, batch_results):
+            if isinstance(batch_result, BaseException):
+                logger.error("Failed to rederive characters %s: %r", batch, batch_result)
+                result.failed_entity_ids.extend(batch)
+                continue
+
+            for entity_id, character in zip(batch, batch_result):
+                if isinstance(character, BaseException):
+                    logger.error("Failed to rederive character %s: %r", entity_id, character)
+                    result.failed_entity_ids.append(entity_id)
+                    continue
+
+                result.characters[entity_id] = character
+
+        logger.info(
+            "Rederived %d characters, %d failed",
+            len(result.characters),
+            len(result.failed_entity_ids),
+        )
+        return result
+
+
 @dataclasses.dataclass
 class CharacterService(protocols.CharacterServiceProtocol):
     repository: protocols.CharacterRepositoryProtocol
@@ -31,12 +113,50 @@ class CharacterService(protocols.CharacterServiceProtocol):
             logger=logger,
         )
 
+    async def import_campaign(self, campaign_id: int) -> models.CampaignImportResult:
+        try:
+            campaign = await self.repository.get_campaign(campaign_id)
+        except protocols.CharacterRepositoryProtocol.NotFoundError as e:
+            raise protocols.CharacterServiceProtocol.NotFoundError from e
+        except protocols.CharacterRepositoryProtocol.AccessError as e:
+            raise protocols.CharacterServiceProtocol.AccessError from e
+        except protocols.CharacterRepositoryProtocol.ResponseParseError as e:
+            raise protocols.CharacterServiceProtocol.RepositoryError from e
 
-class RollService:
-    @staticmethod
-    def _get_modifier_from_ability_score(ability_score: int) -> int:
-        return (ability_score - 10) // 2
+        entity_ids = [character.id for character in campaign.characters]
+        logger.info("Importing %d characters of campaign %s", len(entity_ids), campaign_id)
+
+        # Every character goes through the cache, so cached ones are not refetched and in-flight fetches are shared
+        characters = await asyncio.gather(
+            *(self.get(entity_id) for entity_id in entity_ids),
+            return_exceptions=True,
+        )
+
+        result = models.CampaignImportResult(campaign=campaign)
+        for entity_id, character in zip(entity_ids, characters):
+            if isinstance(character, protocols.CharacterServiceProtocol.BaseError):
+                logger.warning("Failed to import character %s: %r", entity_id, character)
+                result.failed_entity_ids.append(entity_id)
+                continue
+            if isinstance(character, BaseException):
+                raise character
+
+            result.characters[entity_id] = character
+
+        return result
+
+    async def warmup(self, rederive_service: CharacterRederiveService, max_characters: int) -> None:
+        entity_ids = await rederive_service.archive.get_entity_ids()
+        if len(entity_ids) > max_characters:
+            logger.info("Warming up %d of %d archived characters", max_characters, len(entity_ids))
+
+        result = await rederive_service.rederive(entity_ids[:max_characters])
 
+        for entity_id, character in result.characters.items():
+            await self.cache.set(key=str(entity_id), value=character)
+
+
+class RollService:
     @staticmethod
     def _get_roll_result(modifier: int) -> models.RollResult:
         roll_value = random.randint(1, 20)
@@ -46,76 +166,51 @@ class RollService:
             details=f"{roll_value}{'+' if modifier >= 0 else ''}{modifier}",
         )
 
-    async def roll_ability_check(
+    async def roll(
         self,
         character: models.Character,
-        ability: models.CharacterAbility,
+        roll_index: int,
     ) -> models.RollResult:
-        assert ability in character.abilities
-
-        logger.debug(f"Rolling ability check for {ability} for {character}")
+        logger.debug("Rolling %s for %s", roll_index, character)
 
-        ability_score = character.abilities[ability]
+        return self._get_roll_result(character.roll_modifiers[roll_index])
 
-        modifier = self._get_modifier_from_ability_score(ability_score)
-        return self._get_roll_result(modifier)
+    async def roll_ability_check(
+        self,
+        character: models.Character,
+        ability: models.CharacterAbility,
+    ) -> models.RollResult:
+        return await self.roll(character, models.get_ability_check_roll_index(ability))
 
     async def roll_saving_throw(
         self,
         character: models.Character,
         ability: models.CharacterAbility,
     ) -> models.RollResult:
-        assert ability in character.abilities
-        assert ability in character.saving_throw_modifiers
-
-        logger.debug(f"Rolling saving throw for {ability} for {character}")
-
-        ability_score = character.abilities[ability]
-        saving_throw_modifier = character.saving_throw_modifiers[ability]
-
-        modifier = self._get_modifier_from_ability_score(ability_score) + saving_throw_modifier
-        return self._get_roll_result(modifier)
+        return await self.roll(character, models.get_saving_throw_roll_index(ability))
 
     async def roll_skill_check(
         self,
         character: models.Character,
-        ability: models.CharacterAbility,
         skill: models.CharacterSkill,
     ) -> models.RollResult:
-        assert ability in character.abilities
-        assert skill in character.skill_modifiers
-
-        logger.debug(f"Rolling skill check for {skill} for {character}")
-
-        ability_score = character.abilities[ability]
-        skill_modifier = character.skill_modifiers[skill]
-
-        modifier = self._get_modifier_from_ability_score(ability_score) + skill_modifier
-        return self._get_roll_result(modifier)
+        return await self.roll(character, models.get_skill_check_roll_index(skill))
 
     async def roll_initiative(
         self,
         character: models.Character,
     ) -> models.RollResult:
-        assert models.CharacterAbility.DEXTERITY in character.abilities
-
-        logger.debug(f"Rolling initiative for {character}")
-
-        dexterity_score = character.abilities[models.CharacterAbility.DEXTERITY]
-
-        modifier = self._get_modifier_from_ability_score(dexterity_score) + character.initiative_modifier
-        return self._get_roll_result(modifier)
+        return await self.roll(character, models.INITIATIVE_ROLL_INDEX)
 
     async def roll_death_saving_throw(
         self,
         character: models.Character,
     ) -> models.RollResult:
-        logger.debug(f"Rolling death saving throw for {character}")
-
-        modifier = character.death_saving_throw_modifier
-        return self._get_roll_result(modifier)
+        return await self.roll(character, models.DEATH_SAVING_THROW_ROLL_INDEX)
 
 
 __all__ = [
+    "CharacterRederiveService",
     "CharacterService",
+    "RollService",
 ]
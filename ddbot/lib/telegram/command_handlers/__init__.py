@@ -1,3 +1,5 @@
+from .campaign import *
 from .character import *
 from .help import *
+from .panel import *
 from .roll import *
@@ -0,0 +1,120 @@
+import dataclasses
+import functools
+import logging
+import typing
+
+import aiogram
+import aiogram.enums as aiogram_enums
+import aiogram.exceptions as aiogram_exceptions
+import aiogram.filters as aiogram_filters
+import aiogram.methods as aiogram_methods
+import aiogram.types as aiogram_types
+
+import lib.character.models as character_models
+import lib.character.protocols as character_protocols
+import lib.telegram.messages as telegram_messages
+import lib.utils.aiogram as aiogram_utils
+
+logger = logging.getLogger(__name__)
+
+CHAT_ADMIN_STATUSES = (aiogram_enums.ChatMemberStatus.CREATOR, aiogram_enums.ChatMemberStatus.ADMINISTRATOR)
+
+
+def render_campaign_import_result(result: character_models.CampaignImportResult) -> str:
+    lines: list[str] = []
+
+    for character in result.campaign.characters:
+        template = (
+            telegram_messages.CAMPAIGN_SET_CHARACTER
+            if character.id in result.characters
+            else telegram_messages.CAMPAIGN_SET_CHARACTER_FAILED
+        )
+        lines.append(
+            template.format(
+                character_name=character.name,
+                user_name=character.user_name,
+                character_id=character.id,
+            )
+        )
+
+    return telegram_messages.CAMPAIGN_SET_SUCCESS.format(characters="\n".join(lines))
+
+
+@dataclasses.dataclass(frozen=True)
+class CampaignSetCommandHandler:
+    """
+    `/campaign_set <campaign_id>` fetches every character of a campaign,
+    so in groups it is restricted to chat administrators.
+    """
+
+    character_service: character_protocols.CharacterServiceProtocol
+
+    @staticmethod
+    async def _is_chat_admin(message: aiogram.types.Message, user_id: int, bot: aiogram.Bot) -> bool:
+        if message.chat.type == aiogram_enums.ChatType.PRIVATE:
+            return True
+
+        try:
+            member = await bot.get_chat_member(chat_id=message.chat.id, user_id=user_id)
+        except aiogram_exceptions.TelegramAPIError:
+            logger.exception("Failed to get chat member %s of chat %s", user_id, message.chat.id)
+            return False
+
+        return member.status in CHAT_ADMIN_STATUSES
+
+    async def process(self, message: aiogram.types.Message, bot: aiogram.Bot) -> aiogram_methods.SendMessage | None:
+        if message.from_user is None:
+            logger.debug("message.from_user is None")
+            return None
+
+        if message.from_user.is_bot:
+            logger.debug("message.from_user.is_bot")
+            return None
+
+        text = aiogram_utils.get_command_text(message)
+        if text is None:
+            logger.debug("message has no text")
+            return None
+
+        if not await self._is_chat_admin(message, message.from_user.id, bot):
+            return message.reply(text=telegram_messages.CAMPAIGN_SET_NOT_ADMIN)
+
+        command = self._command.extract_command(text)
+
+        if command.args is None:
+            return message.reply(text=telegram_messages.CAMPAIGN_SET_NO_ARGS)
+
+        try:
+            campaign_id = int(command.args)
+        except ValueError:
+            return message.reply(text=telegram_messages.CAMPAIGN_SET_INVALID_ARGS.format(campaign_id=command.args))
+
+        try:
+            result = await self.character_service.import_campaign(campaign_id)
+        except character_protocols.CharacterServiceProtocol.NotFoundError:
+            return message.reply(text=telegram_messages.CAMPAIGN_FETCH_NOT_FOUND.format(campaign_id=campaign_id))
+        except character_protocols.CharacterServiceProtocol.AccessError:
+            return message.reply(text=telegram_messages.CAMPAIGN_FETCH_NO_ACCESS.format(campaign_id=campaign_id))
+        except character_protocols.CharacterServiceProtocol.RepositoryError:
+            return message.reply(text=telegram_messages.CAMPAIGN_FETCH_UNKNOWN_ERROR.format(campaign_id=campaign_id))
+
+        return message.reply(text=render_campaign_import_result(result))
+
+    @property
+    def bot_commands(self) -> typing.Sequence[aiogram_types.BotCommand]:
+        return [aiogram_types.BotCommand(command="campaign_set", description="Import all characters of a campaign")]
+
+    @functools.cached_property
+    def _command(self) -> aiogram_filters.Command:
+        return aiogram_filters.Command(commands=self.bot_commands)
+
+    @property
+    def filters(self) -> typing.Sequence[aiogram_filters.Filter]:
+        return [self._command]
+
+
+__all__ = [
+    "CHAT_ADMIN_STATUSES",
+    "CampaignSetCommandHandler",
+    "render_campaign_import_result",
+]
@@ -1,9 +1,11 @@
 import dataclasses
+import functools
 import logging
 import typing
 
 import aiogram
 import aiogram.filters as aiogram_filters
+import aiogram.methods as aiogram_methods
 import aiogram.types as aiogram_types
 
 import lib.character.models as character_models
@@ -12,6 +14,7 @@ import lib.context.models as context_models
 import lib.context.protocols as context_protocols
 import lib.telegram.context as telegram_context
 import lib.telegram.messages as telegram_messages
+import lib.utils.aiogram as aiogram_utils
 import lib.utils.cache as cache_utils
 
 logger = logging.getLogger(__name__)
@@ -22,42 +25,38 @@ class CharacterSetCommandHandler:
     context_service: context_protocols.ContextServiceProtocol
     character_service: character_protocols.CharacterServiceProtocol
 
-    async def process(self, message: aiogram.types.Message):
+    async def process(self, message: aiogram.types.Message) -> aiogram_methods.SendMessage | None:
         if message.from_user is None:
             logger.debug("message.from_user is None")
-            return
+            return None
 
         if message.from_user.is_bot:
             logger.debug("message.from_user.is_bot")
-            return
+            return None
 
-        if message.text is None:
-            logger.debug("message.text is None")
-            return
+        text = aiogram_utils.get_command_text(message)
+        if text is None:
+            logger.debug("message has no text")
+            return None
 
-        command = self._command.extract_command(message.text)
+        command = self._command.extract_command(text)
 
         if command.args is None:
-            await message.reply(text=telegram_messages.CHARACTER_SET_NO_ARGS)
-            return
+            return message.reply(text=telegram_messages.CHARACTER_SET_NO_ARGS)
 
         try:
             character_id = int(command.args)
         except ValueError:
-            await message.reply(text=telegram_messages.CHARACTER_SET_INVALID_ARGS.format(character_id=command.args))
-            return
+            return message.reply(text=telegram_messages.CHARACTER_SET_INVALID_ARGS.format(character_id=command.args))
 
         try:
             character = await self.character_service.get(character_id)
         except character_protocols.CharacterServiceProtocol.NotFoundError:
-            await message.reply(text=telegram_messages.CHARACTER_FETCH_NOT_FOUND.format(character_id=character_id))
-            return
+            return message.reply(text=telegram_messages.CHARACTER_FETCH_NOT_FOUND.format(character_id=character_id))
         except character_protocols.CharacterServiceProtocol.AccessError:
-            await message.reply(text=telegram_messages.CHARACTER_FETCH_NO_ACCESS.format(character_id=character_id))
-            return
+            return message.reply(text=telegram_messages.CHARACTER_FETCH_NO_ACCESS.format(character_id=character_id))
         except character_protocols.CharacterServiceProtocol.RepositoryError:
-            await message.reply(text=telegram_messages.CHARACTER_FETCH_UNKNOWN_ERROR.format(character_id=character_id))
-            return
+            return message.reply(text=telegram_messages.CHARACTER_FETCH_UNKNOWN_ERROR.format(character_id=character_id))
 
         context_key = telegram_context.get_context_key_from_message(message)
         await self.context_service.set(
@@ -67,13 +66,13 @@ class CharacterSetCommandHandler:
             ),
         )
 
-        await message.reply(text=telegram_messages.CHARACTER_SET_SUCCESS.format(character_name=character.name))
+        return message.reply(text=telegram_messages.CHARACTER_SET_SUCCESS.format(character_name=character.name))
 
     @property
     def bot_commands(self) -> typing.Sequence[aiogram_types.BotCommand]:
         return [aiogram_types.BotCommand(command="character_set", description="Set your character")]
 
-    @property
+    @functools.cached_property
     def _command(self) -> aiogram_filters.Command:
         return aiogram_filters.Command(commands=self.bot_commands)
 
@@ -87,25 +86,24 @@ class CharacterCacheClear:
     context_service: context_protocols.ContextServiceProtocol
     cache: cache_utils.CacheProtocol[character_models.Character]
 
-    async def process(self, message: aiogram.types.Message):
+    async def process(self, message: aiogram.types.Message) -> aiogram_methods.SendMessage | None:
         if message.from_user is None:
             logger.debug("message.from_user is None")
-            return
+            return None
 
         if message.from_user.is_bot:
             logger.debug("message.from_user.is_bot")
-            return
+            return None
 
         context_key = telegram_context.get_context_key_from_message(message)
 
         try:
             context = await self.context_service.get(key=context_key)
         except context_protocols.ContextServiceProtocol.NotFoundError:
-            await message.reply(text=telegram_messages.CHARACTER_FETCH_NOT_SET)
-            return
+            return message.reply(text=telegram_messages.CHARACTER_FETCH_NOT_SET)
 
         await self.cache.clear(str(context.character_id))
-        await message.reply(text=telegram_messages.CHARACTER_CACHE_CLEAR_SUCCESS)
+        return message.reply(text=telegram_messages.CHARACTER_CACHE_CLEAR_SUCCESS)
 
     @property
     def bot_commands(self) -> typing.Sequence[aiogram_types.BotCommand]:
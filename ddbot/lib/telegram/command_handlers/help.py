@@ -3,6 +3,7 @@ import typing
 
 import aiogram
 import aiogram.filters as aiogram_filters
+import aiogram.methods as aiogram_methods
 import aiogram.types as aiogram_types
 
 DEFAULT_HELP_MESSAGE_TEMPLATE = (
@@ -61,8 +62,8 @@ class HelpCommandHandler:
     text: str
     parse_mode = aiogram.enums.ParseMode.MARKDOWN_V2
 
-    async def process(self, message: aiogram.types.Message):
-        await message.answer(self.text, parse_mode=self.parse_mode)
+    async def process(self, message: aiogram.types.Message) -> aiogram_methods.SendMessage:
+        return message.answer(self.text, parse_mode=self.parse_mode)
 
     @property
     def bot_commands(self) -> typing.Sequence[aiogram_types.BotCommand]:
@@ -0,0 +1,92 @@
+import dataclasses
+import functools
+import itertools
+import typing
+
+import aiogram
+import aiogram.filters as aiogram_filters
+import aiogram.methods as aiogram_methods
+import aiogram.types as aiogram_types
+
+import lib.telegram.command_handlers.roll as roll_command_handlers
+import lib.telegram.messages as telegram_messages
+import lib.utils.aiogram as aiogram_utils
+
+ROLL_PANEL_LAYOUTS: dict[str, list[roll_command_handlers.RollCommand]] = {
+    "checks": [*roll_command_handlers.ABILITY_CHECK_COMMANDS, roll_command_handlers.INITIATIVE_COMMAND],
+    "saves": [*roll_command_handlers.ABILITY_SAVE_COMMANDS, roll_command_handlers.DEATH_SAVE_COMMAND],
+    "skills": roll_command_handlers.SKILL_CHECK_COMMANDS,
+}
+ROLL_PANEL_DEFAULT_LAYOUT = "all"
+
+
+@dataclasses.dataclass(frozen=True)
+class RollPanelCommandHandler:
+    """
+    `/panel [layout]` posts an inline keyboard of roll buttons handled by the roll router.
+    Keyboards are built once per layout.
+    """
+
+    roll_command_router: roll_command_handlers.RollCommandRouter
+    layouts: typing.Mapping[str, typing.Sequence[roll_command_handlers.RollCommand]] = dataclasses.field(
+        default_factory=lambda: ROLL_PANEL_LAYOUTS
+    )
+    row_width: int = 2
+
+    def _build_keyboard(
+        self,
+        commands: typing.Iterable[roll_command_handlers.RollCommand],
+    ) -> aiogram_types.InlineKeyboardMarkup:
+        codec = self.roll_command_router.callback_data_codec
+        buttons = [
+            aiogram_types.InlineKeyboardButton(text=command.description, callback_data=codec.encode(command))
+            for command in commands
+        ]
+
+        return aiogram_types.InlineKeyboardMarkup(
+            inline_keyboard=[list(row) for row in itertools.batched(buttons, self.row_width)],
+        )
+
+    @functools.cached_property
+    def _keyboards(self) -> typing.Mapping[str, aiogram_types.InlineKeyboardMarkup]:
+        keyboards = {name: self._build_keyboard(commands) for name, commands in self.layouts.items()}
+        keyboards[ROLL_PANEL_DEFAULT_LAYOUT] = self._build_keyboard(itertools.chain(*self.layouts.values()))
+
+        return keyboards
+
+    async def process(self, message: aiogram.types.Message) -> aiogram_methods.SendMessage | None:
+        text = aiogram_utils.get_command_text(message)
+        if text is None:
+            return None
+
+        command = self._command.extract_command(text)
+        layout = command.args.strip().lower() if command.args else ROLL_PANEL_DEFAULT_LAYOUT
+
+        keyboard = self._keyboards.get(layout)
+        if keyboard is None:
+            return message.reply(
+                text=telegram_messages.ROLL_PANEL_UNKNOWN_LAYOUT.format(
+                    layout=layout,
+                    layouts=", ".join(self._keyboards),
+                ),
+            )
+
+        return message.reply(text=telegram_messages.ROLL_PANEL, reply_markup=keyboard)
+
+    @property
+    def bot_commands(self) -> typing.Sequence[aiogram_types.BotCommand]:
+        return [aiogram_types.BotCommand(command="panel", description="Show roll buttons")]
+
+    @functools.cached_property
+    def _command(self) -> aiogram_filters.Command:
+        return aiogram_filters.Command(commands=self.bot_commands)
+
+    @property
+    def filters(self) -> typing.Sequence[aiogram_filters.Filter]:
+        return [self._command]
+
+
+__all__ = [
+    "ROLL_PANEL_LAYOUTS",
+    "RollPanelCommandHandler",
+]
@@ -1,353 +1,356 @@
 import dataclasses
+import functools
 import logging
 import typing
 
 import aiogram
 import aiogram.filters as aiogram_filters
+import aiogram.methods as aiogram_methods
 import aiogram.types as aiogram_types
 
 import lib.character.models as character_models
 import lib.character.protocols as character_protocols
+import lib.character.services as character_services
 import lib.context.protocols as context_protocols
 import lib.telegram.context as telegram_context
 import lib.telegram.messages as telegram_messages
+import lib.utils.aiogram as aiogram_utils
 
 logger = logging.getLogger(__name__)
 
 
-class RollCallbackProtocol(typing.Protocol):
-    def __call__(self, character: character_models.Character) -> typing.Awaitable[character_models.RollResult]: ...
-
-
 @dataclasses.dataclass(frozen=True)
 class RollCommand:
     command: str
     description: str
-    callback: RollCallbackProtocol
-
-
-@dataclasses.dataclass(frozen=True)
-class RollCommandFactory:
-    command: str
-    description: str
-
-    def make(self, callback: RollCallbackProtocol) -> RollCommand:
-        return RollCommand(
-            command=self.command,
-            description=self.description,
-            callback=callback,
-        )
-
-
-class AbilityCallbackProtocol(typing.Protocol):
-    async def __call__(
-        self, character: character_models.Character, ability: character_models.CharacterAbility
-    ) -> character_models.RollResult: ...
-
-
-@dataclasses.dataclass(frozen=True)
-class AbilityCommandFactory:
-    command: str
-    description: str
-    ability: character_models.CharacterAbility
-
-    def make(self, callback: AbilityCallbackProtocol) -> RollCommand:
-        async def wrapped_callback(character: character_models.Character) -> character_models.RollResult:
-            return await callback(character, self.ability)
+    roll_index: int
 
-        return RollCommand(
-            command=self.command,
-            description=self.description,
-            callback=wrapped_callback,
-        )
+    @property
+    def bot_command(self) -> aiogram_types.BotCommand:
+        return aiogram_types.BotCommand(command=self.command, description=self.description)
 
 
-ABILITY_CHECK_COMMAND_FACTORIES: list[AbilityCommandFactory] = [
-    AbilityCommandFactory(
+ABILITY_CHECK_COMMANDS: list[RollCommand] = [
+    RollCommand(
         command="str_check",
         description="Strength check",
-        ability=character_models.CharacterAbility.STRENGTH,
+        roll_index=character_models.get_ability_check_roll_index(character_models.CharacterAbility.STRENGTH),
     ),
-    AbilityCommandFactory(
+    RollCommand(
         command="dex_check",
         description="Dexterity check",
-        ability=character_models.CharacterAbility.DEXTERITY,
+        roll_index=character_models.get_ability_check_roll_index(character_models.CharacterAbility.DEXTERITY),
     ),
-    AbilityCommandFactory(
+    RollCommand(
         command="con_check",
         description="Constitution check",
-        ability=character_models.CharacterAbility.CONSTITUTION,
+        roll_index=character_models.get_ability_check_roll_index(character_models.CharacterAbility.CONSTITUTION),
     ),
-    AbilityCommandFactory(
+    RollCommand(
         command="int_check",
         description="Intelligence check",
-        ability=character_models.CharacterAbility.INTELLIGENCE,
+        roll_index=character_models.get_ability_check_roll_index(character_models.CharacterAbility.INTELLIGENCE),
     ),
-    AbilityCommandFactory(
+    RollCommand(
         command="wis_check",
         description="Wisdom check",
-        ability=character_models.CharacterAbility.WISDOM,
+        roll_index=character_models.get_ability_check_roll_index(character_models.CharacterAbility.WISDOM),
     ),
-    AbilityCommandFactory(
+    RollCommand(
         command="cha_check",
         description="Charisma check",
-        ability=character_models.CharacterAbility.CHARISMA,
+        roll_index=character_models.get_ability_check_roll_index(character_models.CharacterAbility.CHARISMA),
     ),
 ]
 
-ABILITY_SAVE_COMMAND_FACTORIES: list[AbilityCommandFactory] = [
-    AbilityCommandFactory(
+ABILITY_SAVE_COMMANDS: list[RollCommand] = [
+    RollCommand(
         command="str_save",
         description="Strength saving throw",
-        ability=character_models.CharacterAbility.STRENGTH,
+        roll_index=character_models.get_saving_throw_roll_index(character_models.CharacterAbility.STRENGTH),
     ),
-    AbilityCommandFactory(
+    RollCommand(
         command="dex_save",
         description="Dexterity saving throw",
-        ability=character_models.CharacterAbility.DEXTERITY,
+        roll_index=character_models.get_saving_throw_roll_index(character_models.CharacterAbility.DEXTERITY),
     ),
-    AbilityCommandFactory(
+    RollCommand(
         command="con_save",
         description="Constitution saving throw",
-        ability=character_models.CharacterAbility.CONSTITUTION,
+        roll_index=character_models.get_saving_throw_roll_index(character_models.CharacterAbility.CONSTITUTION),
     ),
-    AbilityCommandFactory(
+    RollCommand(
         command="int_save",
         description="Intelligence saving throw",
-        ability=character_models.CharacterAbility.INTELLIGENCE,
+        roll_index=character_models.get_saving_throw_roll_index(character_models.CharacterAbility.INTELLIGENCE),
     ),
-    AbilityCommandFactory(
+    RollCommand(
         command="wis_save",
         description="Wisdom saving throw",
-        ability=character_models.CharacterAbility.WISDOM,
+        roll_index=character_models.get_saving_throw_roll_index(character_models.CharacterAbility.WISDOM),
     ),
-    AbilityCommandFactory(
+    RollCommand(
         command="cha_save",
         description="Charisma saving throw",
-        ability=character_models.CharacterAbility.CHARISMA,
+        roll_index=character_models.get_saving_throw_roll_index(character_models.CharacterAbility.CHARISMA),
     ),
 ]
 
 
-class SkillCallbackProtocol(typing.Protocol):
-    async def __call__(
-        self,
-        character: character_models.Character,
-        ability: character_models.CharacterAbility,
-        skill: character_models.CharacterSkill,
-    ) -> character_models.RollResult: ...
-
-
-@dataclasses.dataclass(frozen=True)
-class SkillCommandFactory:
-    command: str
-    description: str
-    ability: character_models.CharacterAbility
-    skill: character_models.CharacterSkill
-
-    def make(self, callback: SkillCallbackProtocol) -> RollCommand:
-        async def wrapped_callback(character: character_models.Character) -> character_models.RollResult:
-            return await callback(character, self.ability, self.skill)
-
-        return RollCommand(
-            command=self.command,
-            description=self.description,
-            callback=wrapped_callback,
-        )
-
-
-SKILL_CHECK_COMMAND_FACTORIES: list[SkillCommandFactory] = [
-    SkillCommandFactory(
+SKILL_CHECK_COMMANDS: list[RollCommand] = [
+    RollCommand(
         command="acrobatics",
         description="Acrobatics check",
-        ability=character_models.CharacterAbility.DEXTERITY,
-        skill=character_models.CharacterSkill.ACROBATICS,
+        roll_index=character_models.get_skill_check_roll_index(character_models.CharacterSkill.ACROBATICS),
     ),
-    SkillCommandFactory(
+    RollCommand(
         command="animal_handling",
         description="Animal Handling check",
-        ability=character_models.CharacterAbility.WISDOM,
-        skill=character_models.CharacterSkill.ANIMAL_HANDLING,
+        roll_index=character_models.get_skill_check_roll_index(character_models.CharacterSkill.ANIMAL_HANDLING),
     ),
-    SkillCommandFactory(
+    RollCommand(
         command="arcana",
         description="Arcana check",
-        ability=character_models.CharacterAbility.INTELLIGENCE,
-        skill=character_models.CharacterSkill.ARCANA,
+        roll_index=character_models.get_skill_check_roll_index(character_models.CharacterSkill.ARCANA),
     ),
-    SkillCommandFactory(
+    RollCommand(
         command="athletics",
         description="Athletics check",
-        ability=character_models.CharacterAbility.STRENGTH,
-        skill=character_models.CharacterSkill.ATHLETICS,
+        roll_index=character_models.get_skill_check_roll_index(character_models.CharacterSkill.ATHLETICS),
     ),
-    SkillCommandFactory(
+    RollCommand(
         command="deception",
         description="Deception check",
-        ability=character_models.CharacterAbility.CHARISMA,
-        skill=character_models.CharacterSkill.DECEPTION,
+        roll_index=character_models.get_skill_check_roll_index(character_models.CharacterSkill.DECEPTION),
     ),
-    SkillCommandFactory(
+    RollCommand(
         command="history",
         description="History check",
-        ability=character_models.CharacterAbility.INTELLIGENCE,
-        skill=character_models.CharacterSkill.HISTORY,
+        roll_index=character_models.get_skill_check_roll_index(character_models.CharacterSkill.HISTORY),
     ),
-    SkillCommandFactory(
+    RollCommand(
         command="insight",
         description="Insight check",
-        ability=character_models.CharacterAbility.WISDOM,
-        skill=character_models.CharacterSkill.INSIGHT,
+        roll_index=character_models.get_skill_check_roll_index(character_models.CharacterSkill.INSIGHT),
     ),
-    SkillCommandFactory(
+    RollCommand(
         command="intimidation",
         description="Intimidation check",
-        ability=character_models.CharacterAbility.CHARISMA,
-        skill=character_models.CharacterSkill.INTIMIDATION,
+        roll_index=character_models.get_skill_check_roll_index(character_models.CharacterSkill.INTIMIDATION),
     ),
-    SkillCommandFactory(
+    RollCommand(
         command="investigation",
         description="Investigation check",
-        ability=character_models.CharacterAbility.INTELLIGENCE,
-        skill=character_models.CharacterSkill.INVESTIGATION,
+        roll_index=character_models.get_skill_check_roll_index(character_models.CharacterSkill.INVESTIGATION),
     ),
-    SkillCommandFactory(
+    RollCommand(
         command="medicine",
         description="Medicine check",
-        ability=character_models.CharacterAbility.WISDOM,
-        skill=character_models.CharacterSkill.MEDICINE,
+        roll_index=character_models.get_skill_check_roll_index(character_models.CharacterSkill.MEDICINE),
     ),
-    SkillCommandFactory(
+    RollCommand(
         command="nature",
         description="Nature check",
-        ability=character_models.CharacterAbility.INTELLIGENCE,
-        skill=character_models.CharacterSkill.NATURE,
+        roll_index=character_models.get_skill_check_roll_index(character_models.CharacterSkill.NATURE),
     ),
-    SkillCommandFactory(
+    RollCommand(
         command="perception",
         description="Perception check",
-        ability=character_models.CharacterAbility.WISDOM,
-        skill=character_models.CharacterSkill.PERCEPTION,
+        roll_index=character_models.get_skill_check_roll_index(character_models.CharacterSkill.PERCEPTION),
     ),
-    SkillCommandFactory(
+    RollCommand(
         command="performance",
         description="Performance check",
-        ability=character_models.CharacterAbility.CHARISMA,
-        skill=character_models.CharacterSkill.PERFORMANCE,
+        roll_index=character_models.get_skill_check_roll_index(character_models.CharacterSkill.PERFORMANCE),
     ),
-    SkillCommandFactory(
+    RollCommand(
         command="persuasion",
         description="Persuasion check",
-        ability=character_models.CharacterAbility.CHARISMA,
-        skill=character_models.CharacterSkill.PERSUASION,
+        roll_index=character_models.get_skill_check_roll_index(character_models.CharacterSkill.PERSUASION),
     ),
-    SkillCommandFactory(
+    RollCommand(
         command="religion",
         description="Religion check",
-        ability=character_models.CharacterAbility.INTELLIGENCE,
-        skill=character_models.CharacterSkill.RELIGION,
+        roll_index=character_models.get_skill_check_roll_index(character_models.CharacterSkill.RELIGION),
     ),
-    SkillCommandFactory(
+    RollCommand(
         command="sleight_of_hand",
         description="Sleight of Hand check",
-        ability=character_models.CharacterAbility.DEXTERITY,
-        skill=character_models.CharacterSkill.SLEIGHT_OF_HAND,
+        roll_index=character_models.get_skill_check_roll_index(character_models.CharacterSkill.SLEIGHT_OF_HAND),
     ),
-    SkillCommandFactory(
+    RollCommand(
         command="stealth",
         description="Stealth check",
-        ability=character_models.CharacterAbility.DEXTERITY,
-        skill=character_models.CharacterSkill.STEALTH,
+        roll_index=character_models.get_skill_check_roll_index(character_models.CharacterSkill.STEALTH),
     ),
-    SkillCommandFactory(
+    RollCommand(
         command="survival",
         description="Survival check",
-        ability=character_models.CharacterAbility.WISDOM,
-        skill=character_models.CharacterSkill.SURVIVAL,
+        roll_index=character_models.get_skill_check_roll_index(character_models.CharacterSkill.SURVIVAL),
     ),
 ]
 
 
-INITIATIVE_COMMAND_FACTORY = RollCommandFactory(
+INITIATIVE_COMMAND = RollCommand(
     command="initiative",
     description="Initiative check",
+    roll_index=character_models.INITIATIVE_ROLL_INDEX,
 )
 
-DEATH_SAVE_COMMAND_FACTORY = RollCommandFactory(
+DEATH_SAVE_COMMAND = RollCommand(
     command="death_save",
     description="Death saving throw",
+    roll_index=character_models.DEATH_SAVING_THROW_ROLL_INDEX,
 )
 
 
 @dataclasses.dataclass(frozen=True)
-class RollCommandHandler:
+class _ErrorReply:
+    text: str
+    parse_mode: str | None = None
+
+
+@dataclasses.dataclass(frozen=True)
+class RollCommandRouter:
     context_service: context_protocols.ContextServiceProtocol
     character_service: character_protocols.CharacterServiceProtocol
-    command: RollCommand
+    roll_service: character_services.RollService
+    commands: typing.Sequence[RollCommand]
+    reply_coalescer: aiogram_utils.ReplyCoalescer | None = None
 
-    async def process(self, message: aiogram.types.Message):
+    def __post_init__(self) -> None:
+        commands = [command.command for command in self.commands]
+        assert len(commands) == len(set(commands)), "Roll commands must be unique"
+
+    async def process(
+        self, message: aiogram.types.Message, roll_command: RollCommand
+    ) -> aiogram_methods.SendMessage | None:
         if message.from_user is None:
             logger.debug("message.from_user is None")
-            return
+            return None
 
         if message.from_user.is_bot:
             logger.debug("message.from_user.is_bot")
-            return
+            return None
+
+        character = await self._get_character(telegram_context.get_context_key_from_message(message))
+        if isinstance(character, _ErrorReply):
+            return message.reply(text=character.text, parse_mode=character.parse_mode)
+
+        roll_result = await self.roll_service.roll(character, roll_command.roll_index)
+        text = telegram_messages.ROLL_RESULT.format(details=roll_result.details, value=roll_result.value)
+
+        if self.reply_coalescer is None:
+            return message.reply(text)
+
+        self.reply_coalescer.add(
+            aiogram_utils.CoalescedReply(
+                message=message,
+                text=text,
+                line=telegram_messages.ROLL_RESULT_LINE.format(
+                    character_name=character.name,
+                    roll_description=roll_command.description,
+                    details=roll_result.details,
+                    value=roll_result.value,
+                ),
+            )
+        )
+        return None
+
+    async def process_callback_query(
+        self,
+        callback_query: aiogram_types.CallbackQuery,
+        roll_command: RollCommand,
+    ) -> aiogram_methods.TelegramMethod[typing.Any] | None:
+        """
+        Rolls a roll panel button for the user who pressed it and replies to the panel.
+        """
+        message = callback_query.message
+        if not isinstance(message, aiogram_types.Message):
+            logger.debug("callback_query.message is not accessible")
+            return callback_query.answer()
+
+        if callback_query.from_user.is_bot:
+            logger.debug("callback_query.from_user.is_bot")
+            return callback_query.answer()
+
+        character = await self._get_character(telegram_context.get_context_key_from_callback_query(callback_query))
+        if isinstance(character, _ErrorReply):
+            return callback_query.answer(text=character.text, show_alert=True)
+
+        roll_result = await self.roll_service.roll(character, roll_command.roll_index)
+        line = telegram_messages.ROLL_RESULT_LINE.format(
+            character_name=character.name,
+            roll_description=roll_command.description,
+            details=roll_result.details,
+            value=roll_result.value,
+        )
 
-        if message.text is None:
-            logger.debug("message.text is None")
-            return
+        # Stops the button loading indicator, the result itself is a reply to the panel
+        await callback_query.answer()
 
-        context_key = telegram_context.get_context_key_from_message(message)
+        if self.reply_coalescer is None:
+            return message.reply(line)
+
+        self.reply_coalescer.add(aiogram_utils.CoalescedReply(message=message, text=line, line=line))
+        return None
+
+    async def _get_character(self, context_key: str) -> character_models.Character | _ErrorReply:
         try:
             context = await self.context_service.get(key=context_key)
         except context_protocols.ContextServiceProtocol.NotFoundError:
-            await message.reply(
-                telegram_messages.CHARACTER_FETCH_NOT_SET,
+            return _ErrorReply(
+                text=telegram_messages.CHARACTER_FETCH_NOT_SET,
                 parse_mode=aiogram.enums.ParseMode.MARKDOWN_V2,
             )
-            return
 
         character_id = context.character_id
         try:
-            character = await self.character_service.get(entity_id=character_id)
+            return await self.character_service.get(entity_id=character_id)
         except character_protocols.CharacterServiceProtocol.NotFoundError:
-            await message.reply(text=telegram_messages.CHARACTER_FETCH_NOT_FOUND.format(character_id=character_id))
-            return
+            return _ErrorReply(text=telegram_messages.CHARACTER_FETCH_NOT_FOUND.format(character_id=character_id))
         except character_protocols.CharacterServiceProtocol.AccessError:
-            await message.reply(text=telegram_messages.CHARACTER_FETCH_NO_ACCESS.format(character_id=character_id))
-            return
+            return _ErrorReply(text=telegram_messages.CHARACTER_FETCH_NO_ACCESS.format(character_id=character_id))
         except character_protocols.CharacterServiceProtocol.RepositoryError:
-            await message.reply(text=telegram_messages.CHARACTER_FETCH_UNKNOWN_ERROR.format(character_id=character_id))
-            return
-
-        roll_result = await self.command.callback(character)
-
-        await message.reply(telegram_messages.ROLL_RESULT.format(details=roll_result.details, value=roll_result.value))
+            return _ErrorReply(text=telegram_messages.CHARACTER_FETCH_UNKNOWN_ERROR.format(character_id=character_id))
 
     @property
     def bot_commands(self) -> typing.Sequence[aiogram_types.BotCommand]:
-        return [
-            aiogram_types.BotCommand(
-                command=self.command.command,
-                description=self.command.description,
-            )
-        ]
+        return [command.bot_command for command in self.commands]
 
-    @property
-    def _command(self) -> aiogram_filters.Command:
-        return aiogram_filters.Command(commands=self.bot_commands)
+    @functools.cached_property
+    def callback_data_codec(self) -> aiogram_utils.CompactCallbackDataCodec[RollCommand]:
+        return aiogram_utils.CompactCallbackDataCodec[RollCommand](prefix="r", values=self.commands)
+
+    @functools.cached_property
+    def _filter(self) -> aiogram_utils.CommandTableMessageFilter[RollCommand]:
+        return aiogram_utils.CommandTableMessageFilter[RollCommand](
+            table={command.command: command for command in self.commands},
+            result_key="roll_command",
+        )
 
     @property
     def filters(self) -> typing.Sequence[aiogram_filters.Filter]:
-        return [self._command]
+        return [self._filter]
+
+    @functools.cached_property
+    def _callback_query_filter(self) -> aiogram_utils.CallbackDataTableFilter[RollCommand]:
+        return aiogram_utils.CallbackDataTableFilter[RollCommand](
+            table=self.callback_data_codec.table,
+            result_key="roll_command",
+        )
+
+    @property
+    def callback_query_filters(self) -> typing.Sequence[aiogram_filters.Filter]:
+        return [self._callback_query_filter]
 
 
 __all__ = [
-    "ABILITY_CHECK_COMMAND_FACTORIES",
-    "ABILITY_SAVE_COMMAND_FACTORIES",
-    "DEATH_SAVE_COMMAND_FACTORY",
-    "INITIATIVE_COMMAND_FACTORY",
-    "RollCommandHandler",
-    "SKILL_CHECK_COMMAND_FACTORIES",
+    "ABILITY_CHECK_COMMANDS",
+    "ABILITY_SAVE_COMMANDS",
+    "DEATH_SAVE_COMMAND",
+    "INITIATIVE_COMMAND",
+    "SKILL_CHECK_COMMANDS",
+    "RollCommand",
+    "RollCommandRouter",
 ]
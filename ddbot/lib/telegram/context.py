@@ -13,6 +13,21 @@ def get_context_key_from_message(message: aiogram_types.Message) -> str:
     return f"telegram_{message.from_user.id}_{message.chat.id}"
 
 
+def get_context_key_from_callback_query(callback_query: aiogram_types.CallbackQuery) -> str:
+    if not isinstance(callback_query.message, aiogram_types.Message):
+        logger.debug("callback_query.message is not accessible")
+        raise ValueError("callback_query.message is not accessible")
+
+    return f"telegram_{callback_query.from_user.id}_{callback_query.message.chat.id}"
+
+
+def get_context_key_from_inline_query(inline_query: aiogram_types.InlineQuery) -> str:
+    # Inline queries have no chat, the character set in the private chat with the bot is used
+    return f"telegram_{inline_query.from_user.id}_{inline_query.from_user.id}"
+
+
 __all__ = [
+    "get_context_key_from_callback_query",
+    "get_context_key_from_inline_query",
     "get_context_key_from_message",
 ]
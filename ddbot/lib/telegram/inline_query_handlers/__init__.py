@@ -0,0 +1 @@
+from .character import *
@@ -0,0 +1,169 @@
+import collections
+import dataclasses
+import logging
+import typing
+
+import aiogram.methods as aiogram_methods
+import aiogram.types as aiogram_types
+
+import lib.character.codec as character_codec
+import lib.character.models as character_models
+import lib.character.protocols as character_protocols
+import lib.context.protocols as context_protocols
+import lib.telegram.command_handlers.roll as roll_command_handlers
+import lib.telegram.context as telegram_context
+import lib.telegram.messages as telegram_messages
+
+logger = logging.getLogger(__name__)
+
+ERROR_CACHE_TIME_SECONDS = 10
+
+
+@dataclasses.dataclass(frozen=True)
+class CharacterInlineQuerySection:
+    id: str
+    title: str
+    commands: typing.Sequence[roll_command_handlers.RollCommand]
+
+
+CHARACTER_INLINE_QUERY_SECTIONS: list[CharacterInlineQuerySection] = [
+    CharacterInlineQuerySection(
+        id="checks",
+        title="Ability checks",
+        commands=[*roll_command_handlers.ABILITY_CHECK_COMMANDS, roll_command_handlers.INITIATIVE_COMMAND],
+    ),
+    CharacterInlineQuerySection(
+        id="saves",
+        title="Saving throws",
+        commands=[*roll_command_handlers.ABILITY_SAVE_COMMANDS, roll_command_handlers.DEATH_SAVE_COMMAND],
+    ),
+    CharacterInlineQuerySection(
+        id="skills",
+        title="Skill checks",
+        commands=roll_command_handlers.SKILL_CHECK_COMMANDS,
+    ),
+]
+
+
+@dataclasses.dataclass(frozen=True)
+class CharacterInlineQueryHandler:
+    """
+    Answers `@bot [character_id]` with the modifiers of the given or the privately set character.
+    Rendered results are memoized by the encoded character, so they are reused until the character changes.
+    """
+
+    context_service: context_protocols.ContextServiceProtocol
+    character_service: character_protocols.CharacterServiceProtocol
+    sections: typing.Sequence[CharacterInlineQuerySection] = dataclasses.field(
+        default_factory=lambda: CHARACTER_INLINE_QUERY_SECTIONS
+    )
+    cache_time_seconds: int = 300
+    max_memoized_characters: int = 1000
+
+    _results: collections.OrderedDict[bytes, list[aiogram_types.InlineQueryResultArticle]] = dataclasses.field(
+        init=False,
+        default_factory=collections.OrderedDict,
+    )
+
+    def _render_results(self, character: character_models.Character) -> list[aiogram_types.InlineQueryResultArticle]:
+        results: list[aiogram_types.InlineQueryResultArticle] = []
+
+        for section in self.sections:
+            lines = [
+                telegram_messages.INLINE_QUERY_RESULT_LINE.format(
+                    roll_description=command.description,
+                    modifier=character.roll_modifiers[command.roll_index],
+                )
+                for command in section.commands
+            ]
+            results.append(
+                aiogram_types.InlineQueryResultArticle(
+                    id=section.id,
+                    title=telegram_messages.INLINE_QUERY_RESULT_TITLE.format(
+                        character_name=character.name,
+                        section_title=section.title,
+                    ),
+                    description=", ".join(lines),
+                    input_message_content=aiogram_types.InputTextMessageContent(
+                        message_text=telegram_messages.INLINE_QUERY_RESULT_TEXT.format(
+                            character_name=character.name,
+                            section_title=section.title,
+                            lines="\n".join(lines),
+                        ),
+                    ),
+                )
+            )
+
+        return results
+
+    def _get_results(self, character: character_models.Character) -> list[aiogram_types.InlineQueryResultArticle]:
+        try:
+            version = character_codec.CharacterCodec.encode(character)
+        except character_codec.CharacterCodec.EncodeError:
+            logger.warning("Failed to encode character %s, rendering without memoization", character.id)
+            return self._render_results(character)
+
+        results = self._results.get(version)
+        if results is not None:
+            self._results.move_to_end(version)
+            return results
+
+        results = self._render_results(character)
+        self._results[version] = results
+        if len(self._results) > self.max_memoized_characters:
+            self._results.popitem(last=False)
+
+        return results
+
+    async def _get_character_id(self, inline_query: aiogram_types.InlineQuery) -> int | None:
+        query = inline_query.query.strip()
+        if query.isdigit():
+            return int(query)
+
+        try:
+            context = await self.context_service.get(
+                key=telegram_context.get_context_key_from_inline_query(inline_query),
+            )
+        except context_protocols.ContextServiceProtocol.NotFoundError:
+            return None
+
+        return context.character_id
+
+    def _answer_error(self, inline_query: aiogram_types.InlineQuery) -> aiogram_methods.AnswerInlineQuery:
+        return inline_query.answer(
+            results=[],
+            cache_time=ERROR_CACHE_TIME_SECONDS,
+            is_personal=True,
+            button=aiogram_types.InlineQueryResultsButton(
+                text=telegram_messages.INLINE_QUERY_SET_CHARACTER,
+                start_parameter="inline",
+            ),
+        )
+
+    async def process(self, inline_query: aiogram_types.InlineQuery) -> aiogram_methods.AnswerInlineQuery | None:
+        if inline_query.from_user.is_bot:
+            logger.debug("inline_query.from_user.is_bot")
+            return None
+
+        character_id = await self._get_character_id(inline_query)
+        if character_id is None:
+            return self._answer_error(inline_query)
+
+        try:
+            character = await self.character_service.get(entity_id=character_id)
+        except character_protocols.CharacterServiceProtocol.BaseError:
+            logger.debug("Failed to get character %s for inline query", character_id)
+            return self._answer_error(inline_query)
+
+        return inline_query.answer(
+            results=self._get_results(character),
+            cache_time=self.cache_time_seconds,
+            is_personal=True,
+        )
+
+
+__all__ = [
+    "CHARACTER_INLINE_QUERY_SECTIONS",
+    "CharacterInlineQueryHandler",
+    "CharacterInlineQuerySection",
+]
@@ -6,6 +6,12 @@ CHARACTER_FETCH_NOT_SET = "Character is not set, use `/character_set <character_
 CHARACTER_FETCH_NOT_FOUND = "Character not found: {character_id}. Please check that character_id is correct."
 CHARACTER_FETCH_UNKNOWN_ERROR = "Unknown error while fetching character: {character_id}"
 
+CAMPAIGN_FETCH_NO_ACCESS = "Campaign access error: {campaign_id}."
+CAMPAIGN_FETCH_NOT_FOUND = "Campaign not found: {campaign_id}. Please check that campaign_id is correct."
+CAMPAIGN_FETCH_UNKNOWN_ERROR = "Unknown error while fetching campaign: {campaign_id}"
+
+THROTTLED = "Too many commands, please slow down"
+
 # Commands:
 CHARACTER_SET_NO_ARGS = "Usage: /character_set <character_id>"
 CHARACTER_SET_INVALID_ARGS = "Invalid character_id '{character_id}', expected integer"
@@ -13,4 +19,20 @@ CHARACTER_SET_SUCCESS = "Current character updated: {character_name}"
 
 CHARACTER_CACHE_CLEAR_SUCCESS = "Character cache cleared"
 
+CAMPAIGN_SET_NO_ARGS = "Usage: /campaign_set <campaign_id>"
+CAMPAIGN_SET_INVALID_ARGS = "Invalid campaign_id '{campaign_id}', expected integer"
+CAMPAIGN_SET_NOT_ADMIN = "Only chat administrators can import campaigns"
+CAMPAIGN_SET_SUCCESS = "Campaign imported, players can now bind their characters:\n{characters}"
+CAMPAIGN_SET_CHARACTER = "{character_name} ({user_name}): /character_set {character_id}"
+CAMPAIGN_SET_CHARACTER_FAILED = "{character_name} ({user_name}): failed to fetch character {character_id}"
+
+ROLL_PANEL = "Choose a roll:"
+ROLL_PANEL_UNKNOWN_LAYOUT = "Unknown panel '{layout}', expected one of: {layouts}"
+
+INLINE_QUERY_SET_CHARACTER = "Set your character"
+INLINE_QUERY_RESULT_TITLE = "{character_name}: {section_title}"
+INLINE_QUERY_RESULT_TEXT = "{character_name}, {section_title}:\n{lines}"
+INLINE_QUERY_RESULT_LINE = "{roll_description}: {modifier:+d}"
+
 ROLL_RESULT = "{details}={value}"
+ROLL_RESULT_LINE = "{character_name}, {roll_description}: {details}={value}"
@@ -1,3 +1,13 @@
+from .callback_data import *
+from .coalescing import *
+from .dedup import *
 from .filters import *
 from .lifecycle import *
 from .messages import *
+from .polling import *
+from .prefilter import *
+from .scheduler import *
+from .session import *
+from .setup_lock import *
+from .throttling import *
+from .webhook import *
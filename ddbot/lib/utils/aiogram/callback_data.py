@@ -0,0 +1,58 @@
+import dataclasses
+import functools
+import string
+import typing
+
+T = typing.TypeVar("T", bound=typing.Hashable)
+
+ALPHABET = string.digits + string.ascii_letters
+
+
+@dataclasses.dataclass(frozen=True)
+class CompactCallbackDataCodec(typing.Generic[T]):
+    """
+    Encodes each of `values` as `prefix` followed by its index in the fewest fixed-width base62 digits,
+    e.g. `r0`..`rv` for 32 values, and decodes callback data back with a single table lookup.
+    """
+
+    prefix: str
+    values: typing.Sequence[T]
+
+    def __post_init__(self) -> None:
+        assert len(self.values) > 0, "values must not be empty"
+        assert len(set(self.values)) == len(self.values), "values must be unique"
+
+    @functools.cached_property
+    def _width(self) -> int:
+        width = 1
+        while len(ALPHABET) ** width < len(self.values):
+            width += 1
+
+        return width
+
+    def _encode_index(self, index: int) -> str:
+        digits: list[str] = []
+        for _ in range(self._width):
+            index, digit = divmod(index, len(ALPHABET))
+            digits.append(ALPHABET[digit])
+
+        return self.prefix + "".join(reversed(digits))
+
+    @functools.cached_property
+    def table(self) -> typing.Mapping[str, T]:
+        return {self._encode_index(index): value for index, value in enumerate(self.values)}
+
+    @functools.cached_property
+    def _reverse_table(self) -> typing.Mapping[T, str]:
+        return {value: data for data, value in self.table.items()}
+
+    def encode(self, value: T) -> str:
+        return self._reverse_table[value]
+
+    def decode(self, data: str) -> T | None:
+        return self.table.get(data)
+
+
+__all__ = [
+    "CompactCallbackDataCodec",
+]
@@ -0,0 +1,104 @@
+import asyncio
+import dataclasses
+import logging
+
+import aiogram
+import aiogram.methods as aiogram_methods
+import aiogram.types as aiogram_types
+
+import lib.utils.lifecycle as lifecycle_utils
+
+
+@dataclasses.dataclass(frozen=True)
+class CoalescedReply:
+    message: aiogram_types.Message
+    text: str
+    line: str
+
+
+@dataclasses.dataclass
+class _Batch:
+    replies: list[CoalescedReply] = dataclasses.field(default_factory=list)
+    window_task: lifecycle_utils.Task | None = None
+
+
+@dataclasses.dataclass
+class ReplyCoalescer:
+    """
+    Collects replies to one chat for `window_seconds` and sends them as a single message of reply lines.
+    A reply left alone in its window is sent as a regular reply with its own text.
+    """
+
+    logger: logging.Logger
+    bot: aiogram.Bot
+    window_seconds: float = 0.3
+    max_replies: int = 20
+
+    _batches: dict[int, _Batch] = dataclasses.field(init=False, default_factory=dict)
+    _tasks: set[lifecycle_utils.Task] = dataclasses.field(init=False, default_factory=set)
+
+    def _create_task(self, chat_id: int, batch: _Batch, delay: float) -> lifecycle_utils.Task:
+        task = asyncio.create_task(self._flush(chat_id, batch, delay), name=f"telegram_reply_coalescer_{chat_id}")
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+        return task
+
+    def _flush_now(self, chat_id: int, batch: _Batch) -> None:
+        del self._batches[chat_id]
+        if batch.window_task is not None:
+            batch.window_task.cancel()
+
+        self._create_task(chat_id, batch, 0)
+
+    def add(self, reply: CoalescedReply) -> None:
+        chat_id = reply.message.chat.id
+
+        batch = self._batches.get(chat_id)
+        if batch is None:
+            batch = _Batch()
+            batch.window_task = self._create_task(chat_id, batch, self.window_seconds)
+            self._batches[chat_id] = batch
+
+        batch.replies.append(reply)
+
+        if len(batch.replies) >= self.max_replies:
+            self._flush_now(chat_id, batch)
+
+    def _build_method(self, chat_id: int, replies: list[CoalescedReply]) -> aiogram_methods.SendMessage:
+        if len(replies) == 1:
+            return replies[0].message.reply(text=replies[0].text)
+
+        return aiogram_methods.SendMessage(
+            chat_id=chat_id,
+            message_thread_id=replies[0].message.message_thread_id,
+            text="\n".join(reply.line for reply in replies),
+        )
+
+    async def _flush(self, chat_id: int, batch: _Batch, delay: float) -> None:
+        await asyncio.sleep(delay)
+
+        if self._batches.get(chat_id) is batch:
+            del self._batches[chat_id]
+
+        try:
+            await self.bot(self._build_method(chat_id, batch.replies))
+        except Exception:
+            self.logger.exception("Failed to send %s coalesced replies to chat %s", len(batch.replies), chat_id)
+        else:
+            self.logger.debug("Sent %s coalesced replies to chat %s", len(batch.replies), chat_id)
+
+    async def drain(self) -> None:
+        """
+        Sends pending replies without waiting for their windows to close.
+        """
+        for chat_id, batch in list(self._batches.items()):
+            self._flush_now(chat_id, batch)
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+__all__ = [
+    "CoalescedReply",
+    "ReplyCoalescer",
+]
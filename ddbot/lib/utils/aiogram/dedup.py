@@ -0,0 +1,97 @@
+import collections
+import dataclasses
+import logging
+import typing
+
+import redis.asyncio as redis_asyncio
+
+KEY_PREFIX = "telegram_update:"
+
+
+class UpdateDeduplicatorProtocol(typing.Protocol):
+    async def is_new(self, update_id: int) -> bool: ...
+
+    async def release(self, update_id: int) -> None:
+        """
+        Forgets an update that was claimed but not accepted, so its redelivery is processed.
+        """
+
+
+@dataclasses.dataclass
+class LocalUpdateDeduplicator(UpdateDeduplicatorProtocol):
+    """
+    Remembers the last `window_size` update ids of a single process.
+    """
+
+    window_size: int = 10_000
+
+    _seen: set[int] = dataclasses.field(init=False, default_factory=set)
+    _order: collections.deque[int] = dataclasses.field(init=False, default_factory=collections.deque)
+
+    def __post_init__(self) -> None:
+        assert self.window_size > 0, "window_size must be positive"
+
+    def check_and_add(self, update_id: int) -> bool:
+        if update_id in self._seen:
+            return False
+
+        self._seen.add(update_id)
+        self._order.append(update_id)
+        if len(self._order) > self.window_size:
+            self._seen.discard(self._order.popleft())
+
+        return True
+
+    def discard(self, update_id: int) -> None:
+        self._seen.discard(update_id)
+
+    async def is_new(self, update_id: int) -> bool:
+        return self.check_and_add(update_id)
+
+    async def release(self, update_id: int) -> None:
+        self.discard(update_id)
+
+
+@dataclasses.dataclass
+class RedisUpdateDeduplicator(UpdateDeduplicatorProtocol):
+    """
+    Claims update ids with `SET NX` shared by all replicas of a bot, after a local check
+    that answers redeliveries to the same process without a round trip.
+    Redis errors let the update through.
+    """
+
+    logger: logging.Logger
+    redis_client: redis_asyncio.Redis
+    bot_id: int
+    ttl_seconds: int = 60 * 60
+    local: LocalUpdateDeduplicator = dataclasses.field(default_factory=LocalUpdateDeduplicator)
+
+    def _get_full_key(self, update_id: int) -> str:
+        return f"{KEY_PREFIX}{self.bot_id}:{update_id}"
+
+    async def is_new(self, update_id: int) -> bool:
+        if not self.local.check_and_add(update_id):
+            return False
+
+        try:
+            result = await self.redis_client.set(self._get_full_key(update_id), 1, nx=True, ex=self.ttl_seconds)
+        except Exception:
+            self.logger.exception("Failed to claim update %s, processing it anyway", update_id)
+            return True
+
+        return bool(result)
+
+    async def release(self, update_id: int) -> None:
+        self.local.discard(update_id)
+
+        try:
+            await self.redis_client.delete(self._get_full_key(update_id))
+        except Exception:
+            self.logger.exception("Failed to release update %s", update_id)
+
+
+__all__ = [
+    "LocalUpdateDeduplicator",
+    "RedisUpdateDeduplicator",
+    "UpdateDeduplicatorProtocol",
+]
@@ -1 +1,2 @@
+from .callback_query import *
 from .message import *
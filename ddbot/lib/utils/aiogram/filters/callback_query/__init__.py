@@ -0,0 +1 @@
+from .data import *
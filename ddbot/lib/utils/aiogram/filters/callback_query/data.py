@@ -0,0 +1,33 @@
+import dataclasses
+import typing
+
+import aiogram.filters as aiogram_filters
+import aiogram.types as aiogram_types
+
+T = typing.TypeVar("T")
+
+
+@dataclasses.dataclass(frozen=True)
+class CallbackDataTableFilter(aiogram_filters.Filter, typing.Generic[T]):
+    """
+    Matches callback data against a table with a single dict lookup
+    and passes the matched table value to the handler as `result_key` keyword argument.
+    """
+
+    table: typing.Mapping[str, T]
+    result_key: str
+
+    async def __call__(self, callback_query: aiogram_types.CallbackQuery) -> bool | dict[str, typing.Any]:
+        if callback_query.data is None:
+            return False
+
+        value = self.table.get(callback_query.data)
+        if value is None:
+            return False
+
+        return {self.result_key: value}
+
+
+__all__ = [
+    "CallbackDataTableFilter",
+]
@@ -1 +1,2 @@
+from .command import *
 from .sender import *
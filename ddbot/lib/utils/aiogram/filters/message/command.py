@@ -0,0 +1,69 @@
+import dataclasses
+import logging
+import typing
+
+import aiogram
+import aiogram.filters as aiogram_filters
+import aiogram.types as aiogram_types
+
+default_logger = logging.getLogger("aiogram.filters")
+
+
+def get_command_text(message: aiogram_types.Message) -> str | None:
+    """
+    Commands may come in a text message or in a media caption.
+    """
+    return message.text if message.text is not None else message.caption
+
+
+def split_command(text: str, prefix: str = "/") -> tuple[str, str] | None:
+    """
+    Splits `/command[@mention] [args]` text into command and mention, returns None for non-command text.
+    """
+    if not text.startswith(prefix):
+        return None
+
+    command, _, mention = text.split(maxsplit=1)[0][len(prefix) :].partition("@")
+    return command, mention
+
+
+@dataclasses.dataclass(frozen=True)
+class CommandTableMessageFilter[T](aiogram_filters.Filter):
+    """
+    Matches `/command[@mention] [args]` against a table of commands with a single dict lookup
+    and passes the matched table value to the handler as `result_key` keyword argument.
+    """
+
+    table: typing.Mapping[str, T]
+    result_key: str
+    prefix: str = "/"
+    logger: logging.Logger = default_logger
+
+    async def __call__(self, message: aiogram_types.Message, bot: aiogram.Bot) -> bool | dict[str, typing.Any]:
+        text = get_command_text(message)
+        if text is None:
+            return False
+
+        split = split_command(text, self.prefix)
+        if split is None:
+            return False
+
+        command, mention = split
+        value = self.table.get(command)
+        if value is None:
+            return False
+
+        if mention:
+            me = await bot.me()
+            if me.username and mention.lower() != me.username.lower():
+                self.logger.debug("Command mention did not match: %s", mention)
+                return False
+
+        return {self.result_key: value}
+
+
+__all__ = [
+    "CommandTableMessageFilter",
+    "get_command_text",
+    "split_command",
+]
@@ -1,9 +1,12 @@
 import asyncio
 import dataclasses
+import hashlib
 import logging
 
 import aiogram
 
+import lib.utils.aiogram.setup_lock as setup_lock_utils
+import lib.utils.json as json_utils
 import lib.utils.lifecycle as lifecycle_utils
 
 
@@ -14,6 +17,7 @@ class Lifecycle:
     class Webhook:
         url: str
         secret_token: str
+        max_connections: int | None = None
 
     logger: logging.Logger
     bot: aiogram.Bot
@@ -24,6 +28,22 @@ class Lifecycle:
     short_description: str
     commands: list[aiogram.types.BotCommand]
     webhook: Webhook | None = None
+    setup_lock: setup_lock_utils.SetupLockProtocol | None = None
+
+    def get_fingerprint(self) -> str:
+        """
+        Hash of everything the setup sends to telegram, changes whenever the setup has to be performed again.
+        """
+        data = {
+            "name": self.name,
+            "description": self.description,
+            "short_description": self.short_description,
+            "commands": [command.model_dump(mode="json") for command in self.commands],
+            "webhook": dataclasses.asdict(self.webhook) if self.webhook is not None else None,
+            "allowed_updates": self.dispatcher.resolve_used_update_types(),
+        }
+
+        return hashlib.sha256(json_utils.dumps_bytes(data)).hexdigest()[:16]
 
     async def setup_telegram_bot_name(self) -> None:
         name = await self.bot.get_my_name()
@@ -59,35 +79,81 @@ class Lifecycle:
             await self.bot.delete_webhook()
             return
 
-        self.logger.info(f"Setting telegram webhook url to {self.webhook.url}")
-        await self.bot.set_webhook(url=self.webhook.url, secret_token=self.webhook.secret_token)
+        allowed_updates = self.dispatcher.resolve_used_update_types()
+        self.logger.info(f"Setting telegram webhook url to {self.webhook.url} for updates {allowed_updates}")
+        await self.bot.set_webhook(
+            url=self.webhook.url,
+            secret_token=self.webhook.secret_token,
+            allowed_updates=allowed_updates,
+            max_connections=self.webhook.max_connections,
+        )
+
+    async def setup_telegram(self) -> None:
+        await asyncio.gather(
+            self.setup_telegram_bot_name(),
+            self.setup_telegram_bot_description(),
+            self.setup_telegram_bot_short_description(),
+            self.setup_telegram_bot_commands(),
+            self.setup_telegram_webhook(),
+        )
+
+    async def setup_telegram_once(self) -> None:
+        assert self.setup_lock is not None
+
+        fingerprint = self.get_fingerprint()
+        if not await self.setup_lock.acquire(fingerprint):
+            self.logger.info(f"Telegram setup {fingerprint} is done or in progress by another replica, skipping")
+            return
+
+        try:
+            await self.setup_telegram()
+        except BaseException:
+            await self.setup_lock.release(fingerprint)
+            raise
+
+        await self.setup_lock.complete(fingerprint)
 
     def get_startup_callbacks(self) -> list[lifecycle_utils.Callback]:
+        if self.setup_lock is not None:
+            return [
+                lifecycle_utils.Callback(
+                    awaitable=self.setup_telegram_once(),
+                    error_message="Failed to set up telegram bot",
+                    success_message="Telegram bot setup has been checked",
+                    name=f"telegram_{self.bot.id}_setup",
+                ),
+            ]
+
         return [
             lifecycle_utils.Callback(
                 awaitable=self.setup_telegram_bot_name(),
                 error_message="Failed to set telegram bot name",
                 success_message="Telegram bot name has been set",
+                name=f"telegram_{self.bot.id}_name",
             ),
             lifecycle_utils.Callback(
                 awaitable=self.setup_telegram_bot_description(),
                 error_message="Failed to set telegram bot description",
                 success_message="Telegram bot description has been set",
+                name=f"telegram_{self.bot.id}_description",
             ),
             lifecycle_utils.Callback(
                 awaitable=self.setup_telegram_bot_short_description(),
                 error_message="Failed to set telegram bot short description",
                 success_message="Telegram bot short description has been set",
+                name=f"telegram_{self.bot.id}_short_description",
             ),
             lifecycle_utils.Callback(
                 awaitable=self.setup_telegram_bot_commands(),
                 error_message="Failed to set telegram bot commands",
                 success_message="Telegram bot commands have been set",
+                name=f"telegram_{self.bot.id}_commands",
             ),
             lifecycle_utils.Callback(
                 awaitable=self.setup_telegram_webhook(),
                 error_message="Failed to set telegram webhook",
                 success_message="Telegram webhook has been set",
+                name=f"telegram_{self.bot.id}_webhook",
             ),
         ]
 
@@ -100,12 +166,6 @@ class Lifecycle:
             )
         ]
 
-    def get_main_task(self) -> lifecycle_utils.Task:
-        return asyncio.create_task(
-            coro=self.dispatcher.start_polling(self.bot),
-            name="aiogram_bot",
-        )
-
 
 __all__ = [
     "Lifecycle",
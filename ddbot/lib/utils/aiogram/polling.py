@@ -0,0 +1,147 @@
+import asyncio
+import dataclasses
+import logging
+import typing
+
+import aiogram
+import aiogram.methods as aiogram_methods
+import aiogram.types as aiogram_types
+import aiogram.utils.backoff as aiogram_backoff
+
+import lib.utils.lifecycle as lifecycle_utils
+
+
+def get_update_shard_key(update: aiogram_types.Update) -> int:
+    event = update.event
+
+    chat = getattr(event, "chat", None)
+    if isinstance(chat, aiogram_types.Chat):
+        return chat.id
+
+    # Callback queries carry the chat in the (possibly inaccessible) message
+    message_chat = getattr(getattr(event, "message", None), "chat", None)
+    if isinstance(message_chat, aiogram_types.Chat):
+        return message_chat.id
+
+    from_user = getattr(event, "from_user", None)
+    if isinstance(from_user, aiogram_types.User):
+        return from_user.id
+
+    return update.update_id
+
+
+@dataclasses.dataclass
+class ShardedPolling:
+    """
+    Long-polls updates and fans them out to workers sharded by chat id:
+    updates of one chat are processed in order, different chats in parallel.
+    """
+
+    logger: logging.Logger
+    bot: aiogram.Bot
+    dispatcher: aiogram.Dispatcher
+    workers_count: int = 8
+    shard_queue_size: int = 100
+    polling_timeout_seconds: int = 10
+    allowed_updates: list[str] | None = None
+    backoff_config: aiogram_backoff.BackoffConfig = dataclasses.field(
+        default_factory=lambda: aiogram_backoff.BackoffConfig(min_delay=1.0, max_delay=5.0, factor=1.3, jitter=0.1),
+    )
+
+    _queues: list[asyncio.Queue[aiogram_types.Update]] = dataclasses.field(init=False)
+    _poll_task: lifecycle_utils.Task | None = dataclasses.field(init=False, default=None)
+    _last_update_id: int | None = dataclasses.field(init=False, default=None)
+
+    def __post_init__(self) -> None:
+        assert self.workers_count > 0, "workers_count must be positive"
+        assert self.shard_queue_size > 0, "shard_queue_size must be positive"
+
+        self._queues = [asyncio.Queue(maxsize=self.shard_queue_size) for _ in range(self.workers_count)]
+
+    async def _listen_updates(self) -> typing.AsyncGenerator[aiogram_types.Update, None]:
+        backoff = aiogram_backoff.Backoff(config=self.backoff_config)
+        get_updates = aiogram_methods.GetUpdates(
+            timeout=self.polling_timeout_seconds,
+            allowed_updates=self.allowed_updates,
+        )
+        # Long polling request must outlive the polling timeout
+        request_timeout = int(self.bot.session.timeout + self.polling_timeout_seconds)
+
+        while True:
+            try:
+                updates = await self.bot(get_updates, request_timeout=request_timeout)
+            except Exception as e:
+                self.logger.warning(
+                    "Failed to fetch updates - %s: %s, retrying in %.2f seconds",
+                    type(e).__name__,
+                    e,
+                    backoff.next_delay,
+                )
+                await backoff.asleep()
+                continue
+
+            backoff.reset()
+            for update in updates:
+                yield update
+                # Offset confirms the update to Telegram on the next request
+                get_updates.offset = update.update_id + 1
+
+    async def _poll(self) -> None:
+        async for update in self._listen_updates():
+            shard = get_update_shard_key(update) % self.workers_count
+            # Blocks polling when a shard is full, Telegram keeps the rest of the updates
+            await self._queues[shard].put(update)
+            self._last_update_id = update.update_id
+
+    async def _process(self, update: aiogram_types.Update) -> None:
+        result = await self.dispatcher.feed_update(bot=self.bot, update=update)
+
+        if isinstance(result, aiogram_methods.TelegramMethod):
+            await self.dispatcher.silent_call_request(bot=self.bot, result=result)
+
+    async def _work(self, queue: asyncio.Queue[aiogram_types.Update]) -> None:
+        while True:
+            update = await queue.get()
+
+            try:
+                await self._process(update)
+            except Exception:
+                self.logger.exception("Failed to process polled update %s", update.update_id)
+            finally:
+                queue.task_done()
+
+    async def _confirm_updates(self) -> None:
+        if self._last_update_id is None:
+            return
+
+        # Telegram forgets updates only when asked for the next offset
+        await self.bot(aiogram_methods.GetUpdates(offset=self._last_update_id + 1, limit=1, timeout=0))
+
+    async def drain(self) -> None:
+        """
+        Stops polling, waits for queued updates to be processed and confirms them to Telegram.
+        """
+        if self._poll_task is not None:
+            await lifecycle_utils.cancel_task(self._poll_task)
+
+        for queue in self._queues:
+            await queue.join()
+
+        await self._confirm_updates()
+
+    def get_main_tasks(self) -> list[lifecycle_utils.Task]:
+        self._poll_task = asyncio.create_task(coro=self._poll(), name="telegram_polling")
+
+        return [
+            self._poll_task,
+            *(
+                asyncio.create_task(coro=self._work(queue), name=f"telegram_polling_worker_{index}")
+                for index, queue in enumerate(self._queues)
+            ),
+        ]
+
+
+__all__ = [
+    "ShardedPolling",
+    "get_update_shard_key",
+]
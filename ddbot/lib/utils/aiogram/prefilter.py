@@ -0,0 +1,35 @@
+import dataclasses
+import typing
+
+import lib.utils.aiogram.filters as aiogram_filters
+
+RawUpdate = dict[str, typing.Any]
+
+
+@dataclasses.dataclass(frozen=True)
+class CommandUpdatePrefilter:
+    """
+    Checks raw message updates for a known `/command[@mention]` token before they are validated into models.
+    Updates of other types are passed through.
+    """
+
+    commands: frozenset[str]
+    prefix: str = "/"
+
+    def __call__(self, update: RawUpdate) -> bool:
+        message = update.get("message")
+        if message is None:
+            return True
+
+        text = message.get("text", message.get("caption"))
+        if not isinstance(text, str):
+            return False
+
+        split = aiogram_filters.split_command(text, self.prefix)
+        return split is not None and split[0] in self.commands
+
+
+__all__ = [
+    "CommandUpdatePrefilter",
+    "RawUpdate",
+]
@@ -0,0 +1,183 @@
+import asyncio
+import collections
+import dataclasses
+import logging
+import time
+
+import aiogram
+import aiogram.client.session.middlewares.base as aiogram_session_middlewares
+import aiogram.exceptions as aiogram_exceptions
+import aiogram.methods as aiogram_methods
+
+import lib.utils.lifecycle as lifecycle_utils
+import lib.utils.rate_limit as rate_limit_utils
+
+ChatId = int | str
+
+
+@dataclasses.dataclass
+class _ChatState:
+    bucket: rate_limit_utils.TokenBucket
+    waiters: collections.deque[asyncio.Future[None]] = dataclasses.field(default_factory=collections.deque)
+    paused_until: float = 0
+
+
+@dataclasses.dataclass
+class OutboundRateScheduler(aiogram_session_middlewares.BaseRequestMiddleware):
+    """
+    Paces chat-bound Bot API requests with a global token bucket and per-chat buckets,
+    granting chats in round-robin order so a busy chat cannot starve the others.
+    """
+
+    logger: logging.Logger
+    global_rate: float = 30
+    global_burst: float = 30
+    private_chat_rate: float = 1
+    group_chat_rate: float = 20 / 60
+    chat_burst: float = 3
+    max_retries: int = 3
+    idle_chat_ttl_seconds: float = 300
+
+    _global_bucket: rate_limit_utils.TokenBucket = dataclasses.field(init=False)
+    _chats: dict[ChatId, _ChatState] = dataclasses.field(init=False, default_factory=dict)
+    _ready_chat_ids: collections.deque[ChatId] = dataclasses.field(init=False, default_factory=collections.deque)
+    _wakeup: asyncio.Event = dataclasses.field(init=False, default_factory=asyncio.Event)
+
+    def __post_init__(self) -> None:
+        self._global_bucket = rate_limit_utils.TokenBucket(rate=self.global_rate, capacity=self.global_burst)
+
+    def _get_chat(self, chat_id: ChatId) -> _ChatState:
+        chat = self._chats.get(chat_id)
+        if chat is None:
+            # Negative ids and @channel usernames are groups and channels
+            is_private = isinstance(chat_id, int) and chat_id > 0
+            chat = _ChatState(
+                bucket=rate_limit_utils.TokenBucket(
+                    rate=self.private_chat_rate if is_private else self.group_chat_rate,
+                    capacity=self.chat_burst,
+                ),
+            )
+            self._chats[chat_id] = chat
+
+        return chat
+
+    async def _acquire(self, chat_id: ChatId) -> None:
+        chat = self._get_chat(chat_id)
+        waiter = asyncio.get_running_loop().create_future()
+
+        if not chat.waiters:
+            self._ready_chat_ids.append(chat_id)
+        chat.waiters.append(waiter)
+        self._wakeup.set()
+
+        await waiter
+
+    def _pause(self, chat_id: ChatId, retry_after: float) -> None:
+        chat = self._get_chat(chat_id)
+        chat.paused_until = max(chat.paused_until, time.monotonic() + retry_after)
+
+    def _get_chat_delay(self, chat: _ChatState, now: float) -> float:
+        return max(chat.paused_until - now, chat.bucket.get_delay())
+
+    def _grant_next(self) -> float | None:
+        """
+        Grants one waiter of the first chat in round-robin order that is allowed to send.
+        Returns None after a grant, otherwise the delay until the next grant is possible.
+        """
+        global_delay = self._global_bucket.get_delay()
+        if global_delay > 0:
+            return global_delay
+
+        now = time.monotonic()
+        min_delay = float("inf")
+        for _ in range(len(self._ready_chat_ids)):
+            chat_id = self._ready_chat_ids[0]
+            chat = self._chats[chat_id]
+
+            while chat.waiters and chat.waiters[0].done():
+                chat.waiters.popleft()
+            if not chat.waiters:
+                self._ready_chat_ids.popleft()
+                continue
+
+            chat_delay = self._get_chat_delay(chat, now)
+            if chat_delay > 0:
+                min_delay = min(min_delay, chat_delay)
+                self._ready_chat_ids.rotate(-1)
+                continue
+
+            self._global_bucket.try_acquire()
+            chat.bucket.try_acquire()
+            chat.waiters.popleft().set_result(None)
+
+            self._ready_chat_ids.popleft()
+            if chat.waiters:
+                self._ready_chat_ids.append(chat_id)
+
+            return None
+
+        return min_delay
+
+    def _prune_idle_chats(self) -> None:
+        now = time.monotonic()
+        idle_chat_ids = [
+            chat_id
+            for chat_id, chat in self._chats.items()
+            if not chat.waiters and chat.paused_until < now and chat.bucket.get_delay(chat.bucket.capacity) == 0
+        ]
+
+        for chat_id in idle_chat_ids:
+            del self._chats[chat_id]
+
+    async def run(self) -> None:
+        pruned_at = time.monotonic()
+
+        while True:
+            if time.monotonic() - pruned_at > self.idle_chat_ttl_seconds:
+                self._prune_idle_chats()
+                pruned_at = time.monotonic()
+
+            if not self._ready_chat_ids:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            delay = self._grant_next()
+            if delay is None:
+                continue
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except TimeoutError:
+                pass
+
+    def get_main_task(self) -> lifecycle_utils.Task:
+        return asyncio.create_task(coro=self.run(), name="telegram_outbound_rate_scheduler")
+
+    async def __call__(
+        self,
+        make_request: aiogram_session_middlewares.NextRequestMiddlewareType[aiogram_methods.base.TelegramType],
+        bot: aiogram.Bot,
+        method: aiogram_methods.TelegramMethod[aiogram_methods.base.TelegramType],
+    ) -> aiogram_methods.Response[aiogram_methods.base.TelegramType]:
+        chat_id: ChatId | None = getattr(method, "chat_id", None)
+        if chat_id is None:
+            return await make_request(bot, method)
+
+        for _ in range(self.max_retries):
+            await self._acquire(chat_id)
+
+            try:
+                return await make_request(bot, method)
+            except aiogram_exceptions.TelegramRetryAfter as e:
+                self.logger.warning("Flood control in chat %s, retrying in %s seconds", chat_id, e.retry_after)
+                self._pause(chat_id, e.retry_after)
+
+        await self._acquire(chat_id)
+        return await make_request(bot, method)
+
+
+__all__ = [
+    "OutboundRateScheduler",
+]
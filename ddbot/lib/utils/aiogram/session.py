@@ -0,0 +1,40 @@
+import typing
+
+import aiogram.client.session.aiohttp as aiogram_aiohttp_session
+import aiogram.client.telegram as aiogram_telegram
+
+import lib.utils.json as json_utils
+
+
+class TunedAiohttpSession(aiogram_aiohttp_session.AiohttpSession):
+    """
+    Bot session with orjson codec, configurable connection pool keepalive and optional custom Bot API server.
+    """
+
+    def __init__(
+        self,
+        api_base_url: str | None = None,
+        api_local_mode: bool = False,
+        limit: int = 100,
+        keepalive_timeout_seconds: float = 60,
+        timeout_seconds: float = 60,
+        **kwargs: typing.Any,
+    ) -> None:
+        super().__init__(
+            api=(
+                aiogram_telegram.TelegramAPIServer.from_base(api_base_url, is_local=api_local_mode)
+                if api_base_url is not None
+                else aiogram_telegram.PRODUCTION
+            ),
+            limit=limit,
+            timeout=timeout_seconds,
+            json_loads=json_utils.loads_str,
+            json_dumps=json_utils.dumps_str,
+            **kwargs,
+        )
+        self._connector_init["keepalive_timeout"] = keepalive_timeout_seconds
+
+
+__all__ = [
+    "TunedAiohttpSession",
+]
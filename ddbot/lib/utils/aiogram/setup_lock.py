@@ -0,0 +1,117 @@
+import asyncio
+import dataclasses
+import logging
+import pathlib
+import typing
+
+import redis.asyncio as redis_asyncio
+
+KEY_PREFIX = "telegram_setup:"
+
+RUNNING_VALUE = "running"
+DONE_VALUE = "done"
+
+
+class SetupLockProtocol(typing.Protocol):
+    async def acquire(self, fingerprint: str) -> bool:
+        """
+        Claims the setup of a config fingerprint, False if it is done or in progress elsewhere.
+        """
+
+    async def complete(self, fingerprint: str) -> None: ...
+
+    async def release(self, fingerprint: str) -> None:
+        """
+        Gives up a failed setup, so another replica retries it.
+        """
+
+
+@dataclasses.dataclass
+class LocalSetupLock(SetupLockProtocol):
+    """
+    Remembers the fingerprint of the last performed setup of a bot in a file, e.g. on a persistent volume,
+    so restarts with an unchanged config make no setup calls. File errors let the setup run.
+    """
+
+    logger: logging.Logger
+    path: pathlib.Path
+    bot_id: int
+
+    def _get_file_path(self) -> pathlib.Path:
+        return self.path / f"telegram_setup_{self.bot_id}"
+
+    def _read(self) -> str | None:
+        try:
+            return self._get_file_path().read_text()
+        except FileNotFoundError:
+            return None
+
+    def _write(self, fingerprint: str) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._get_file_path().write_text(fingerprint)
+
+    async def acquire(self, fingerprint: str) -> bool:
+        try:
+            return await asyncio.to_thread(self._read) != fingerprint
+        except OSError:
+            self.logger.exception("Failed to read last telegram setup, performing it anyway")
+            return True
+
+    async def complete(self, fingerprint: str) -> None:
+        try:
+            await asyncio.to_thread(self._write, fingerprint)
+        except OSError:
+            self.logger.exception("Failed to store telegram setup %s", fingerprint)
+
+    async def release(self, fingerprint: str) -> None:
+        pass
+
+
+@dataclasses.dataclass
+class RedisSetupLock(SetupLockProtocol):
+    """
+    One key per bot and config fingerprint: a `running` lease while a replica performs the setup,
+    then a `done` marker until `done_ttl_seconds` passes. Redis errors let the setup run.
+    """
+
+    logger: logging.Logger
+    redis_client: redis_asyncio.Redis
+    bot_id: int
+    lease_seconds: int = 60
+    done_ttl_seconds: int = 24 * 60 * 60
+
+    def _get_full_key(self, fingerprint: str) -> str:
+        return f"{KEY_PREFIX}{self.bot_id}:{fingerprint}"
+
+    async def acquire(self, fingerprint: str) -> bool:
+        try:
+            result = await self.redis_client.set(
+                self._get_full_key(fingerprint),
+                RUNNING_VALUE,
+                nx=True,
+                ex=self.lease_seconds,
+            )
+        except Exception:
+            self.logger.exception("Failed to claim telegram setup %s, performing it anyway", fingerprint)
+            return True
+
+        return bool(result)
+
+    async def complete(self, fingerprint: str) -> None:
+        try:
+            await self.redis_client.set(self._get_full_key(fingerprint), DONE_VALUE, ex=self.done_ttl_seconds)
+        except Exception:
+            self.logger.exception("Failed to mark telegram setup %s as done", fingerprint)
+
+    async def release(self, fingerprint: str) -> None:
+        try:
+            await self.redis_client.delete(self._get_full_key(fingerprint))
+        except Exception:
+            self.logger.exception("Failed to release telegram setup %s", fingerprint)
+
+
+__all__ = [
+    "LocalSetupLock",
+    "RedisSetupLock",
+    "SetupLockProtocol",
+]
@@ -0,0 +1,175 @@
+import dataclasses
+import logging
+import math
+import time
+import typing
+
+import aiogram
+import aiogram.types as aiogram_types
+import redis.asyncio as redis_asyncio
+import redis.commands.core as redis_commands
+
+import lib.utils.aiogram.filters as aiogram_filters
+import lib.utils.rate_limit as rate_limit_utils
+
+KEY_PREFIX = "telegram_throttle:"
+
+# Refills the bucket stored in a hash by elapsed time and takes a token if there is one
+REDIS_TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local state = redis.call("HMGET", KEYS[1], "tokens", "updated_at")
+local tokens = tonumber(state[1]) or capacity
+local updated_at = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "updated_at", tostring(now))
+redis.call("EXPIRE", KEYS[1], ARGV[4])
+return allowed
+"""
+
+
+@dataclasses.dataclass(frozen=True)
+class ThrottleLimit:
+    rate: float
+    capacity: float
+
+
+class ThrottleStorageProtocol(typing.Protocol):
+    async def try_acquire(self, key: str, limit: ThrottleLimit) -> bool: ...
+
+
+@dataclasses.dataclass
+class LocalThrottleStorage(ThrottleStorageProtocol):
+    max_keys: int = 10_000
+
+    _buckets: dict[str, rate_limit_utils.TokenBucket] = dataclasses.field(init=False, default_factory=dict)
+
+    def _prune_full_buckets(self) -> None:
+        full_keys = [key for key, bucket in self._buckets.items() if bucket.get_delay(bucket.capacity) == 0]
+        for key in full_keys:
+            del self._buckets[key]
+
+    async def try_acquire(self, key: str, limit: ThrottleLimit) -> bool:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.max_keys:
+                self._prune_full_buckets()
+
+            bucket = rate_limit_utils.TokenBucket(rate=limit.rate, capacity=limit.capacity)
+            self._buckets[key] = bucket
+
+        return bucket.try_acquire()
+
+
+@dataclasses.dataclass
+class RedisThrottleStorage(ThrottleStorageProtocol):
+    """
+    Token buckets shared by all replicas, updated atomically by a Lua script. Redis errors let the update through.
+    """
+
+    logger: logging.Logger
+    redis_client: redis_asyncio.Redis
+
+    _script: redis_commands.AsyncScript = dataclasses.field(init=False)
+
+    def __post_init__(self) -> None:
+        self._script = self.redis_client.register_script(REDIS_TOKEN_BUCKET_SCRIPT)
+
+    async def try_acquire(self, key: str, limit: ThrottleLimit) -> bool:
+        ttl_seconds = math.ceil(limit.capacity / limit.rate) + 1
+
+        try:
+            result = await self._script(
+                keys=[f"{KEY_PREFIX}{key}"],
+                args=[limit.rate, limit.capacity, time.time(), ttl_seconds],
+            )
+        except Exception:
+            self.logger.exception("Failed to check throttling of %s, letting it through", key)
+            return True
+
+        return bool(result)
+
+
+@dataclasses.dataclass
+class ThrottlingMiddleware(aiogram.BaseMiddleware):
+    """
+    Outer message middleware limiting commands with a token bucket per limit and `get_key` result.
+    Throttled messages are dropped, with `throttled_text` the first one in a row is answered.
+    """
+
+    logger: logging.Logger
+    storage: ThrottleStorageProtocol
+    limits: typing.Mapping[str, ThrottleLimit]
+    commands: typing.Mapping[str, str]
+    get_key: typing.Callable[[aiogram_types.Message], str]
+    throttled_text: str | None = None
+    prefix: str = "/"
+    max_notified_keys: int = 10_000
+
+    _notified_keys: set[str] = dataclasses.field(init=False, default_factory=set)
+
+    def _get_limit_name(self, message: aiogram_types.Message) -> str | None:
+        text = aiogram_filters.get_command_text(message)
+        if text is None:
+            return None
+
+        split = aiogram_filters.split_command(text, self.prefix)
+        if split is None:
+            return None
+
+        return self.commands.get(split[0])
+
+    def _should_answer(self, key: str) -> bool:
+        if self.throttled_text is None or key in self._notified_keys:
+            return False
+
+        if len(self._notified_keys) >= self.max_notified_keys:
+            self._notified_keys.clear()
+        self._notified_keys.add(key)
+
+        return True
+
+    async def __call__(
+        self,
+        handler: typing.Callable[[aiogram_types.TelegramObject, dict[str, typing.Any]], typing.Awaitable[typing.Any]],
+        event: aiogram_types.TelegramObject,
+        data: dict[str, typing.Any],
+    ) -> typing.Any:
+        if not isinstance(event, aiogram_types.Message):
+            return await handler(event, data)
+
+        limit_name = self._get_limit_name(event)
+        limit = self.limits.get(limit_name) if limit_name is not None else None
+        if limit is None:
+            return await handler(event, data)
+
+        try:
+            key = f"{limit_name}:{self.get_key(event)}"
+        except ValueError:
+            return await handler(event, data)
+
+        if await self.storage.try_acquire(key, limit):
+            self._notified_keys.discard(key)
+            return await handler(event, data)
+
+        self.logger.info("Throttled %s", key)
+        if not self._should_answer(key):
+            return None
+
+        assert self.throttled_text is not None
+        return event.reply(text=self.throttled_text)
+
+
+__all__ = [
+    "LocalThrottleStorage",
+    "RedisThrottleStorage",
+    "ThrottleLimit",
+    "ThrottleStorageProtocol",
+    "ThrottlingMiddleware",
+]
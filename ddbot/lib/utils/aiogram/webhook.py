@@ -0,0 +1,274 @@
+import asyncio
+import dataclasses
+import enum
+import http
+import logging
+import secrets
+import time
+import typing
+
+import aiogram
+import aiogram.methods as aiogram_methods
+import aiohttp
+import aiohttp.web as aiohttp_web
+
+import lib.utils.aiogram.dedup as aiogram_dedup
+import lib.utils.aiogram.prefilter as aiogram_prefilter
+import lib.utils.aiohttp as aiohttp_utils
+import lib.utils.json as json_utils
+import lib.utils.lifecycle as lifecycle_utils
+
+SECRET_TOKEN_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+
+@dataclasses.dataclass
+class WebhookQueueMetrics:
+    filtered_total: int = 0
+    duplicated_total: int = 0
+    enqueued_total: int = 0
+    rejected_total: int = 0
+    processed_total: int = 0
+    failed_total: int = 0
+    dequeued_total: int = 0
+    answered_in_response_total: int = 0
+    wait_seconds_total: float = 0
+    wait_seconds_max: float = 0
+
+
+@dataclasses.dataclass(frozen=True)
+class _QueueItem:
+    enqueued_at: float
+    update: aiogram_prefilter.RawUpdate
+    response: asyncio.Future[aiogram_methods.TelegramMethod[typing.Any] | None] | None = None
+
+
+def build_method_response(bot: aiogram.Bot, method: aiogram_methods.TelegramMethod[typing.Any]) -> aiohttp_web.Response:
+    """
+    Mirrors aiogram BaseRequestHandler._build_response_writer: Telegram executes the method from the webhook response.
+    aiogram has no public API for it, so the version is pinned and the output is checked against aiogram in tests.
+    """
+    writer = aiohttp.MultipartWriter("form-data", boundary=f"webhookBoundary{secrets.token_urlsafe(16)}")
+
+    payload = writer.append(method.__api_method__)
+    payload.set_content_disposition("form-data", name="method")
+
+    files: dict[str, typing.Any] = {}
+    for key, value in method.model_dump(warnings=False).items():
+        value = bot.session.prepare_value(value, bot=bot, files=files)
+        if not value:
+            continue
+        payload = writer.append(value)
+        payload.set_content_disposition("form-data", name=key)
+
+    for key, value in files.items():
+        payload = writer.append(value.read(bot))
+        payload.set_content_disposition("form-data", name=key, filename=value.filename or key)
+
+    return aiohttp_web.Response(body=writer)
+
+
+@dataclasses.dataclass(frozen=True)
+class QueuedWebhookHandler:
+    """
+    Feeds webhook updates to the dispatcher from a bounded queue drained by a fixed pool of workers.
+    Updates rejected by `update_prefilter` or already seen by `deduplicator` are acknowledged without building models,
+    the rest are acknowledged at once, or, with `response_timeout_seconds`, held until the handler returns
+    a Telegram method to answer with in the response body.
+    """
+
+    class OverflowPolicy(enum.Enum):
+        REJECT = "reject"
+        WAIT = "wait"
+
+    logger: logging.Logger
+    bot: aiogram.Bot
+    dispatcher: aiogram.Dispatcher
+    secret_token: str | None = None
+    max_size: int = 1000
+    workers_count: int = 16
+    overflow_policy: OverflowPolicy = OverflowPolicy.REJECT
+    overflow_timeout_seconds: float = 5
+    response_timeout_seconds: float | None = None
+    update_prefilter: typing.Callable[[aiogram_prefilter.RawUpdate], bool] | None = None
+    deduplicator: aiogram_dedup.UpdateDeduplicatorProtocol | None = None
+
+    metrics: WebhookQueueMetrics = dataclasses.field(default_factory=WebhookQueueMetrics)
+    _queue: asyncio.Queue[_QueueItem] = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        assert self.max_size > 0, "max_size must be positive"
+        assert self.workers_count > 0, "workers_count must be positive"
+
+        object.__setattr__(self, "_queue", asyncio.Queue(maxsize=self.max_size))
+
+    async def _put(self, item: _QueueItem) -> bool:
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except asyncio.QueueFull:
+            if self.overflow_policy == self.OverflowPolicy.REJECT:
+                return False
+
+        try:
+            await asyncio.wait_for(self._queue.put(item), timeout=self.overflow_timeout_seconds)
+        except TimeoutError:
+            return False
+
+        return True
+
+    def _is_authorized(self, request: aiohttp_web.Request) -> bool:
+        return not self.secret_token or secrets.compare_digest(
+            request.headers.get(SECRET_TOKEN_HEADER, ""),
+            self.secret_token,
+        )
+
+    @staticmethod
+    def _unauthorized_response() -> aiohttp_web.Response:
+        return aiohttp_utils.Response.with_error(
+            status=http.HTTPStatus.UNAUTHORIZED,
+            problem="unauthorized",
+            message="Invalid secret token",
+        )
+
+    async def handle(self, request: aiohttp_web.Request) -> aiohttp_web.Response:
+        if not self._is_authorized(request):
+            return self._unauthorized_response()
+
+        try:
+            update = json_utils.loads_bytes(await request.read())
+        except json_utils.JSONDecodeError:
+            update = None
+        if not isinstance(update, dict):
+            return aiohttp_utils.Response.with_error(
+                status=http.HTTPStatus.BAD_REQUEST,
+                problem="invalid_update",
+                message="Update must be a JSON object",
+            )
+
+        if self.update_prefilter is not None and not self.update_prefilter(update):
+            self.metrics.filtered_total += 1
+            return aiohttp_utils.Response.with_data(data={})
+
+        update_id = update.get("update_id")
+        if self.deduplicator is not None and isinstance(update_id, int):
+            if not await self.deduplicator.is_new(update_id):
+                self.metrics.duplicated_total += 1
+                self.logger.debug("Skipping duplicated update %s", update_id)
+                return aiohttp_utils.Response.with_data(data={})
+
+        item = _QueueItem(
+            enqueued_at=time.monotonic(),
+            update=update,
+            response=None if self.response_timeout_seconds is None else asyncio.get_running_loop().create_future(),
+        )
+
+        if not await self._put(item):
+            self.metrics.rejected_total += 1
+            self.logger.warning("Webhook update queue is full, rejecting update %s", update_id)
+            if self.deduplicator is not None and isinstance(update_id, int):
+                await self.deduplicator.release(update_id)
+            return aiohttp_utils.Response.with_error(
+                status=http.HTTPStatus.SERVICE_UNAVAILABLE,
+                problem="queue_full",
+                message="Update queue is full",
+            )
+
+        self.metrics.enqueued_total += 1
+
+        if item.response is not None:
+            method = await self._wait_response(item.response)
+            if method is not None:
+                self.metrics.answered_in_response_total += 1
+                return build_method_response(self.bot, method)
+
+        return aiohttp_utils.Response.with_data(data={})
+
+    async def _wait_response(
+        self,
+        response: asyncio.Future[aiogram_methods.TelegramMethod[typing.Any] | None],
+    ) -> aiogram_methods.TelegramMethod[typing.Any] | None:
+        try:
+            return await asyncio.wait_for(asyncio.shield(response), timeout=self.response_timeout_seconds)
+        except TimeoutError:
+            pass
+        except asyncio.CancelledError:
+            response.cancel()
+            raise
+
+        # Worker falls back to a regular API call once the response future is cancelled
+        if response.done() and not response.cancelled():
+            return response.result()
+
+        response.cancel()
+        return None
+
+    async def _process(self, item: _QueueItem) -> None:
+        try:
+            result = await self.dispatcher.feed_raw_update(bot=self.bot, update=item.update)
+        except Exception:
+            if item.response is not None and not item.response.done():
+                item.response.set_result(None)
+            raise
+
+        if not isinstance(result, aiogram_methods.TelegramMethod):
+            result = None
+
+        if item.response is not None and not item.response.done():
+            item.response.set_result(result)
+            return
+
+        if result is not None:
+            await self.dispatcher.silent_call_request(bot=self.bot, result=result)
+
+    async def _work(self) -> None:
+        while True:
+            item = await self._queue.get()
+
+            wait_seconds = time.monotonic() - item.enqueued_at
+            self.metrics.dequeued_total += 1
+            self.metrics.wait_seconds_total += wait_seconds
+            self.metrics.wait_seconds_max = max(self.metrics.wait_seconds_max, wait_seconds)
+
+            try:
+                await self._process(item)
+            except Exception:
+                self.metrics.failed_total += 1
+                self.logger.exception("Failed to process webhook update %s", item.update.get("update_id"))
+            else:
+                self.metrics.processed_total += 1
+            finally:
+                self._queue.task_done()
+
+    async def drain(self) -> None:
+        await self._queue.join()
+
+    def get_main_tasks(self) -> list[lifecycle_utils.Task]:
+        return [
+            asyncio.create_task(coro=self._work(), name=f"telegram_webhook_worker_{index}")
+            for index in range(self.workers_count)
+        ]
+
+    def get_metrics(self) -> dict[str, typing.Any]:
+        return {
+            "queue_depth": self._queue.qsize(),
+            "queue_max_size": self.max_size,
+            "workers_count": self.workers_count,
+            **dataclasses.asdict(self.metrics),
+            "wait_seconds_avg": (
+                self.metrics.wait_seconds_total / self.metrics.dequeued_total if self.metrics.dequeued_total else 0
+            ),
+        }
+
+    async def process_metrics(self, request: aiohttp_web.Request) -> aiohttp_web.Response:
+        if not self._is_authorized(request):
+            return self._unauthorized_response()
+
+        return aiohttp_utils.Response.with_data(data=self.get_metrics())
+
+
+__all__ = [
+    "SECRET_TOKEN_HEADER",
+    "QueuedWebhookHandler",
+    "WebhookQueueMetrics",
+    "build_method_response",
+]
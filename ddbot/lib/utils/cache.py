@@ -1,5 +1,8 @@
+import asyncio
 import dataclasses
 import datetime
+import functools
+import inspect
 import logging
 import typing
 
@@ -9,6 +12,8 @@ T = typing.TypeVar("T")
 class CacheProtocol(typing.Protocol[T]):
     async def wrap_awaitable(self, key: str, awaitable: typing.Awaitable[T], logger: logging.Logger) -> T: ...
 
+    async def set(self, key: str, value: T) -> None: ...
+
     async def clear(self, key: str) -> None: ...
 
 
@@ -18,6 +23,9 @@ class NoCache(CacheProtocol[T]):
         logger.debug("NoCache.wrap_awaitable: key=%s", key)
         return await awaitable
 
+    async def set(self, key: str, value: T) -> None:
+        pass
+
     async def clear(self, key: str) -> None:
         pass
 
@@ -36,39 +44,106 @@ class _LocalCacheRecord(typing.Generic[T]):
         return datetime.datetime.now() - self.created_at
 
 
+def _discard(awaitable: typing.Awaitable[typing.Any]) -> None:
+    if inspect.iscoroutine(awaitable):
+        awaitable.close()
+
+
 @dataclasses.dataclass
 class LocalCache(CacheProtocol[T]):
+    """
+    Concurrent misses of a key share a single in-flight fetch.
+    """
+
     ttl: datetime.timedelta
 
     _cache: dict[str, _LocalCacheRecord[T]] = dataclasses.field(default_factory=dict)
+    _pending: dict[str, asyncio.Future[T]] = dataclasses.field(default_factory=dict)
 
-    async def _update_record(self, key: str, awaitable: typing.Awaitable[T]) -> T:
+    def _get_record_ttl(self, key: str, value: T, logger: logging.Logger) -> datetime.timedelta:
+        return self.ttl
+
+    async def _fetch_record(self, key: str, awaitable: typing.Awaitable[T], logger: logging.Logger) -> T:
         value = await awaitable
-        self._cache[key] = _LocalCacheRecord(value=value, ttl=self.ttl)
+        self._cache[key] = _LocalCacheRecord(value=value, ttl=self._get_record_ttl(key, value, logger))
         return value
 
+    def _on_fetch_done(self, key: str, future: asyncio.Future[T]) -> None:
+        if self._pending.get(key) is future:
+            del self._pending[key]
+
+        # Waiters may all be cancelled, the result is still retrieved to avoid unhandled error logs
+        if not future.cancelled():
+            future.exception()
+
+    async def _update_record(self, key: str, awaitable: typing.Awaitable[T], logger: logging.Logger) -> T:
+        future = self._pending.get(key)
+        if future is not None:
+            logger.debug("LocalCache._update_record: key=%s, joining in-flight fetch", key)
+            _discard(awaitable)
+        else:
+            future = asyncio.ensure_future(self._fetch_record(key, awaitable, logger))
+            future.add_done_callback(functools.partial(self._on_fetch_done, key))
+            self._pending[key] = future
+
+        return await asyncio.shield(future)
+
     async def wrap_awaitable(self, key: str, awaitable: typing.Awaitable[T], logger: logging.Logger) -> T:
         if key not in self._cache:
             logger.debug("LocalCache.wrap_awaitable: key=%s, cache miss", key)
-            return await self._update_record(key, awaitable)
+            return await self._update_record(key, awaitable, logger)
 
         record = self._cache[key]
 
         if record.is_expired():
             logger.debug("LocalCache.wrap_awaitable: key=%s, cache expired", key)
-            return await self._update_record(key, awaitable)
+            return await self._update_record(key, awaitable, logger)
 
         logger.debug(
             "LocalCache.wrap_awaitable: key=%s, cache hit, record age: %s, ttl: %s", key, record.age, record.ttl
         )
+        _discard(awaitable)
         return record.value
 
+    async def set(self, key: str, value: T) -> None:
+        self._cache[key] = _LocalCacheRecord(value=value, ttl=self.ttl)
+
     async def clear(self, key: str) -> None:
         if key in self._cache:
             del self._cache[key]
 
 
+@dataclasses.dataclass(kw_only=True)
+class AdaptiveLocalCache(LocalCache[T]):
+    """
+    Grows the ttl of a key by `growth_factor` up to `max_ttl` while refetches return an unchanged value,
+    and resets it to `min_ttl` once the value changes.
+    """
+
+    min_ttl: datetime.timedelta
+    max_ttl: datetime.timedelta
+    growth_factor: float = 2.0
+
+    def _get_record_ttl(self, key: str, value: T, logger: logging.Logger) -> datetime.timedelta:
+        previous_record = self._cache.get(key)
+        if previous_record is None:
+            return self.ttl
+
+        changed = value != previous_record.value
+        ttl = self.min_ttl if changed else min(previous_record.ttl * self.growth_factor, self.max_ttl)
+        logger.debug(
+            "AdaptiveLocalCache._get_record_ttl: key=%s, changed=%s, ttl: %s -> %s",
+            key,
+            changed,
+            previous_record.ttl,
+            ttl,
+        )
+
+        return ttl
+
+
 __all__ = [
+    "AdaptiveLocalCache",
     "CacheProtocol",
     "LocalCache",
     "NoCache",
@@ -10,6 +10,7 @@ JsonSerializableList = typing.Sequence[JsonSerializable]
 
 dumps_bytes = orjson.dumps
 loads_bytes = orjson.loads
+JSONDecodeError = orjson.JSONDecodeError
 
 
 def dumps_str(obj: JsonSerializable) -> str:
@@ -17,10 +18,12 @@ def dumps_str(obj: JsonSerializable) -> str:
 
 
 def loads_str(s: str) -> JsonSerializable:
-    return loads_bytes(s.encode("utf-8"))
+    # orjson parses str directly, without an extra utf-8 copy
+    return loads_bytes(s)
 
 
 __all__ = [
+    "JSONDecodeError",
     "JsonSerializable",
     "JsonSerializableDict",
     "JsonSerializableList",
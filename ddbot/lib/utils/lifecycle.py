@@ -1,6 +1,8 @@
 import asyncio
 import dataclasses
+import inspect
 import logging
+import time
 import typing
 
 Awaitable = typing.Awaitable[typing.Any]
@@ -12,6 +14,8 @@ class Callback:
     awaitable: Awaitable
     error_message: str
     success_message: str
+    name: str | None = None
+    depends_on: typing.Sequence[str] = ()
 
     @classmethod
     def from_dispose(cls, name: str, awaitable: Awaitable) -> typing.Self:
@@ -22,6 +26,46 @@ class Callback:
         )
 
 
+async def cancel_task(task: Task) -> None:
+    task.cancel()
+    await asyncio.wait([task])
+
+
+@dataclasses.dataclass
+class BackgroundTask:
+    """
+    Best-effort work started by a startup callback without delaying the startup, failures are only logged.
+    """
+
+    logger: logging.Logger
+    awaitable: Awaitable
+    name: str
+    error_message: str
+    success_message: str
+
+    _task: Task | None = dataclasses.field(default=None, init=False)
+
+    async def _run(self) -> None:
+        started_at = time.perf_counter()
+        try:
+            await self.awaitable
+        except Exception:
+            self.logger.exception(self.error_message)
+        else:
+            self.logger.info(f"{self.success_message} in {time.perf_counter() - started_at:.3f} seconds")
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def cancel(self) -> None:
+        if self._task is None:
+            if inspect.iscoroutine(self.awaitable):
+                self.awaitable.close()
+            return
+
+        await cancel_task(self._task)
+
+
 @dataclasses.dataclass(frozen=True)
 class Lifecycle:
     logger: logging.Logger
@@ -29,6 +73,8 @@ class Lifecycle:
     main_tasks: typing.Sequence[asyncio.Task[typing.Any]] = dataclasses.field(default_factory=list)
     startup_callbacks: typing.Sequence[Callback] = dataclasses.field(default_factory=list)
     shutdown_callbacks: typing.Sequence[Callback] = dataclasses.field(default_factory=list)
+    drain_callbacks: typing.Sequence[Callback] = dataclasses.field(default_factory=list)
+    drain_timeout_seconds: float = 30
 
     class StartupError(Exception): ...
 
@@ -55,26 +101,85 @@ class Lifecycle:
                 else:
                     self.logger.error(f"Task {task.get_name()} has unexpectedly finished")
 
-            for task in self.main_tasks:
-                if task.done():
-                    continue
+            raise
 
-                task.cancel()
-                self.logger.error(f"Task {task.get_name()} has been cancelled")
+    async def _run_startup_callback(self, callback: Callback, dependencies: list[Task]) -> None:
+        await asyncio.gather(*dependencies)
 
+        started_at = time.perf_counter()
+        try:
+            await callback.awaitable
+        except Exception:
+            self.logger.exception(callback.error_message)
             raise
 
+        self.logger.info(f"{callback.success_message} in {time.perf_counter() - started_at:.3f} seconds")
+
     async def on_startup(self) -> None:
+        """
+        Runs startup callbacks concurrently, each one once the earlier callbacks named in its `depends_on` succeed.
+        """
+        names: set[str] = set()
         for callback in self.startup_callbacks:
-            try:
-                await callback.awaitable
-            except Exception as error:
-                self.logger.exception(callback.error_message)
-                raise self.StartupError from error
-            else:
-                self.logger.info(callback.success_message)
+            for dependency in callback.depends_on:
+                if dependency not in names:
+                    raise self.StartupError(
+                        f"Startup callback {callback.name} depends on unknown callback {dependency}"
+                    )
+            if callback.name is not None:
+                names.add(callback.name)
+
+        started_at = time.perf_counter()
+        named_tasks: dict[str, Task] = {}
+        tasks: list[Task] = []
+        for callback in self.startup_callbacks:
+            task = asyncio.create_task(
+                self._run_startup_callback(callback, [named_tasks[dependency] for dependency in callback.depends_on]),
+                name=f"startup_{callback.name or len(tasks)}",
+            )
+            tasks.append(task)
+            if callback.name is not None:
+                named_tasks[callback.name] = task
+
+        try:
+            await asyncio.gather(*tasks)
+        except Exception as error:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise self.StartupError from error
+
+        self.logger.info(f"Startup has taken {time.perf_counter() - started_at:.3f} seconds")
+
+    async def on_drain(self) -> None:
+        """
+        Runs drain callbacks in order (stop accepting input, wait for in-flight work) within a shared deadline,
+        main tasks keep running meanwhile.
+        """
+        try:
+            async with asyncio.timeout(self.drain_timeout_seconds):
+                for callback in self.drain_callbacks:
+                    try:
+                        await callback.awaitable
+                    except Exception:
+                        self.logger.exception(callback.error_message)
+                    else:
+                        self.logger.info(callback.success_message)
+        except TimeoutError:
+            self.logger.warning(f"Drain has not finished in {self.drain_timeout_seconds} seconds")
+
+    async def cancel_main_tasks(self) -> None:
+        for task in self.main_tasks:
+            if task.done():
+                continue
+
+            await cancel_task(task)
+            self.logger.info(f"Task {task.get_name()} has been cancelled")
 
     async def on_shutdown(self) -> None:
+        await self.on_drain()
+        await self.cancel_main_tasks()
+
         errors: list[Exception] = []
 
         for callback in self.shutdown_callbacks:
@@ -91,7 +196,9 @@ class Lifecycle:
 
 
 __all__ = [
+    "BackgroundTask",
     "Callback",
     "Lifecycle",
     "Task",
+    "cancel_task",
 ]
@@ -0,0 +1,48 @@
+import asyncio
+import dataclasses
+import time
+
+
+@dataclasses.dataclass
+class TokenBucket:
+    rate: float
+    capacity: float
+    _tokens: float = dataclasses.field(init=False)
+    _updated_at: float = dataclasses.field(init=False)
+    _lock: asyncio.Lock = dataclasses.field(init=False, default_factory=asyncio.Lock)
+
+    def __post_init__(self) -> None:
+        assert self.rate > 0, "rate must be positive"
+        assert self.capacity >= 1, "capacity must be at least 1"
+
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        self._refill()
+
+        if self._tokens < tokens:
+            return False
+
+        self._tokens -= tokens
+        return True
+
+    def get_delay(self, tokens: float = 1) -> float:
+        self._refill()
+
+        return max(0.0, (tokens - self._tokens) / self.rate)
+
+    async def acquire(self, tokens: float = 1) -> None:
+        async with self._lock:
+            while not self.try_acquire(tokens):
+                await asyncio.sleep(self.get_delay(tokens))
+
+
+__all__ = [
+    "TokenBucket",
+]
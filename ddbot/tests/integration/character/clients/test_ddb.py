@@ -41,7 +41,7 @@ async def test_get_character(
     http_client: ddb_clients.CharacterDdbClient,
     character_id: int,
 ):
-    expected = ddb_models.Character(
+    expected = ddb_models.Character.from_mappings(
         id=character_id,
         name="Test_Character_Name",
         abilities={
@@ -0,0 +1,126 @@
+import os
+import pathlib
+import signal
+import time
+import typing
+
+import pytest
+
+import lib.app.errors as app_errors
+import lib.app.settings as app_settings
+import lib.app.supervisor as app_supervisor
+
+MULTIPLE_WORKERS_ENV = {
+    "TELEGRAM__TOKEN": "123456:ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghi",
+    "TELEGRAM__WEBHOOK_ENABLED": "true",
+    "TELEGRAM__UPDATE_DEDUP__TYPE": "redis",
+    "TELEGRAM__THROTTLING__TYPE": "redis",
+    "CONTEXT__TYPE": "redis",
+    "SERVER__WORKERS": "2",
+}
+
+
+@pytest.fixture(name="sigterm_handler", autouse=True)
+def fixture_sigterm_handler() -> typing.Generator[None, None, None]:
+    handler = signal.getsignal(signal.SIGTERM)
+    yield
+    signal.signal(signal.SIGTERM, handler)
+
+
+def _make_settings(monkeypatch: pytest.MonkeyPatch, **env: str) -> app_settings.Settings:
+    for key, value in {**MULTIPLE_WORKERS_ENV, **env}.items():
+        monkeypatch.setenv(key, value)
+
+    return app_settings.Settings()
+
+
+def _wait_for_files(paths: list[pathlib.Path]) -> None:
+    deadline = time.monotonic() + 5
+    while not all(path.exists() for path in paths):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def _make_worker_target(
+    tmp_path: pathlib.Path,
+    workers_count: int,
+    exit_index: int | None = None,
+    stop_index: int | None = None,
+) -> typing.Callable[[int], None]:
+    def worker_target(worker_index: int) -> None:
+        (tmp_path / f"started_{worker_index}").touch()
+
+        if worker_index in (exit_index, stop_index):
+            _wait_for_files([tmp_path / f"started_{index}" for index in range(workers_count)])
+        if worker_index == exit_index:
+            return
+        if worker_index == stop_index:
+            os.kill(os.getppid(), signal.SIGTERM)
+
+        try:
+            while True:
+                time.sleep(0.01)
+        except KeyboardInterrupt:
+            (tmp_path / f"stopped_{worker_index}").touch()
+
+    return worker_target
+
+
+def test_from_settings(monkeypatch: pytest.MonkeyPatch):
+    settings = _make_settings(monkeypatch, SERVER__DRAIN_TIMEOUT_SECONDS="5")
+
+    supervisor = app_supervisor.Supervisor.from_settings(settings, worker_target=lambda worker_index: None)
+
+    assert supervisor.workers_count == 2
+    assert supervisor.shutdown_timeout_seconds == 15
+
+
+@pytest.mark.parametrize(
+    "env",
+    [
+        {"TELEGRAM__WEBHOOK_ENABLED": "false"},
+        {"CONTEXT__TYPE": "local"},
+        {"TELEGRAM__UPDATE_DEDUP__TYPE": "local"},
+        {"TELEGRAM__THROTTLING__TYPE": "local"},
+    ],
+)
+def test_from_settings_rejects_per_process_state(monkeypatch: pytest.MonkeyPatch, env: dict[str, str]):
+    settings = _make_settings(monkeypatch, **env)
+
+    with pytest.raises(app_errors.ServerStartError):
+        app_supervisor.Supervisor.from_settings(settings, worker_target=lambda worker_index: None)
+
+
+def test_from_settings_rejects_no_workers(monkeypatch: pytest.MonkeyPatch):
+    settings = _make_settings(monkeypatch)
+    settings.server.workers = 0
+
+    with pytest.raises(app_errors.ServerStartError):
+        app_supervisor.Supervisor.from_settings(settings, worker_target=lambda worker_index: None)
+
+
+def test_run_stops_workers_when_one_exits(tmp_path: pathlib.Path):
+    supervisor = app_supervisor.Supervisor(
+        workers_count=3,
+        worker_target=_make_worker_target(tmp_path, workers_count=3, exit_index=0),
+        shutdown_timeout_seconds=5,
+    )
+
+    with pytest.raises(app_errors.ServerRuntimeError):
+        supervisor.run()
+
+    assert (tmp_path / "stopped_1").exists()
+    assert (tmp_path / "stopped_2").exists()
+
+
+def test_run_stops_workers_on_sigterm(tmp_path: pathlib.Path):
+    supervisor = app_supervisor.Supervisor(
+        workers_count=2,
+        worker_target=_make_worker_target(tmp_path, workers_count=2, stop_index=1),
+        shutdown_timeout_seconds=5,
+    )
+
+    supervisor.run()
+
+    assert (tmp_path / "stopped_0").exists()
+    assert (tmp_path / "stopped_1").exists()
@@ -0,0 +1,26 @@
+import pathlib
+
+import pytest
+
+import lib.character.archives as character_archives
+import lib.character.protocols as character_protocols
+
+
+@pytest.fixture(name="archive")
+def fixture_archive(tmp_path: pathlib.Path) -> character_archives.LocalCharacterArchive:
+    return character_archives.LocalCharacterArchive(path=tmp_path / "archive")
+
+
+@pytest.mark.asyncio
+async def test_local_archive(archive: character_archives.LocalCharacterArchive):
+    assert await archive.get_entity_ids() == []
+
+    with pytest.raises(character_protocols.CharacterArchiveProtocol.NotFoundError):
+        await archive.get(1)
+
+    await archive.set(1, {"id": 1, "name": "First"})
+    await archive.set(2, {"id": 2, "name": "Second"})
+    await archive.set(1, {"id": 1, "name": "First updated"})
+
+    assert sorted(await archive.get_entity_ids()) == [1, 2]
+    assert await archive.get(1) == {"id": 1, "name": "First updated"}
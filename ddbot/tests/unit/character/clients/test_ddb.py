@@ -0,0 +1,195 @@
+import asyncio
+import dataclasses
+import datetime
+import pathlib
+import time
+import typing
+
+import aiohttp
+import orjson
+import pytest
+import pytest_asyncio
+
+import lib.character.clients as character_clients
+import lib.character.models as character_models
+import lib.character.protocols as character_protocols
+import lib.character.services as character_services
+import lib.utils.cache as cache_utils
+import lib.utils.rate_limit as rate_limit_utils
+import tests.utils.character as character_utils
+import tests.utils.ddb as ddb_utils
+
+CAMPAIGN_ID = 1
+CAMPAIGN_ENTITY_IDS = list(range(100, 120))
+MISSING_ENTITY_ID = 999
+
+
+@pytest.fixture(name="server")
+def fixture_server() -> ddb_utils.FakeDdbServer:
+    return ddb_utils.FakeDdbServer(
+        characters={entity_id: character_utils.make_character_data(entity_id) for entity_id in CAMPAIGN_ENTITY_IDS},
+        campaigns={CAMPAIGN_ID: [*CAMPAIGN_ENTITY_IDS, MISSING_ENTITY_ID]},
+        profile=ddb_utils.FakeDdbProfile(latency=ddb_utils.ConstantLatency(0.01)),
+    )
+
+
+@pytest_asyncio.fixture(name="base_url")
+async def fixture_base_url(server: ddb_utils.FakeDdbServer) -> typing.AsyncGenerator[str, None]:
+    async with ddb_utils.run_fake_ddb_server(server) as base_url:
+        yield base_url
+
+
+@pytest_asyncio.fixture(name="base_client")
+async def fixture_base_client() -> typing.AsyncGenerator[aiohttp.ClientSession, None]:
+    async with aiohttp.ClientSession() as client:
+        yield client
+
+
+def _make_client(
+    base_client: aiohttp.ClientSession,
+    base_url: str,
+    max_concurrency: int = 4,
+    rate_limiter: rate_limit_utils.TokenBucket | None = None,
+) -> character_clients.CharacterDdbClient:
+    return character_clients.CharacterDdbClient(
+        base_client=base_client,
+        base_url=base_url,
+        campaign_base_url=base_url,
+        max_concurrency=max_concurrency,
+        rate_limiter=rate_limiter,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_campaign(base_client: aiohttp.ClientSession, base_url: str):
+    client = _make_client(base_client, base_url)
+
+    campaign = await client.get_campaign(CAMPAIGN_ID)
+
+    assert campaign.id == CAMPAIGN_ID
+    assert [character.id for character in campaign.characters] == [*CAMPAIGN_ENTITY_IDS, MISSING_ENTITY_ID]
+    assert campaign.characters[0] == character_models.CampaignCharacter(
+        id=CAMPAIGN_ENTITY_IDS[0],
+        name=f"Character {CAMPAIGN_ENTITY_IDS[0]}",
+        user_name=f"player_{CAMPAIGN_ENTITY_IDS[0]}",
+    )
+
+    with pytest.raises(character_protocols.CharacterRepositoryProtocol.NotFoundError):
+        await client.get_campaign(CAMPAIGN_ID + 1)
+
+
+@pytest.mark.asyncio
+async def test_get_many_bounded_concurrency(
+    server: ddb_utils.FakeDdbServer,
+    base_client: aiohttp.ClientSession,
+    base_url: str,
+):
+    client = _make_client(base_client, base_url, max_concurrency=4)
+
+    result = await client.get_many([*CAMPAIGN_ENTITY_IDS, MISSING_ENTITY_ID])
+
+    entity_ids = [character.id for character in result[:-1]]  # pyright: ignore[reportAttributeAccessIssue]
+    assert entity_ids == CAMPAIGN_ENTITY_IDS
+    assert isinstance(result[-1], character_protocols.CharacterRepositoryProtocol.NotFoundError)
+    assert server.max_in_flight == 4
+
+
+@pytest.mark.asyncio
+async def test_get_many_rate_limited(base_client: aiohttp.ClientSession, base_url: str):
+    client = _make_client(
+        base_client,
+        base_url,
+        max_concurrency=100,
+        rate_limiter=rate_limit_utils.TokenBucket(rate=100, capacity=10),
+    )
+
+    started_at = time.monotonic()
+    await client.get_many(CAMPAIGN_ENTITY_IDS)
+
+    # 10 requests fit into the burst, the other 10 wait for refill at 100 requests per second
+    assert time.monotonic() - started_at >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_import_campaign(
+    server: ddb_utils.FakeDdbServer,
+    base_client: aiohttp.ClientSession,
+    base_url: str,
+):
+    cache = cache_utils.LocalCache[character_models.Character](ttl=datetime.timedelta(hours=1))
+    service = character_services.CharacterService(repository=_make_client(base_client, base_url), cache=cache)
+
+    result = await service.import_campaign(CAMPAIGN_ID)
+
+    assert list(result.characters) == CAMPAIGN_ENTITY_IDS
+    assert result.failed_entity_ids == [MISSING_ENTITY_ID]
+
+    requests_count = server.requests_count
+    for entity_id in CAMPAIGN_ENTITY_IDS:
+        assert (await service.get(entity_id)) == result.characters[entity_id]
+    assert server.requests_count == requests_count
+
+    # cached characters are not refetched, only the campaign and the missing character are
+    assert list((await service.import_campaign(CAMPAIGN_ID)).characters) == CAMPAIGN_ENTITY_IDS
+    assert server.requests_count == requests_count + 2
+
+    with pytest.raises(character_protocols.CharacterServiceProtocol.NotFoundError):
+        await service.import_campaign(CAMPAIGN_ID + 1)
+
+
+@pytest.mark.asyncio
+async def test_service_shares_in_flight_fetch(
+    server: ddb_utils.FakeDdbServer,
+    base_client: aiohttp.ClientSession,
+    base_url: str,
+):
+    cache = cache_utils.LocalCache[character_models.Character](ttl=datetime.timedelta(hours=1))
+    service = character_services.CharacterService(repository=_make_client(base_client, base_url), cache=cache)
+
+    characters = await asyncio.gather(*(service.get(CAMPAIGN_ENTITY_IDS[0]) for _ in range(5)))
+
+    assert all(character is characters[0] for character in characters)
+    assert server.requests_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_error_responses(base_client: aiohttp.ClientSession):
+    server = ddb_utils.FakeDdbServer(
+        characters={1: character_utils.make_character_data(1)},
+        private_entity_ids={2},
+    )
+
+    async with ddb_utils.run_fake_ddb_server(server) as base_url:
+        client = _make_client(base_client, base_url)
+
+        assert (await client.get(1)).id == 1
+        with pytest.raises(character_protocols.CharacterRepositoryProtocol.AccessError):
+            await client.get(2)
+        with pytest.raises(character_protocols.CharacterRepositoryProtocol.NotFoundError):
+            await client.get(3)
+
+        server.profile = ddb_utils.FakeDdbProfile(error_rate=1)
+        with pytest.raises(character_protocols.CharacterRepositoryProtocol.ResponseParseError):
+            await client.get(1)
+
+        server.profile = ddb_utils.FakeDdbProfile(oversized_rate=1, oversized_body_bytes=1024 * 1024)
+        client = dataclasses.replace(client, max_response_bytes=512 * 1024)
+        with pytest.raises(character_protocols.CharacterRepositoryProtocol.ResponseParseError):
+            await client.get(1)
+
+
+@pytest.mark.asyncio
+async def test_get_recorded_characters(base_client: aiohttp.ClientSession, tmp_path: pathlib.Path):
+    raw_data = character_utils.make_character_data(1)
+    (tmp_path / "1.json").write_bytes(orjson.dumps(character_utils.make_character_response(raw_data)))
+
+    server = ddb_utils.FakeDdbServer(
+        characters=ddb_utils.load_recorded_characters(tmp_path),
+        synthetic_characters_enabled=True,
+    )
+
+    async with ddb_utils.run_fake_ddb_server(server) as base_url:
+        client = _make_client(base_client, base_url)
+
+        assert await client.get(1) == character_clients.derive_character(raw_data)
+        assert (await client.get(2)).name == "Character 2"
@@ -0,0 +1,35 @@
+import random
+
+import pytest
+
+import lib.character.clients as character_clients
+import lib.character.protocols as character_protocols
+import tests.utils.character as character_utils
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_derive_characters(seed: int):
+    rng = random.Random(seed)
+    raw_datas = [character_utils.make_character_data(entity_id, rng=rng) for entity_id in range(100)]
+
+    expected = [character_clients.derive_character(raw_data) for raw_data in raw_datas]
+
+    assert character_clients.derive_characters(raw_datas) == expected
+
+
+def test_derive_characters_fallback():
+    raw_datas = [character_utils.make_character_data(entity_id) for entity_id in range(4)]
+    raw_datas[1]["stats"][0]["value"] = "12"
+    raw_datas[2]["modifiers"]["race"][0]["bonusTypes"] = [2]
+    del raw_datas[3]["name"]
+
+    result = character_clients.derive_characters(raw_datas)
+
+    assert result[0] == character_clients.derive_character(raw_datas[0])
+    assert result[1] == character_clients.derive_character(raw_datas[1])
+    assert isinstance(result[2], character_protocols.CharacterRepositoryProtocol.ResponseParseError)
+    assert isinstance(result[3], character_protocols.CharacterRepositoryProtocol.ResponseParseError)
+
+
+def test_derive_characters_empty():
+    assert character_clients.derive_characters([]) == []
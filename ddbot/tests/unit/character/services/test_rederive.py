@@ -0,0 +1,80 @@
+import pathlib
+import typing
+
+import pytest
+import pytest_asyncio
+
+import lib.character.archives as character_archives
+import lib.character.models as character_models
+import lib.character.services as character_services
+import lib.utils.cache as cache_utils
+
+
+def _derive(raw_datas: typing.Sequence[dict[str, typing.Any]]) -> list[character_models.Character | Exception]:
+    return [
+        (
+            ValueError("Broken raw data")
+            if raw_data.get("broken")
+            else character_models.Character.from_mappings(
+                id=raw_data["id"],
+                name=raw_data["name"],
+                abilities={ability: 10 for ability in character_models.ABILITIES},
+                saving_throw_modifiers={ability: 0 for ability in character_models.ABILITIES},
+                skill_modifiers={skill: 0 for skill in character_models.SKILLS},
+                initiative_modifier=0,
+                death_saving_throw_modifier=0,
+            )
+        )
+        for raw_data in raw_datas
+    ]
+
+
+@pytest_asyncio.fixture(name="archive")
+async def fixture_archive(tmp_path: pathlib.Path) -> character_archives.LocalCharacterArchive:
+    archive = character_archives.LocalCharacterArchive(path=tmp_path / "archive")
+    await archive.set(1, {"id": 1, "name": "First"})
+    await archive.set(2, {"id": 2, "name": "Second"})
+    await archive.set(3, {"broken": True})
+
+    return archive
+
+
+@pytest.fixture(name="rederive_service")
+def fixture_rederive_service(
+    archive: character_archives.LocalCharacterArchive,
+) -> character_services.CharacterRederiveService:
+    return character_services.CharacterRederiveService(archive=archive, derive=_derive, max_workers=2, batch_size=2)
+
+
+@pytest.mark.asyncio
+async def test_rederive_all(rederive_service: character_services.CharacterRederiveService):
+    result = await rederive_service.rederive_all()
+
+    assert {entity_id: character.name for entity_id, character in result.characters.items()} == {
+        1: "First",
+        2: "Second",
+    }
+    assert result.failed_entity_ids == [3]
+
+
+@pytest.mark.asyncio
+async def test_warmup_is_bounded(
+    rederive_service: character_services.CharacterRederiveService,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    rederived_entity_ids: list[int] = []
+    rederive = rederive_service.rederive
+
+    async def record_rederive(entity_ids: typing.Sequence[int]) -> character_models.RederiveResult:
+        rederived_entity_ids.extend(entity_ids)
+        return await rederive(entity_ids)
+
+    monkeypatch.setattr(rederive_service, "rederive", record_rederive)
+    character_service = character_services.CharacterService(
+        repository=None,  # pyright: ignore[reportArgumentType]
+        cache=cache_utils.NoCache[character_models.Character](),
+    )
+
+    await character_service.warmup(rederive_service=rederive_service, max_characters=2)
+
+    assert len(rederived_entity_ids) == 2
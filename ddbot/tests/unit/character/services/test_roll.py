@@ -2,10 +2,10 @@ import random
 import typing
 
 import pytest
-import pytest_mock
 
 import lib.character.models as character_models
 import lib.character.services as character_services
+import tests.utils.character as character_utils
 
 
 @pytest.fixture(name="fixed_random_seed")
@@ -29,14 +29,12 @@ def fixture_fixed_random_seed() -> typing.Generator[None, None, None]:
     ],
 )
 async def test_roll_ability_check(
-    mocker: pytest_mock.MockFixture,
     ability_value: int,
     expected_result: character_models.RollResult,
 ):
     ability = character_models.CharacterAbility.STRENGTH
     service = character_services.RollService()
-    character = mocker.Mock(spec=character_models.Character)
-    character.abilities = {ability: ability_value}
+    character = character_utils.make_character(abilities={ability: ability_value})
 
     result = await service.roll_ability_check(character, ability)
     assert result == expected_result
@@ -54,16 +52,16 @@ async def test_roll_ability_check(
     ],
 )
 async def test_roll_saving_throw(
-    mocker: pytest_mock.MockFixture,
     ability_value: int,
     modifier_value: int,
     expected_result: character_models.RollResult,
 ):
     ability = character_models.CharacterAbility.STRENGTH
     service = character_services.RollService()
-    character = mocker.Mock(spec=character_models.Character)
-    character.abilities = {ability: ability_value}
-    character.saving_throw_modifiers = {ability: modifier_value}
+    character = character_utils.make_character(
+        abilities={ability: ability_value},
+        saving_throw_modifiers={ability: modifier_value},
+    )
 
     result = await service.roll_saving_throw(character, ability)
     assert result == expected_result
@@ -81,20 +79,20 @@ async def test_roll_saving_throw(
     ],
 )
 async def test_roll_skill_check(
-    mocker: pytest_mock.MockFixture,
     ability_value: int,
     modifier_value: int,
     expected_result: character_models.RollResult,
 ):
-    ability = character_models.CharacterAbility.STRENGTH
+    ability = character_models.CharacterAbility.DEXTERITY
     skill = character_models.CharacterSkill.ACROBATICS
 
     service = character_services.RollService()
-    character = mocker.Mock(spec=character_models.Character)
-    character.abilities = {ability: ability_value}
-    character.skill_modifiers = {skill: modifier_value}
+    character = character_utils.make_character(
+        abilities={ability: ability_value},
+        skill_modifiers={skill: modifier_value},
+    )
 
-    result = await service.roll_skill_check(character, ability, skill)
+    result = await service.roll_skill_check(character, skill)
     assert result == expected_result
 
 
@@ -110,7 +108,6 @@ async def test_roll_skill_check(
     ],
 )
 async def test_roll_initiative(
-    mocker: pytest_mock.MockFixture,
     ability_value: int,
     modifier_value: int,
     expected_result: character_models.RollResult,
@@ -118,9 +115,10 @@ async def test_roll_initiative(
     ability = character_models.CharacterAbility.DEXTERITY
 
     service = character_services.RollService()
-    character = mocker.Mock(spec=character_models.Character)
-    character.abilities = {ability: ability_value}
-    character.initiative_modifier = modifier_value
+    character = character_utils.make_character(
+        abilities={ability: ability_value},
+        initiative_modifier=modifier_value,
+    )
 
     result = await service.roll_initiative(character)
     assert result == expected_result
@@ -138,13 +136,11 @@ async def test_roll_initiative(
     ],
 )
 async def test_roll_death_saving_throw(
-    mocker: pytest_mock.MockFixture,
     modifier_value: int,
     expected_result: character_models.RollResult,
 ):
     service = character_services.RollService()
-    character = mocker.Mock(spec=character_models.Character)
-    character.death_saving_throw_modifier = modifier_value
+    character = character_utils.make_character(death_saving_throw_modifier=modifier_value)
 
     result = await service.roll_death_saving_throw(character)
     assert result == expected_result
@@ -0,0 +1,62 @@
+import dataclasses
+import random
+
+import pytest
+
+import lib.character.codec as character_codec
+import lib.character.models as character_models
+
+NAMES = ["", "Test", "Тестовый персонаж", "🐉 Dragon", "x" * 300]
+
+
+def _make_random_character(rng: random.Random) -> character_models.Character:
+    return character_models.Character.from_mappings(
+        id=rng.choice([0, 1, rng.randint(1, 2**31), 2**63 - 1]),
+        name=rng.choice(NAMES),
+        abilities={ability: rng.randint(-128, 127) for ability in character_models.ABILITIES},
+        saving_throw_modifiers={ability: rng.randint(-128, 127) for ability in character_models.ABILITIES},
+        skill_modifiers={skill: rng.randint(-128, 127) for skill in character_models.SKILLS},
+        initiative_modifier=rng.randint(-128, 127),
+        death_saving_throw_modifier=rng.randint(-128, 127),
+    )
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_codec_round_trip(seed: int):
+    rng = random.Random(seed)
+
+    for _ in range(50):
+        character = _make_random_character(rng)
+        data = character_codec.CharacterCodec.encode(character)
+
+        assert data[0] == character_codec.CharacterCodec.VERSION
+        decoded = character_codec.CharacterCodec.decode(data)
+        assert decoded == character
+        assert decoded.roll_modifiers == character.roll_modifiers
+
+
+def test_codec_size():
+    character = dataclasses.replace(_make_random_character(random.Random(42)), name="Test")
+
+    assert len(character_codec.CharacterCodec.encode(character)) == 43 + len("Test")
+
+
+def test_codec_encode_out_of_range():
+    character = dataclasses.replace(_make_random_character(random.Random(42)), initiative_modifier=128)
+
+    with pytest.raises(character_codec.CharacterCodec.EncodeError):
+        character_codec.CharacterCodec.encode(character)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_codec_decode_invalid(seed: int):
+    data = character_codec.CharacterCodec.encode(_make_random_character(random.Random(seed)))
+
+    with pytest.raises(character_codec.CharacterCodec.DecodeError):
+        character_codec.CharacterCodec.decode(b"")
+    with pytest.raises(character_codec.CharacterCodec.UnsupportedVersionError):
+        character_codec.CharacterCodec.decode(bytes([0]) + data[1:])
+    with pytest.raises(character_codec.CharacterCodec.DecodeError):
+        character_codec.CharacterCodec.decode(data[:20])
+    with pytest.raises(character_codec.CharacterCodec.DecodeError):
+        character_codec.CharacterCodec.decode(data + b"\x00")
@@ -0,0 +1,63 @@
+import dataclasses
+import random
+
+import pytest
+
+import lib.character.models as character_models
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_character_roll_modifiers(seed: int):
+    rng = random.Random(seed)
+    abilities = {ability: rng.randint(1, 20) for ability in character_models.ABILITIES}
+    saving_throw_modifiers = {ability: rng.randint(0, 6) for ability in character_models.ABILITIES}
+    skill_modifiers = {skill: rng.randint(0, 12) for skill in character_models.SKILLS}
+
+    character = character_models.Character.from_mappings(
+        id=1,
+        name="Test",
+        abilities=abilities,
+        saving_throw_modifiers=saving_throw_modifiers,
+        skill_modifiers=skill_modifiers,
+        initiative_modifier=3,
+        death_saving_throw_modifier=1,
+    )
+
+    assert len(character.roll_modifiers) == character_models.ROLL_COUNT
+    for ability, score in abilities.items():
+        modifier = (score - 10) // 2
+        assert character.get_ability_score(ability) == score
+        assert character.roll_modifiers[character_models.get_ability_check_roll_index(ability)] == modifier
+        assert (
+            character.roll_modifiers[character_models.get_saving_throw_roll_index(ability)]
+            == modifier + saving_throw_modifiers[ability]
+        )
+
+    for skill, skill_modifier in skill_modifiers.items():
+        ability_score = abilities[character_models.SKILL_ABILITIES[skill]]
+        assert (
+            character.roll_modifiers[character_models.get_skill_check_roll_index(skill)]
+            == (ability_score - 10) // 2 + skill_modifier
+        )
+
+    dexterity_score = abilities[character_models.CharacterAbility.DEXTERITY]
+    assert character.roll_modifiers[character_models.INITIATIVE_ROLL_INDEX] == (dexterity_score - 10) // 2 + 3
+    assert character.roll_modifiers[character_models.DEATH_SAVING_THROW_ROLL_INDEX] == 1
+
+
+def test_character_is_hashable_and_immutable():
+    character = character_models.Character.from_mappings(
+        id=1,
+        name="Test",
+        abilities={ability: 10 for ability in character_models.ABILITIES},
+        saving_throw_modifiers={ability: 0 for ability in character_models.ABILITIES},
+        skill_modifiers={skill: 0 for skill in character_models.SKILLS},
+        initiative_modifier=0,
+        death_saving_throw_modifier=0,
+    )
+    same_character = dataclasses.replace(character)
+
+    assert same_character == character
+    assert hash(same_character) == hash(character)
+    with pytest.raises(TypeError):
+        character.ability_scores[0] = 20  # pyright: ignore[reportIndexIssue]
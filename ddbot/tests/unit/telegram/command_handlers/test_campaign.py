@@ -0,0 +1,67 @@
+import dataclasses
+
+import aiogram.methods as aiogram_methods
+import aiogram.types as aiogram_types
+import pytest
+
+import lib.character.models as character_models
+import lib.telegram.command_handlers as telegram_command_handlers
+import lib.telegram.messages as telegram_messages
+import tests.utils.character as character_utils
+import tests.utils.telegram as telegram_utils
+
+ADMIN_USER_ID = 1
+MEMBER_USER_ID = 2
+
+
+@dataclasses.dataclass
+class _Bot:
+    async def get_chat_member(self, chat_id: int, user_id: int) -> aiogram_types.ChatMember:
+        user = telegram_utils.make_user(user_id)
+        if user_id == ADMIN_USER_ID:
+            return aiogram_types.ChatMemberOwner(user=user, is_anonymous=False)
+        return aiogram_types.ChatMemberMember(user=user)
+
+
+@dataclasses.dataclass
+class _CharacterService(character_utils.FakeCharacterService):
+    imported_campaign_ids: list[int] = dataclasses.field(default_factory=list)
+
+    async def import_campaign(self, campaign_id: int) -> character_models.CampaignImportResult:
+        self.imported_campaign_ids.append(campaign_id)
+        return character_models.CampaignImportResult(campaign=character_models.Campaign(id=campaign_id, characters=[]))
+
+
+@pytest.fixture(name="character_service")
+def fixture_character_service() -> _CharacterService:
+    return _CharacterService()
+
+
+@pytest.fixture(name="handler")
+def fixture_handler(character_service: _CharacterService) -> telegram_command_handlers.CampaignSetCommandHandler:
+    return telegram_command_handlers.CampaignSetCommandHandler(character_service=character_service)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("user_id", "chat_type", "imported"),
+    [
+        (ADMIN_USER_ID, "group", True),
+        (MEMBER_USER_ID, "group", False),
+        (MEMBER_USER_ID, "private", True),
+    ],
+)
+async def test_campaign_set_is_restricted_to_chat_admins(
+    handler: telegram_command_handlers.CampaignSetCommandHandler,
+    character_service: _CharacterService,
+    user_id: int,
+    chat_type: str,
+    imported: bool,
+):
+    message = telegram_utils.make_message("/campaign_set 42", user_id=user_id, chat_type=chat_type)
+
+    reply = await handler.process(message, _Bot())  # pyright: ignore[reportArgumentType]
+
+    assert isinstance(reply, aiogram_methods.SendMessage)
+    assert character_service.imported_campaign_ids == ([42] if imported else [])
+    assert (reply.text == telegram_messages.CAMPAIGN_SET_NOT_ADMIN) is not imported
@@ -0,0 +1,92 @@
+import aiogram.methods as aiogram_methods
+import aiogram.types as aiogram_types
+import pytest
+
+import lib.character.models as character_models
+import lib.context.models as context_models
+import lib.context.repositories as context_repositories
+import lib.context.services as context_services
+import lib.telegram.inline_query_handlers as telegram_inline_query_handlers
+import tests.utils.character as character_utils
+import tests.utils.telegram as telegram_utils
+
+USER_ID = 7
+DEXTERITY = character_models.CharacterAbility.DEXTERITY
+
+
+@pytest.fixture(name="characters")
+def fixture_characters() -> dict[int, character_models.Character]:
+    return {1: character_utils.make_character(abilities={DEXTERITY: 14}, initiative_modifier=2)}
+
+
+@pytest.fixture(name="context_service")
+def fixture_context_service() -> context_services.LocalContextService:
+    return context_services.LocalContextService(repository=context_repositories.LocalContextRepository())
+
+
+@pytest.fixture(name="handler")
+def fixture_handler(
+    characters: dict[int, character_models.Character],
+    context_service: context_services.LocalContextService,
+) -> telegram_inline_query_handlers.CharacterInlineQueryHandler:
+    return telegram_inline_query_handlers.CharacterInlineQueryHandler(
+        context_service=context_service,
+        character_service=character_utils.FakeCharacterService(characters=characters),
+        cache_time_seconds=60,
+    )
+
+
+@pytest.mark.asyncio
+async def test_character_inline_query_handler_renders_private_character(
+    handler: telegram_inline_query_handlers.CharacterInlineQueryHandler,
+    context_service: context_services.LocalContextService,
+):
+    await context_service.set(f"telegram_{USER_ID}_{USER_ID}", context_models.Context(character_id=1))
+
+    answer = await handler.process(telegram_utils.make_inline_query(user_id=USER_ID))
+
+    assert isinstance(answer, aiogram_methods.AnswerInlineQuery)
+    assert answer.cache_time == 60
+    assert answer.is_personal is True
+    assert [result.id for result in answer.results] == ["checks", "saves", "skills"]
+
+    checks = answer.results[0]
+    assert isinstance(checks, aiogram_types.InlineQueryResultArticle)
+    assert checks.title == "Character 1: Ability checks"
+    assert isinstance(checks.input_message_content, aiogram_types.InputTextMessageContent)
+    assert checks.input_message_content.message_text.splitlines()[:3] == [
+        "Character 1, Ability checks:",
+        "Strength check: +0",
+        "Dexterity check: +2",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_character_inline_query_handler_memoizes_results_per_character_version(
+    handler: telegram_inline_query_handlers.CharacterInlineQueryHandler,
+    characters: dict[int, character_models.Character],
+):
+    first = await handler.process(telegram_utils.make_inline_query("1", user_id=USER_ID))
+    second = await handler.process(telegram_utils.make_inline_query("1", user_id=USER_ID))
+    assert first is not None and second is not None
+    assert all(first_result is second_result for first_result, second_result in zip(first.results, second.results))
+
+    characters[1] = character_utils.make_character(abilities={DEXTERITY: 18}, initiative_modifier=2)
+    updated = await handler.process(telegram_utils.make_inline_query("1", user_id=USER_ID))
+    assert updated is not None
+    assert updated.results[0] is not first.results[0]
+    assert "Dexterity check: +4" in updated.results[0].input_message_content.message_text  # pyright: ignore
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("query", ["", "2"])
+async def test_character_inline_query_handler_asks_to_set_character(
+    handler: telegram_inline_query_handlers.CharacterInlineQueryHandler,
+    query: str,
+):
+    answer = await handler.process(telegram_utils.make_inline_query(query, user_id=USER_ID))
+
+    assert answer is not None
+    assert answer.results == []
+    assert answer.button is not None
+    assert answer.button.start_parameter == "inline"
@@ -0,0 +1,41 @@
+import aiogram.types as aiogram_types
+import pytest
+
+import lib.utils.aiogram as aiogram_utils
+
+
+def test_compact_callback_data_codec():
+    codec = aiogram_utils.CompactCallbackDataCodec[str](prefix="r", values=[f"value_{index}" for index in range(32)])
+
+    assert codec.encode("value_0") == "r0"
+    assert codec.encode("value_10") == "ra"
+    assert codec.encode("value_31") == "rv"
+    assert all(codec.decode(codec.encode(value)) == value for value in codec.values)
+    assert codec.decode("rw") is None
+    assert codec.decode("x0") is None
+
+
+def test_compact_callback_data_codec_widens_for_many_values():
+    codec = aiogram_utils.CompactCallbackDataCodec[int](prefix="", values=list(range(63)))
+
+    assert codec.encode(0) == "00"
+    assert codec.encode(62) == "10"
+    assert len(set(codec.table)) == 63
+
+
+@pytest.mark.asyncio
+async def test_callback_data_table_filter():
+    codec = aiogram_utils.CompactCallbackDataCodec[str](prefix="r", values=["one", "two"])
+    callback_filter = aiogram_utils.CallbackDataTableFilter[str](table=codec.table, result_key="value")
+
+    def make_callback_query(data: str | None) -> aiogram_types.CallbackQuery:
+        return aiogram_types.CallbackQuery(
+            id="1",
+            chat_instance="1",
+            from_user=aiogram_types.User(id=1, is_bot=False, first_name="User"),
+            data=data,
+        )
+
+    assert await callback_filter(make_callback_query("r1")) == {"value": "two"}
+    assert await callback_filter(make_callback_query("r2")) is False
+    assert await callback_filter(make_callback_query(None)) is False
@@ -0,0 +1,80 @@
+import asyncio
+import logging
+import typing
+
+import aiogram
+import aiogram.methods as aiogram_methods
+import aiogram.types as aiogram_types
+import pytest
+import pytest_asyncio
+
+import lib.utils.aiogram as aiogram_utils
+
+logger = logging.getLogger(__name__)
+
+BOT_TOKEN = "123456:ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghi"
+
+
+def _make_reply(message_id: int, chat_id: int) -> aiogram_utils.CoalescedReply:
+    message = aiogram_types.Message.model_validate(
+        {
+            "message_id": message_id,
+            "date": 0,
+            "chat": {"id": chat_id, "type": "group"},
+            "from": {"id": message_id, "is_bot": False, "first_name": "User"},
+            "text": "/stealth",
+        }
+    )
+    return aiogram_utils.CoalescedReply(message=message, text=f"text {message_id}", line=f"line {message_id}")
+
+
+@pytest_asyncio.fixture(name="calls")
+async def fixture_calls(monkeypatch: pytest.MonkeyPatch) -> list[aiogram_methods.SendMessage]:
+    calls: list[aiogram_methods.SendMessage] = []
+
+    async def call(self: aiogram.Bot, method: aiogram_methods.SendMessage, request_timeout: int | None = None) -> None:
+        calls.append(method)
+
+    monkeypatch.setattr(aiogram.Bot, "__call__", call)
+    return calls
+
+
+@pytest_asyncio.fixture(name="bot")
+async def fixture_bot() -> typing.AsyncGenerator[aiogram.Bot, None]:
+    bot = aiogram.Bot(token=BOT_TOKEN)
+    yield bot
+    await bot.session.close()
+
+
+@pytest.mark.asyncio
+async def test_reply_coalescer_merges_replies_per_chat(bot: aiogram.Bot, calls: list[aiogram_methods.SendMessage]):
+    coalescer = aiogram_utils.ReplyCoalescer(logger=logger, bot=bot, window_seconds=0.05)
+
+    coalescer.add(_make_reply(1, chat_id=-1))
+    coalescer.add(_make_reply(2, chat_id=-1))
+    coalescer.add(_make_reply(3, chat_id=-2))
+    await asyncio.sleep(0.1)
+
+    assert len(calls) == 2
+    merged, reply = sorted(calls, key=lambda call: call.chat_id, reverse=True)
+    assert (merged.chat_id, merged.text) == (-1, "line 1\nline 2")
+    assert merged.reply_parameters is None
+    assert (reply.chat_id, reply.text) == (-2, "text 3")
+    assert reply.reply_parameters is not None
+    assert reply.reply_parameters.message_id == 3
+
+
+@pytest.mark.asyncio
+async def test_reply_coalescer_max_replies_and_drain(bot: aiogram.Bot, calls: list[aiogram_methods.SendMessage]):
+    coalescer = aiogram_utils.ReplyCoalescer(logger=logger, bot=bot, window_seconds=10, max_replies=2)
+
+    for message_id in range(1, 4):
+        coalescer.add(_make_reply(message_id, chat_id=-1))
+    await asyncio.sleep(0.01)
+
+    assert [call.text for call in calls] == ["line 1\nline 2"]
+
+    async with asyncio.timeout(1):
+        await coalescer.drain()
+
+    assert [call.text for call in calls] == ["line 1\nline 2", "text 3"]
@@ -0,0 +1,75 @@
+import logging
+import typing
+
+import pytest
+
+import lib.utils.aiogram as aiogram_utils
+
+logger = logging.getLogger(__name__)
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.data: dict[str, typing.Any] = {}
+        self.fail = False
+
+    async def set(self, key: str, value: typing.Any, nx: bool = False, ex: int | None = None) -> bool | None:
+        if self.fail:
+            raise ConnectionError("test")
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def delete(self, key: str) -> int:
+        return int(self.data.pop(key, None) is not None)
+
+
+@pytest.mark.asyncio
+async def test_local_update_deduplicator():
+    deduplicator = aiogram_utils.LocalUpdateDeduplicator(window_size=2)
+
+    assert await deduplicator.is_new(1) is True
+    assert await deduplicator.is_new(1) is False
+    assert await deduplicator.is_new(2) is True
+    assert await deduplicator.is_new(3) is True
+    # 1 has left the window
+    assert await deduplicator.is_new(1) is True
+
+    await deduplicator.release(3)
+    assert await deduplicator.is_new(3) is True
+
+
+@pytest.mark.asyncio
+async def test_redis_update_deduplicator_shared_between_replicas():
+    redis_client = _FakeRedis()
+    first, second = (
+        aiogram_utils.RedisUpdateDeduplicator(
+            logger=logger,
+            redis_client=redis_client,  # pyright: ignore[reportArgumentType]
+            bot_id=42,
+        )
+        for _ in range(2)
+    )
+
+    assert await first.is_new(1) is True
+    assert await second.is_new(1) is False
+    assert list(redis_client.data) == ["telegram_update:42:1"]
+
+    await first.release(1)
+    assert await first.is_new(1) is True
+
+
+@pytest.mark.asyncio
+async def test_redis_update_deduplicator_lets_updates_through_on_errors():
+    redis_client = _FakeRedis()
+    redis_client.fail = True
+    deduplicator = aiogram_utils.RedisUpdateDeduplicator(
+        logger=logger,
+        redis_client=redis_client,  # pyright: ignore[reportArgumentType]
+        bot_id=42,
+    )
+
+    assert await deduplicator.is_new(1) is True
+    # local window still catches redeliveries to the same process
+    assert await deduplicator.is_new(1) is False
@@ -0,0 +1,51 @@
+import typing
+
+import aiogram.types as aiogram_types
+import pytest
+
+import lib.utils.aiogram as aiogram_utils
+import tests.utils.telegram as telegram_utils
+
+
+class _Bot:
+    async def me(self) -> aiogram_types.User:
+        return aiogram_types.User(id=1, is_bot=True, first_name="Bot", username="DdBot")
+
+
+@pytest.fixture(name="command_filter")
+def fixture_command_filter() -> aiogram_utils.CommandTableMessageFilter[int]:
+    return aiogram_utils.CommandTableMessageFilter[int](table={"one": 1, "two": 2}, result_key="value")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("/one", {"value": 1}),
+        ("/two some args", {"value": 2}),
+        ("/one@DdBot", {"value": 1}),
+        ("/one@ddbot args", {"value": 1}),
+        ("/one@OtherBot", False),
+        ("/three", False),
+        ("/One", False),
+        ("one", False),
+        ("/ one", False),
+        ("/", False),
+        (None, False),
+    ],
+)
+async def test_command_table_filter(
+    command_filter: aiogram_utils.CommandTableMessageFilter[int],
+    text: str | None,
+    expected: typing.Any,
+):
+    message = telegram_utils.make_message(text, chat_type="private")
+
+    assert await command_filter(message, _Bot()) == expected  # pyright: ignore[reportArgumentType]
+
+
+@pytest.mark.asyncio
+async def test_command_table_filter_matches_caption(command_filter: aiogram_utils.CommandTableMessageFilter[int]):
+    message = telegram_utils.make_message(None, chat_type="private", caption="/two@DdBot")
+
+    assert await command_filter(message, _Bot()) == {"value": 2}  # pyright: ignore[reportArgumentType]
@@ -0,0 +1,114 @@
+import logging
+import typing
+
+import aiogram
+import aiogram.types as aiogram_types
+import pytest
+
+import lib.utils.aiogram as aiogram_utils
+
+logger = logging.getLogger(__name__)
+
+BOT_TOKEN = "123456:ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghi"
+
+
+async def _noop(message: aiogram_types.Message) -> None:
+    pass
+
+
+@pytest.mark.asyncio
+async def test_setup_telegram_webhook_restricts_allowed_updates(monkeypatch: pytest.MonkeyPatch):
+    bot = aiogram.Bot(token=BOT_TOKEN)
+    dispatcher = aiogram.Dispatcher()
+    dispatcher.message.register(_noop)
+
+    calls: list[dict[str, typing.Any]] = []
+
+    async def set_webhook(**kwargs: typing.Any) -> bool:
+        calls.append(kwargs)
+        return True
+
+    monkeypatch.setattr(bot, "set_webhook", set_webhook)
+
+    lifecycle = aiogram_utils.Lifecycle(
+        logger=logger,
+        bot=bot,
+        dispatcher=dispatcher,
+        name="name",
+        description="description",
+        short_description="short description",
+        commands=[],
+        webhook=aiogram_utils.Lifecycle.Webhook(url="https://example.com", secret_token="secret", max_connections=16),
+    )
+    try:
+        await lifecycle.setup_telegram_webhook()
+    finally:
+        await bot.session.close()
+
+    assert calls == [
+        {
+            "url": "https://example.com",
+            "secret_token": "secret",
+            "allowed_updates": ["message"],
+            "max_connections": 16,
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_setup_telegram_once_runs_setup_on_single_replica():
+    bot = aiogram.Bot(token=BOT_TOKEN)
+    dispatcher = aiogram.Dispatcher()
+    dispatcher.message.register(_noop)
+
+    class _SetupLock:
+        def __init__(self) -> None:
+            self.claimed: set[str] = set()
+            self.completed: set[str] = set()
+
+        async def acquire(self, fingerprint: str) -> bool:
+            if fingerprint in self.claimed:
+                return False
+            self.claimed.add(fingerprint)
+            return True
+
+        async def complete(self, fingerprint: str) -> None:
+            self.completed.add(fingerprint)
+
+        async def release(self, fingerprint: str) -> None:
+            self.claimed.discard(fingerprint)
+
+    setup_lock = _SetupLock()
+    setups: list[str] = []
+
+    def make_lifecycle(name: str) -> aiogram_utils.Lifecycle:
+        lifecycle = aiogram_utils.Lifecycle(
+            logger=logger,
+            bot=bot,
+            dispatcher=dispatcher,
+            name=name,
+            description="description",
+            short_description="short description",
+            commands=[aiogram_types.BotCommand(command="help", description="help")],
+            setup_lock=setup_lock,
+        )
+
+        async def setup_telegram() -> None:
+            setups.append(lifecycle.name)
+
+        object.__setattr__(lifecycle, "setup_telegram", setup_telegram)
+        return lifecycle
+
+    try:
+        first, second, renamed = make_lifecycle("name"), make_lifecycle("name"), make_lifecycle("new name")
+        assert first.get_fingerprint() == second.get_fingerprint() != renamed.get_fingerprint()
+
+        for lifecycle in (first, second, renamed):
+            callbacks = lifecycle.get_startup_callbacks()
+            assert len(callbacks) == 1
+            await callbacks[0].awaitable
+    finally:
+        await bot.session.close()
+
+    assert setups == ["name", "new name"]
+    assert setup_lock.completed == {first.get_fingerprint(), renamed.get_fingerprint()}
@@ -0,0 +1,245 @@
+import asyncio
+import logging
+import typing
+
+import aiogram
+import aiogram.methods as aiogram_methods
+import aiogram.types as aiogram_types
+import aiogram.utils.backoff as aiogram_backoff
+import pytest
+import pytest_asyncio
+
+import lib.utils.aiogram as aiogram_utils
+
+logger = logging.getLogger(__name__)
+
+BOT_TOKEN = "123456:ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghi"
+SLOW_CHAT_ID = 1
+FAST_CHAT_ID = 2
+
+
+def _make_update(update_id: int, chat_id: int) -> aiogram_types.Update:
+    return aiogram_types.Update.model_validate(
+        {
+            "update_id": update_id,
+            "message": {
+                "message_id": update_id,
+                "date": 0,
+                "chat": {"id": chat_id, "type": "private"},
+                "from": {"id": chat_id, "is_bot": False, "first_name": "User"},
+                "text": "/test",
+            },
+        }
+    )
+
+
+class _Handler:
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.processed: list[tuple[int, int]] = []
+
+    async def process(self, message: aiogram_types.Message) -> None:
+        if message.chat.id == SLOW_CHAT_ID:
+            await self.release.wait()
+            # Yield so a worker processing chat updates out of order would be caught
+            await asyncio.sleep(0)
+        self.processed.append((message.chat.id, message.message_id))
+
+
+@pytest_asyncio.fixture(name="bot")
+async def fixture_bot() -> typing.AsyncGenerator[aiogram.Bot, None]:
+    bot = aiogram.Bot(token=BOT_TOKEN)
+    yield bot
+    await bot.session.close()
+
+
+@pytest.fixture(name="handler")
+def fixture_handler() -> _Handler:
+    return _Handler()
+
+
+async def _wait_for(condition: typing.Callable[[], bool]) -> None:
+    async with asyncio.timeout(1):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_sharded_polling_keeps_chat_order_and_processes_chats_in_parallel(
+    bot: aiogram.Bot,
+    handler: _Handler,
+):
+    dispatcher = aiogram.Dispatcher()
+    dispatcher.message.register(handler.process)
+
+    updates = [
+        _make_update(1, SLOW_CHAT_ID),
+        _make_update(2, FAST_CHAT_ID),
+        _make_update(3, SLOW_CHAT_ID),
+        _make_update(4, FAST_CHAT_ID),
+        _make_update(5, SLOW_CHAT_ID),
+    ]
+
+    async def listen_updates() -> typing.AsyncGenerator[aiogram_types.Update, None]:
+        for update in updates:
+            yield update
+        await asyncio.Event().wait()
+
+    polling = aiogram_utils.ShardedPolling(logger=logger, bot=bot, dispatcher=dispatcher, workers_count=2)
+    polling._listen_updates = listen_updates  # pyright: ignore[reportAttributeAccessIssue]
+
+    tasks = polling.get_main_tasks()
+    try:
+        await _wait_for(lambda: len(handler.processed) == 2)
+        assert handler.processed == [(FAST_CHAT_ID, 2), (FAST_CHAT_ID, 4)]
+
+        handler.release.set()
+        await _wait_for(lambda: len(handler.processed) == 5)
+        assert [update_id for chat_id, update_id in handler.processed if chat_id == SLOW_CHAT_ID] == [1, 3, 5]
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_sharded_polling_survives_handler_errors(bot: aiogram.Bot):
+    processed: list[int] = []
+
+    async def process(message: aiogram_types.Message) -> None:
+        if message.message_id == 1:
+            raise ValueError("test")
+        processed.append(message.message_id)
+
+    dispatcher = aiogram.Dispatcher()
+    dispatcher.message.register(process)
+
+    async def listen_updates() -> typing.AsyncGenerator[aiogram_types.Update, None]:
+        yield _make_update(1, SLOW_CHAT_ID)
+        yield _make_update(2, SLOW_CHAT_ID)
+        await asyncio.Event().wait()
+
+    polling = aiogram_utils.ShardedPolling(logger=logger, bot=bot, dispatcher=dispatcher, workers_count=1)
+    polling._listen_updates = listen_updates  # pyright: ignore[reportAttributeAccessIssue]
+
+    tasks = polling.get_main_tasks()
+    try:
+        await _wait_for(lambda: processed == [2])
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def test_get_update_shard_key():
+    update = _make_update(1, FAST_CHAT_ID)
+    assert aiogram_utils.get_update_shard_key(update) == FAST_CHAT_ID
+
+    callback_update = aiogram_types.Update.model_validate(
+        {
+            "update_id": 10,
+            "callback_query": {
+                "id": "1",
+                "chat_instance": "1",
+                "from": {"id": 7, "is_bot": False, "first_name": "User"},
+                "message": {"message_id": 1, "date": 0, "chat": {"id": -100, "type": "group"}},
+            },
+        }
+    )
+    assert aiogram_utils.get_update_shard_key(callback_update) == -100
+
+    inline_update = aiogram_types.Update.model_validate(
+        {
+            "update_id": 11,
+            "inline_query": {
+                "id": "1",
+                "query": "",
+                "offset": "",
+                "from": {"id": 7, "is_bot": False, "first_name": "User"},
+            },
+        }
+    )
+    assert aiogram_utils.get_update_shard_key(inline_update) == 7
+
+
+@pytest.mark.asyncio
+async def test_sharded_polling_drain(bot: aiogram.Bot, handler: _Handler, monkeypatch: pytest.MonkeyPatch):
+    dispatcher = aiogram.Dispatcher()
+    dispatcher.message.register(handler.process)
+
+    async def listen_updates() -> typing.AsyncGenerator[aiogram_types.Update, None]:
+        yield _make_update(1, SLOW_CHAT_ID)
+        yield _make_update(2, SLOW_CHAT_ID)
+        await asyncio.Event().wait()
+
+    calls: list[aiogram_methods.TelegramMethod[typing.Any]] = []
+
+    async def call(
+        self: aiogram.Bot,
+        method: aiogram_methods.TelegramMethod[typing.Any],
+        request_timeout: int | None = None,
+    ) -> None:
+        calls.append(method)
+
+    polling = aiogram_utils.ShardedPolling(logger=logger, bot=bot, dispatcher=dispatcher, workers_count=1)
+    polling._listen_updates = listen_updates  # pyright: ignore[reportAttributeAccessIssue]
+    monkeypatch.setattr(aiogram.Bot, "__call__", call)
+
+    tasks = polling.get_main_tasks()
+    try:
+        await _wait_for(lambda: polling._last_update_id == 2)  # pyright: ignore[reportPrivateUsage]
+
+        drain_task = asyncio.create_task(polling.drain())
+        await asyncio.sleep(0.05)
+        assert not drain_task.done()
+
+        handler.release.set()
+        await drain_task
+        assert handler.processed == [(SLOW_CHAT_ID, 1), (SLOW_CHAT_ID, 2)]
+        assert tasks[0].cancelled()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert len(calls) == 1
+    assert isinstance(calls[0], aiogram_methods.GetUpdates)
+    assert calls[0].offset == 3
+
+
+@pytest.mark.asyncio
+async def test_sharded_polling_listen_updates_retries_and_confirms(bot: aiogram.Bot, monkeypatch: pytest.MonkeyPatch):
+    responses: list[list[aiogram_types.Update] | Exception] = [
+        ValueError("test"),
+        [_make_update(1, SLOW_CHAT_ID), _make_update(2, FAST_CHAT_ID)],
+        [_make_update(3, SLOW_CHAT_ID)],
+    ]
+    offsets: list[int | None] = []
+
+    async def call(
+        self: aiogram.Bot,
+        method: aiogram_methods.GetUpdates,
+        request_timeout: int | None = None,
+    ) -> list[aiogram_types.Update]:
+        offsets.append(method.offset)
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    polling = aiogram_utils.ShardedPolling(
+        logger=logger,
+        bot=bot,
+        dispatcher=aiogram.Dispatcher(),
+        backoff_config=aiogram_backoff.BackoffConfig(min_delay=0.01, max_delay=0.02, factor=1.5, jitter=0),
+    )
+    monkeypatch.setattr(aiogram.Bot, "__call__", call)
+
+    update_ids: list[int] = []
+    async for update in polling._listen_updates():  # pyright: ignore[reportPrivateUsage]
+        update_ids.append(update.update_id)
+        if len(update_ids) == 3:
+            break
+
+    assert update_ids == [1, 2, 3]
+    assert offsets == [None, None, 3]
@@ -0,0 +1,47 @@
+import typing
+
+import pytest
+
+import lib.utils.aiogram as aiogram_utils
+
+
+def _make_update(text: str | None) -> dict[str, typing.Any]:
+    message: dict[str, typing.Any] = {"message_id": 1, "date": 0, "chat": {"id": -1, "type": "group"}}
+    if text is not None:
+        message["text"] = text
+
+    return {"update_id": 1, "message": message}
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("/roll", True),
+        ("/roll args", True),
+        ("/roll@ddbot args", True),
+        ("/roll_other", False),
+        ("/", False),
+        ("roll", False),
+        ("hello /roll", False),
+        ("", False),
+        (None, False),
+    ],
+)
+def test_command_update_prefilter(text: str | None, expected: bool):
+    prefilter = aiogram_utils.CommandUpdatePrefilter(commands=frozenset(["roll"]))
+
+    assert prefilter(_make_update(text)) is expected
+
+
+def test_command_update_prefilter_checks_caption():
+    prefilter = aiogram_utils.CommandUpdatePrefilter(commands=frozenset(["roll"]))
+    update = _make_update(None)
+    update["message"]["caption"] = "/roll"
+
+    assert prefilter(update) is True
+
+
+def test_command_update_prefilter_passes_other_updates():
+    prefilter = aiogram_utils.CommandUpdatePrefilter(commands=frozenset(["roll"]))
+
+    assert prefilter({"update_id": 1, "callback_query": {"id": "1"}}) is True
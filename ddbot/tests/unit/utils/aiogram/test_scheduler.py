@@ -0,0 +1,108 @@
+import asyncio
+import logging
+import time
+import typing
+
+import aiogram.exceptions as aiogram_exceptions
+import aiogram.methods as aiogram_methods
+import pytest
+import pytest_asyncio
+
+import lib.utils.aiogram as aiogram_utils
+
+logger = logging.getLogger(__name__)
+
+
+class _Session:
+    def __init__(self) -> None:
+        self.chat_ids: list[int] = []
+        self.retry_after_count = 0
+
+    async def make_request(self, bot: typing.Any, method: aiogram_methods.SendMessage) -> typing.Any:
+        if self.retry_after_count > 0:
+            self.retry_after_count -= 1
+            raise aiogram_exceptions.TelegramRetryAfter(method=method, message="Too Many Requests", retry_after=0)
+
+        assert isinstance(method.chat_id, int)
+        self.chat_ids.append(method.chat_id)
+
+
+@pytest_asyncio.fixture(name="scheduler_factory")
+async def fixture_scheduler_factory() -> (
+    typing.AsyncGenerator[typing.Callable[..., aiogram_utils.OutboundRateScheduler], None]
+):
+    tasks: list[asyncio.Task[typing.Any]] = []
+
+    def factory(**kwargs: typing.Any) -> aiogram_utils.OutboundRateScheduler:
+        scheduler = aiogram_utils.OutboundRateScheduler(logger=logger, **kwargs)
+        tasks.append(scheduler.get_main_task())
+        return scheduler
+
+    yield factory
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _send(scheduler: aiogram_utils.OutboundRateScheduler, session: _Session, chat_id: int) -> None:
+    await scheduler(
+        session.make_request,
+        None,  # pyright: ignore[reportArgumentType]
+        aiogram_methods.SendMessage(chat_id=chat_id, text="text"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_scheduler_per_chat_rate(scheduler_factory: typing.Callable[..., aiogram_utils.OutboundRateScheduler]):
+    scheduler = scheduler_factory(private_chat_rate=20, chat_burst=1)
+    session = _Session()
+
+    started_at = time.monotonic()
+    await asyncio.gather(*(_send(scheduler, session, 1) for _ in range(5)))
+
+    assert session.chat_ids == [1] * 5
+    assert time.monotonic() - started_at >= 4 / 20 * 0.9
+
+
+@pytest.mark.asyncio
+async def test_scheduler_fair_across_chats(
+    scheduler_factory: typing.Callable[..., aiogram_utils.OutboundRateScheduler],
+):
+    scheduler = scheduler_factory(global_rate=100, global_burst=1, private_chat_rate=100, chat_burst=10)
+    session = _Session()
+
+    busy_chat = asyncio.gather(*(_send(scheduler, session, 1) for _ in range(6)))
+    await asyncio.sleep(0)
+    quiet_chat = asyncio.gather(*(_send(scheduler, session, 2) for _ in range(2)))
+    await asyncio.gather(busy_chat, quiet_chat)
+
+    # the quiet chat is interleaved with the busy one instead of waiting for it to drain
+    assert sorted(session.chat_ids) == [1] * 6 + [2] * 2
+    assert 2 not in session.chat_ids[5:]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_retry_after(scheduler_factory: typing.Callable[..., aiogram_utils.OutboundRateScheduler]):
+    scheduler = scheduler_factory(max_retries=2)
+    session = _Session()
+
+    session.retry_after_count = 2
+    await _send(scheduler, session, 1)
+    assert session.chat_ids == [1]
+
+    session.retry_after_count = 3
+    with pytest.raises(aiogram_exceptions.TelegramRetryAfter):
+        await _send(scheduler, session, 1)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_skips_chatless_methods(
+    scheduler_factory: typing.Callable[..., aiogram_utils.OutboundRateScheduler],
+):
+    scheduler = scheduler_factory()
+
+    async def make_request(bot: typing.Any, method: aiogram_methods.GetMe) -> str:
+        return "me"
+
+    assert await scheduler(make_request, None, aiogram_methods.GetMe()) == "me"  # pyright: ignore[reportArgumentType]
@@ -0,0 +1,42 @@
+import aiogram
+import pytest
+
+import lib.utils.aiogram as aiogram_utils
+import tests.utils.telegram as telegram_utils
+
+BOT_TOKEN = "123456:ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghi"
+
+
+@pytest.mark.asyncio
+async def test_tuned_session_uses_custom_api_server():
+    server = telegram_utils.FakeTelegramServer()
+
+    async with telegram_utils.run_fake_telegram_server(server) as base_url:
+        session = aiogram_utils.TunedAiohttpSession(
+            api_base_url=base_url,
+            limit=2,
+            keepalive_timeout_seconds=5,
+            timeout_seconds=5,
+        )
+        bot = aiogram.Bot(token=BOT_TOKEN, session=session)
+
+        try:
+            me = await bot.get_me()
+            message = await bot.send_message(chat_id=42, text="test", reply_markup=None)
+            assert await bot.delete_webhook()
+        finally:
+            await bot.session.close()
+
+    assert me.id == telegram_utils.BOT_ID
+    assert message.chat.id == 42
+    assert message.text == "test"
+    assert [call.method for call in server.calls] == ["getMe", "sendMessage", "deleteWebhook"]
+    assert all(call.token == BOT_TOKEN for call in server.calls)
+
+
+def test_tuned_session_defaults_to_production_api():
+    session = aiogram_utils.TunedAiohttpSession(limit=2, keepalive_timeout_seconds=5)
+
+    assert session.api.base == "https://api.telegram.org/bot{token}/{method}"
+    assert session._connector_init["limit"] == 2  # pyright: ignore[reportPrivateUsage]
+    assert session._connector_init["keepalive_timeout"] == 5  # pyright: ignore[reportPrivateUsage]
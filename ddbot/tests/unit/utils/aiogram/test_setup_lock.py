@@ -0,0 +1,80 @@
+import logging
+import pathlib
+import typing
+
+import pytest
+
+import lib.utils.aiogram as aiogram_utils
+
+logger = logging.getLogger(__name__)
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.data: dict[str, typing.Any] = {}
+        self.fail = False
+
+    async def set(self, key: str, value: typing.Any, nx: bool = False, ex: int | None = None) -> bool | None:
+        if self.fail:
+            raise ConnectionError("test")
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def delete(self, key: str) -> int:
+        return int(self.data.pop(key, None) is not None)
+
+
+def _make_lock(redis_client: _FakeRedis) -> aiogram_utils.RedisSetupLock:
+    return aiogram_utils.RedisSetupLock(
+        logger=logger,
+        redis_client=redis_client,  # pyright: ignore[reportArgumentType]
+        bot_id=42,
+    )
+
+
+@pytest.mark.asyncio
+async def test_redis_setup_lock_shared_between_replicas():
+    redis_client = _FakeRedis()
+    first, second = _make_lock(redis_client), _make_lock(redis_client)
+
+    assert await first.acquire("fingerprint") is True
+    assert await second.acquire("fingerprint") is False
+    assert redis_client.data == {"telegram_setup:42:fingerprint": "running"}
+
+    await first.complete("fingerprint")
+    assert await second.acquire("fingerprint") is False
+    assert redis_client.data == {"telegram_setup:42:fingerprint": "done"}
+
+    assert await second.acquire("other_fingerprint") is True
+
+
+@pytest.mark.asyncio
+async def test_redis_setup_lock_release():
+    redis_client = _FakeRedis()
+    first, second = _make_lock(redis_client), _make_lock(redis_client)
+
+    assert await first.acquire("fingerprint") is True
+    await first.release("fingerprint")
+    assert await second.acquire("fingerprint") is True
+
+
+@pytest.mark.asyncio
+async def test_redis_setup_lock_fails_open():
+    redis_client = _FakeRedis()
+    redis_client.fail = True
+
+    assert await _make_lock(redis_client).acquire("fingerprint") is True
+
+
+@pytest.mark.asyncio
+async def test_local_setup_lock_remembers_last_fingerprint(tmp_path: pathlib.Path):
+    setup_lock = aiogram_utils.LocalSetupLock(logger=logger, path=tmp_path / "setup", bot_id=42)
+
+    assert await setup_lock.acquire("fingerprint") is True
+    await setup_lock.complete("fingerprint")
+
+    restarted_setup_lock = aiogram_utils.LocalSetupLock(logger=logger, path=tmp_path / "setup", bot_id=42)
+    assert await restarted_setup_lock.acquire("fingerprint") is False
+    assert await restarted_setup_lock.acquire("other_fingerprint") is True
@@ -0,0 +1,78 @@
+import asyncio
+import logging
+import typing
+
+import aiogram.methods as aiogram_methods
+import aiogram.types as aiogram_types
+import pytest
+
+import lib.telegram.context as telegram_context
+import lib.utils.aiogram as aiogram_utils
+import tests.utils.telegram as telegram_utils
+
+logger = logging.getLogger(__name__)
+
+Handler = typing.Callable[[aiogram_types.TelegramObject, dict[str, typing.Any]], typing.Awaitable[str]]
+
+
+@pytest.fixture(name="handler")
+def fixture_handler() -> Handler:
+    async def handler(event: aiogram_types.TelegramObject, data: dict[str, typing.Any]) -> str:
+        return "handled"
+
+    return handler
+
+
+@pytest.fixture(name="middleware")
+def fixture_middleware() -> aiogram_utils.ThrottlingMiddleware:
+    return aiogram_utils.ThrottlingMiddleware(
+        logger=logger,
+        storage=aiogram_utils.LocalThrottleStorage(),
+        limits={"roll": aiogram_utils.ThrottleLimit(rate=0.001, capacity=2)},
+        commands={"stealth": "roll", "perception": "roll"},
+        get_key=telegram_context.get_context_key_from_message,
+        throttled_text="slow down",
+    )
+
+
+@pytest.mark.asyncio
+async def test_throttling_middleware_answers_once(
+    middleware: aiogram_utils.ThrottlingMiddleware,
+    handler: Handler,
+):
+    results = [
+        await middleware(handler, telegram_utils.make_message(text), {}) for text in ["/stealth", "/perception"] * 2
+    ]
+
+    assert results[:2] == ["handled", "handled"]
+    assert isinstance(results[2], aiogram_methods.SendMessage)
+    assert results[2].text == "slow down"
+    assert results[3] is None
+
+
+@pytest.mark.asyncio
+async def test_throttling_middleware_keys(
+    middleware: aiogram_utils.ThrottlingMiddleware,
+    handler: Handler,
+):
+    for _ in range(2):
+        assert await middleware(handler, telegram_utils.make_message("/stealth"), {}) == "handled"
+    assert await middleware(handler, telegram_utils.make_message("/stealth@bot args"), {}) != "handled"
+
+    # other users and chats have their own buckets, other commands are not limited
+    assert await middleware(handler, telegram_utils.make_message("/stealth", user_id=2), {}) == "handled"
+    assert await middleware(handler, telegram_utils.make_message("/stealth", chat_id=2), {}) == "handled"
+    assert await middleware(handler, telegram_utils.make_message("/help"), {}) == "handled"
+    assert await middleware(handler, telegram_utils.make_message("hello"), {}) == "handled"
+
+
+@pytest.mark.asyncio
+async def test_local_throttle_storage_prunes_full_buckets():
+    storage = aiogram_utils.LocalThrottleStorage(max_keys=2)
+    limit = aiogram_utils.ThrottleLimit(rate=1000, capacity=1)
+
+    assert await storage.try_acquire("a", limit)
+    assert await storage.try_acquire("b", limit)
+    await asyncio.sleep(0.01)
+    assert await storage.try_acquire("c", limit)
+    assert len(storage._buckets) <= 2  # pyright: ignore[reportPrivateUsage]
@@ -0,0 +1,320 @@
+import asyncio
+import logging
+import typing
+
+import aiogram
+import aiogram.methods as aiogram_methods
+import aiogram.types as aiogram_types
+import aiogram.webhook.aiohttp_server as aiogram_webhook
+import aiohttp
+import aiohttp.test_utils as aiohttp_test_utils
+import aiohttp.web as aiohttp_web
+import pytest
+import pytest_asyncio
+
+import lib.utils.aiogram as aiogram_utils
+
+logger = logging.getLogger(__name__)
+
+BOT_TOKEN = "123456:ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghi"
+SECRET_TOKEN = "secret"
+
+
+def _make_update(update_id: int) -> dict[str, typing.Any]:
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": 0,
+            "chat": {"id": 1, "type": "private"},
+            "from": {"id": 1, "is_bot": False, "first_name": "User"},
+            "text": "/test",
+        },
+    }
+
+
+class _Handler:
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.update_ids: list[int] = []
+        self.reply_text: str | None = None
+
+    async def process(self, message: aiogram_types.Message) -> aiogram_methods.SendMessage | None:
+        await self.release.wait()
+        self.update_ids.append(message.message_id)
+
+        if self.reply_text is None:
+            return None
+
+        return message.answer(self.reply_text)
+
+
+@pytest_asyncio.fixture(name="bot")
+async def fixture_bot() -> typing.AsyncGenerator[aiogram.Bot, None]:
+    bot = aiogram.Bot(token=BOT_TOKEN)
+    yield bot
+    await bot.session.close()
+
+
+@pytest.fixture(name="handler")
+def fixture_handler() -> _Handler:
+    return _Handler()
+
+
+@pytest_asyncio.fixture(name="webhook_handler")
+async def fixture_webhook_handler(
+    bot: aiogram.Bot,
+    handler: _Handler,
+) -> typing.AsyncGenerator[aiogram_utils.QueuedWebhookHandler, None]:
+    dispatcher = aiogram.Dispatcher()
+    dispatcher.message.register(handler.process)
+
+    webhook_handler = aiogram_utils.QueuedWebhookHandler(
+        logger=logger,
+        bot=bot,
+        dispatcher=dispatcher,
+        secret_token=SECRET_TOKEN,
+        max_size=2,
+        workers_count=1,
+        overflow_timeout_seconds=0.05,
+    )
+    tasks = webhook_handler.get_main_tasks()
+    yield webhook_handler
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@pytest_asyncio.fixture(name="client")
+async def fixture_client(
+    webhook_handler: aiogram_utils.QueuedWebhookHandler,
+) -> typing.AsyncGenerator[aiohttp_test_utils.TestClient[aiohttp_web.Request, aiohttp_web.Application], None]:
+    app = aiohttp_web.Application()
+    app.router.add_post("/webhook", webhook_handler.handle)
+    app.router.add_get("/metrics", webhook_handler.process_metrics)
+
+    async with aiohttp_test_utils.TestClient(aiohttp_test_utils.TestServer(app)) as client:
+        yield client
+
+
+async def _post(client: aiohttp_test_utils.TestClient[typing.Any, typing.Any], update_id: int) -> int:
+    response = await client.post(
+        "/webhook",
+        json=_make_update(update_id),
+        headers={aiogram_utils.SECRET_TOKEN_HEADER: SECRET_TOKEN},
+    )
+    return response.status
+
+
+async def _get_metrics(client: aiohttp_test_utils.TestClient[typing.Any, typing.Any]) -> dict[str, typing.Any]:
+    response = await client.get("/metrics", headers={aiogram_utils.SECRET_TOKEN_HEADER: SECRET_TOKEN})
+    return await response.json()
+
+
+@pytest.mark.asyncio
+async def test_webhook_acknowledges_and_rejects_when_full(
+    client: aiohttp_test_utils.TestClient[typing.Any, typing.Any],
+    handler: _Handler,
+):
+    # first update is taken by the only worker, next two fill the queue
+    assert [await _post(client, update_id) for update_id in range(1, 4)] == [200, 200, 200]
+    assert await _post(client, 4) == 503
+
+    metrics = await _get_metrics(client)
+    assert metrics["queue_depth"] == 2
+    assert metrics["enqueued_total"] == 3
+    assert metrics["rejected_total"] == 1
+
+    handler.release.set()
+    for _ in range(100):
+        if len(handler.update_ids) == 3:
+            break
+        await asyncio.sleep(0.01)
+
+    assert handler.update_ids == [1, 2, 3]
+    metrics = await _get_metrics(client)
+    assert metrics["queue_depth"] == 0
+    assert metrics["processed_total"] == 3
+    assert metrics["wait_seconds_max"] > 0
+
+
+@pytest.mark.asyncio
+async def test_webhook_wait_policy(
+    webhook_handler: aiogram_utils.QueuedWebhookHandler,
+    client: aiohttp_test_utils.TestClient[typing.Any, typing.Any],
+    handler: _Handler,
+):
+    object.__setattr__(webhook_handler, "overflow_policy", aiogram_utils.QueuedWebhookHandler.OverflowPolicy.WAIT)
+    assert [await _post(client, update_id) for update_id in range(1, 4)] == [200, 200, 200]
+
+    # times out while the worker is blocked
+    assert await _post(client, 4) == 503
+
+    # gets a slot once the worker drains the queue
+    post_task = asyncio.create_task(_post(client, 5))
+    await asyncio.sleep(0.01)
+    handler.release.set()
+    assert await post_task == 200
+
+
+@pytest.mark.asyncio
+async def test_webhook_secret_token(client: aiohttp_test_utils.TestClient[typing.Any, typing.Any]):
+    response = await client.post("/webhook", json=_make_update(1))
+    assert response.status == 401
+
+    response = await client.get("/metrics")
+    assert response.status == 401
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("body", [b"not json", b"[]", b"1"])
+async def test_webhook_invalid_update(client: aiohttp_test_utils.TestClient[typing.Any, typing.Any], body: bytes):
+    response = await client.post("/webhook", data=body, headers={aiogram_utils.SECRET_TOKEN_HEADER: SECRET_TOKEN})
+    assert response.status == 400
+
+
+@pytest.mark.asyncio
+async def test_webhook_answers_in_response(
+    webhook_handler: aiogram_utils.QueuedWebhookHandler,
+    client: aiohttp_test_utils.TestClient[typing.Any, typing.Any],
+    handler: _Handler,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    object.__setattr__(webhook_handler, "response_timeout_seconds", 0.05)
+    calls: list[aiogram_methods.TelegramMethod[typing.Any]] = []
+
+    async def silent_call_request(bot: aiogram.Bot, result: aiogram_methods.TelegramMethod[typing.Any]) -> None:
+        calls.append(result)
+
+    monkeypatch.setattr(webhook_handler.dispatcher, "silent_call_request", silent_call_request)
+    handler.reply_text = "reply"
+
+    # handler is blocked, request falls back to acknowledgement and the reply to an API call
+    response = await client.post(
+        "/webhook",
+        json=_make_update(1),
+        headers={aiogram_utils.SECRET_TOKEN_HEADER: SECRET_TOKEN},
+    )
+    assert await response.json() == {}
+
+    handler.release.set()
+    response = await client.post(
+        "/webhook",
+        json=_make_update(2),
+        headers={aiogram_utils.SECRET_TOKEN_HEADER: SECRET_TOKEN},
+    )
+    body = await response.text()
+    assert response.content_type == "multipart/form-data"
+    assert "sendMessage" in body
+    assert "reply" in body
+
+    assert len(calls) == 1
+    assert isinstance(calls[0], aiogram_methods.SendMessage)
+    assert webhook_handler.metrics.answered_in_response_total == 1
+
+
+@pytest.mark.asyncio
+async def test_webhook_prefilter(
+    webhook_handler: aiogram_utils.QueuedWebhookHandler,
+    client: aiohttp_test_utils.TestClient[typing.Any, typing.Any],
+    handler: _Handler,
+):
+    object.__setattr__(webhook_handler, "update_prefilter", aiogram_utils.CommandUpdatePrefilter(frozenset(["test"])))
+    handler.release.set()
+
+    update = _make_update(1)
+    update["message"]["text"] = "just chatting"
+    response = await client.post("/webhook", json=update, headers={aiogram_utils.SECRET_TOKEN_HEADER: SECRET_TOKEN})
+    assert response.status == 200
+    assert await _post(client, 2) == 200
+
+    for _ in range(100):
+        if handler.update_ids:
+            break
+        await asyncio.sleep(0.01)
+
+    assert handler.update_ids == [2]
+    assert webhook_handler.metrics.filtered_total == 1
+    assert webhook_handler.metrics.enqueued_total == 1
+
+
+@pytest.mark.asyncio
+async def test_webhook_skips_duplicated_updates(
+    webhook_handler: aiogram_utils.QueuedWebhookHandler,
+    client: aiohttp_test_utils.TestClient[typing.Any, typing.Any],
+    handler: _Handler,
+):
+    object.__setattr__(webhook_handler, "deduplicator", aiogram_utils.LocalUpdateDeduplicator())
+
+    # first update is taken by the only worker, next two fill the queue and the last is rejected
+    assert [await _post(client, update_id) for update_id in [1, 1, 2, 3, 4]] == [200, 200, 200, 200, 503]
+    assert webhook_handler.metrics.duplicated_total == 1
+
+    handler.release.set()
+    for _ in range(100):
+        if len(handler.update_ids) == 3:
+            break
+        await asyncio.sleep(0.01)
+
+    # rejected update is processed on redelivery
+    assert await _post(client, 4) == 200
+    for _ in range(100):
+        if len(handler.update_ids) == 4:
+            break
+        await asyncio.sleep(0.01)
+
+    assert handler.update_ids == [1, 2, 3, 4]
+
+
+async def _read_form_data(response: aiohttp_web.Response) -> list[tuple[str | None, str | None, bytes]]:
+    app = aiohttp_web.Application()
+
+    async def get(request: aiohttp_web.Request) -> aiohttp_web.Response:
+        return response
+
+    app.router.add_get("/", get)
+
+    async with aiohttp_test_utils.TestClient(aiohttp_test_utils.TestServer(app)) as client:
+        client_response = await client.get("/")
+        reader = aiohttp.MultipartReader(client_response.headers, client_response.content)
+        fields: list[tuple[str | None, str | None, bytes]] = []
+        while (part := await reader.next()) is not None:
+            assert isinstance(part, aiohttp.BodyPartReader)
+            fields.append((part.name, part.filename, await part.read()))
+
+    return fields
+
+
+def _strip_attach_names(
+    fields: list[tuple[str | None, str | None, bytes]],
+) -> list[tuple[str | None, str | None, bytes]]:
+    return [
+        (
+            name if filename is None else None,
+            filename,
+            b"attach://" if value.startswith(b"attach://") else value,
+        )
+        for name, filename, value in fields
+    ]
+
+
+@pytest.mark.asyncio
+async def test_build_method_response_matches_aiogram(bot: aiogram.Bot):
+    method = aiogram_methods.SendDocument(
+        chat_id=1,
+        document=aiogram_types.BufferedInputFile(b"content", filename="roll.txt"),
+        caption="caption",
+        reply_markup=aiogram_types.InlineKeyboardMarkup(
+            inline_keyboard=[[aiogram_types.InlineKeyboardButton(text="Roll", callback_data="r")]],
+        ),
+    )
+    request_handler = aiogram_webhook.SimpleRequestHandler(dispatcher=aiogram.Dispatcher(), bot=bot)
+    expected = aiohttp_web.Response(body=request_handler._build_response_writer(bot=bot, result=method))
+
+    fields = await _read_form_data(aiogram_utils.build_method_response(bot, method))
+
+    # attached files get random names, so their parts are compared without them
+    assert _strip_attach_names(fields) == _strip_attach_names(await _read_form_data(expected))
+    assert fields[0] == ("method", None, b"sendDocument")
+    assert fields[-1][1:] == ("roll.txt", b"content")
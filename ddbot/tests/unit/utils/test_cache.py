@@ -0,0 +1,77 @@
+import datetime
+import logging
+
+import pytest
+
+import lib.utils.cache as cache_utils
+
+logger = logging.getLogger(__name__)
+
+
+async def _value(value: int) -> int:
+    return value
+
+
+def _expire(cache: cache_utils.AdaptiveLocalCache[int], key: str) -> None:
+    record = cache._cache[key]  # pyright: ignore[reportPrivateUsage]
+    record.created_at -= record.ttl + datetime.timedelta(seconds=1)
+
+
+def _get_ttl(cache: cache_utils.AdaptiveLocalCache[int], key: str) -> datetime.timedelta:
+    return cache._cache[key].ttl  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.fixture(name="cache")
+def fixture_cache() -> cache_utils.AdaptiveLocalCache[int]:
+    return cache_utils.AdaptiveLocalCache[int](
+        ttl=datetime.timedelta(minutes=10),
+        min_ttl=datetime.timedelta(minutes=1),
+        max_ttl=datetime.timedelta(minutes=30),
+        growth_factor=2,
+    )
+
+
+@pytest.mark.asyncio
+async def test_adaptive_cache_hit(cache: cache_utils.AdaptiveLocalCache[int]):
+    assert await cache.wrap_awaitable("key", _value(1), logger) == 1
+
+    unused_awaitable = _value(2)
+    assert await cache.wrap_awaitable("key", unused_awaitable, logger) == 1
+    unused_awaitable.close()
+
+    assert _get_ttl(cache, "key") == datetime.timedelta(minutes=10)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_cache_unchanged_value_grows_ttl(cache: cache_utils.AdaptiveLocalCache[int]):
+    await cache.wrap_awaitable("key", _value(1), logger)
+
+    _expire(cache, "key")
+    assert await cache.wrap_awaitable("key", _value(1), logger) == 1
+    assert _get_ttl(cache, "key") == datetime.timedelta(minutes=20)
+
+    _expire(cache, "key")
+    assert await cache.wrap_awaitable("key", _value(1), logger) == 1
+    assert _get_ttl(cache, "key") == datetime.timedelta(minutes=30)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_cache_changed_value_resets_ttl(cache: cache_utils.AdaptiveLocalCache[int]):
+    await cache.wrap_awaitable("key", _value(1), logger)
+
+    _expire(cache, "key")
+    assert await cache.wrap_awaitable("key", _value(2), logger) == 2
+    assert _get_ttl(cache, "key") == datetime.timedelta(minutes=1)
+
+    _expire(cache, "key")
+    assert await cache.wrap_awaitable("key", _value(2), logger) == 2
+    assert _get_ttl(cache, "key") == datetime.timedelta(minutes=2)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_cache_clear(cache: cache_utils.AdaptiveLocalCache[int]):
+    await cache.wrap_awaitable("key", _value(1), logger)
+    await cache.clear("key")
+
+    assert await cache.wrap_awaitable("key", _value(2), logger) == 2
+    assert _get_ttl(cache, "key") == datetime.timedelta(minutes=10)
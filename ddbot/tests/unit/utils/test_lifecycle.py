@@ -0,0 +1,148 @@
+import asyncio
+import logging
+
+import pytest
+
+import lib.utils.lifecycle as lifecycle_utils
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.asyncio
+async def test_lifecycle_drains_before_cancelling_main_tasks_and_shutting_down():
+    events: list[str] = []
+    queue: asyncio.Queue[int] = asyncio.Queue()
+
+    async def work() -> None:
+        while True:
+            item = await queue.get()
+            await asyncio.sleep(0.01)
+            events.append(f"processed {item}")
+            queue.task_done()
+
+    async def shutdown() -> None:
+        events.append("shutdown")
+
+    for item in range(3):
+        queue.put_nowait(item)
+
+    main_task = asyncio.create_task(work())
+    lifecycle = lifecycle_utils.Lifecycle(
+        logger=logger,
+        main_tasks=[main_task],
+        drain_callbacks=[lifecycle_utils.Callback(queue.join(), "Failed to drain", "Drained")],
+        shutdown_callbacks=[lifecycle_utils.Callback(shutdown(), "Failed to shut down", "Shut down")],
+    )
+
+    await lifecycle.on_shutdown()
+
+    assert events == ["processed 0", "processed 1", "processed 2", "shutdown"]
+    assert main_task.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_lifecycle_drain_timeout():
+    main_task = asyncio.create_task(asyncio.Event().wait())
+    lifecycle = lifecycle_utils.Lifecycle(
+        logger=logger,
+        main_tasks=[main_task],
+        drain_callbacks=[lifecycle_utils.Callback(asyncio.Event().wait(), "Failed to drain", "Drained")],
+        drain_timeout_seconds=0.05,
+    )
+
+    async with asyncio.timeout(1):
+        await lifecycle.on_shutdown()
+
+    assert main_task.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_lifecycle_startup_runs_callbacks_concurrently_after_dependencies():
+    events: list[str] = []
+
+    async def step(name: str, delay: float) -> None:
+        events.append(f"start {name}")
+        await asyncio.sleep(delay)
+        events.append(f"end {name}")
+
+    lifecycle = lifecycle_utils.Lifecycle(
+        logger=logger,
+        startup_callbacks=[
+            lifecycle_utils.Callback(step("slow", 0.05), "Failed", "Done", name="slow"),
+            lifecycle_utils.Callback(step("fast", 0.01), "Failed", "Done", name="fast"),
+            lifecycle_utils.Callback(step("dependent", 0), "Failed", "Done", depends_on=["fast"]),
+        ],
+    )
+
+    await lifecycle.on_startup()
+
+    assert events == ["start slow", "start fast", "end fast", "start dependent", "end dependent", "end slow"]
+
+
+@pytest.mark.asyncio
+async def test_lifecycle_startup_failure_cancels_other_callbacks():
+    events: list[str] = []
+
+    async def fail() -> None:
+        raise ValueError("test")
+
+    async def slow() -> None:
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            events.append("cancelled")
+            raise
+
+    lifecycle = lifecycle_utils.Lifecycle(
+        logger=logger,
+        startup_callbacks=[
+            lifecycle_utils.Callback(slow(), "Failed", "Done"),
+            lifecycle_utils.Callback(fail(), "Failed", "Done"),
+        ],
+    )
+
+    with pytest.raises(lifecycle_utils.Lifecycle.StartupError):
+        await lifecycle.on_startup()
+
+    assert events == ["cancelled"]
+
+
+@pytest.mark.asyncio
+async def test_background_task_does_not_block_startup_and_logs_failures(caplog: pytest.LogCaptureFixture):
+    started = asyncio.Event()
+
+    async def fail() -> None:
+        started.set()
+        raise ValueError("test")
+
+    background_task = lifecycle_utils.BackgroundTask(
+        logger=logger,
+        awaitable=fail(),
+        name="fail",
+        error_message="Failed in background",
+        success_message="Done in background",
+    )
+    lifecycle = lifecycle_utils.Lifecycle(
+        logger=logger,
+        startup_callbacks=[lifecycle_utils.Callback(background_task.start(), "Failed to start", "Started")],
+    )
+
+    await lifecycle.on_startup()
+    async with asyncio.timeout(1):
+        await started.wait()
+    await background_task.cancel()
+
+    assert "Failed in background" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_background_task_cancel_before_start():
+    background_task = lifecycle_utils.BackgroundTask(
+        logger=logger,
+        awaitable=asyncio.Event().wait(),
+        name="wait",
+        error_message="Failed in background",
+        success_message="Done in background",
+    )
+
+    await background_task.cancel()
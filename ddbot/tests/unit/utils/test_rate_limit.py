@@ -0,0 +1,25 @@
+import time
+
+import pytest
+
+import lib.utils.rate_limit as rate_limit_utils
+
+
+def test_token_bucket_try_acquire():
+    bucket = rate_limit_utils.TokenBucket(rate=1, capacity=2)
+
+    assert bucket.try_acquire()
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+    assert bucket.get_delay() > 0
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_acquire_waits_for_refill():
+    bucket = rate_limit_utils.TokenBucket(rate=50, capacity=1)
+
+    started_at = time.monotonic()
+    for _ in range(3):
+        await bucket.acquire()
+
+    assert time.monotonic() - started_at >= 0.035
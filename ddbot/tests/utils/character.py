@@ -0,0 +1,125 @@
+import dataclasses
+import random
+import typing
+
+import lib.character.models as character_models
+import lib.character.protocols as character_protocols
+
+MODIFIER_GROUPS = ("race", "class", "background", "item", "feat")
+MODIFIER_TYPES = ("bonus", "proficiency", "expertise", "half-proficiency", "language")
+MODIFIER_SUB_TYPES = (
+    "strength-score",
+    "dexterity-score",
+    "constitution-score",
+    "intelligence-score",
+    "wisdom-score",
+    "charisma-score",
+    "strength-saving-throws",
+    "dexterity-saving-throws",
+    "constitution-saving-throws",
+    "intelligence-saving-throws",
+    "wisdom-saving-throws",
+    "charisma-saving-throws",
+    "athletics",
+    "acrobatics",
+    "sleight-of-hand",
+    "stealth",
+    "arcana",
+    "history",
+    "investigation",
+    "nature",
+    "religion",
+    "animal-handling",
+    "insight",
+    "medicine",
+    "perception",
+    "survival",
+    "deception",
+    "intimidation",
+    "performance",
+    "persuasion",
+    "initiative",
+    "common",
+    "unarmored-armor-class",
+)
+
+
+def make_modifier(rng: random.Random) -> dict[str, typing.Any]:
+    modifier_type = rng.choice(MODIFIER_TYPES)
+    modifier_sub_type = rng.choice(MODIFIER_SUB_TYPES)
+
+    return {
+        "type": modifier_type,
+        "subType": modifier_sub_type,
+        "value": rng.randint(-1, 3) if modifier_type == "bonus" else rng.choice([None, rng.randint(-1, 3)]),
+        "bonusTypes": rng.choice([[], [], [], [1]]),
+        "friendlyTypeName": modifier_type.title(),
+        "friendlySubtypeName": modifier_sub_type.title(),
+    }
+
+
+def make_character_data(
+    entity_id: int,
+    rng: random.Random | None = None,
+    modifiers_count: int = 40,
+) -> dict[str, typing.Any]:
+    rng = rng or random.Random(entity_id)
+
+    return {
+        "id": entity_id,
+        "name": f"Character {entity_id}",
+        "stats": [{"id": stat_id, "value": rng.randint(3, 18)} for stat_id in range(1, 7)],
+        "bonusStats": [{"id": stat_id, "value": rng.choice([None, None, 1, 2])} for stat_id in range(1, 7)],
+        "overrideStats": [{"id": stat_id, "value": rng.choice([None] * 9 + [19])} for stat_id in range(1, 7)],
+        "classes": [{"level": rng.randint(1, 10)} for _ in range(rng.randint(1, 2))],
+        "modifiers": {group: [make_modifier(rng) for _ in range(modifiers_count // 5)] for group in MODIFIER_GROUPS},
+    }
+
+
+def make_character_response(data: dict[str, typing.Any]) -> dict[str, typing.Any]:
+    return {
+        "id": data["id"],
+        "success": True,
+        "message": "Character successfully received.",
+        "data": data,
+    }
+
+
+def make_character(
+    entity_id: int = 1,
+    abilities: dict[character_models.CharacterAbility, int] | None = None,
+    saving_throw_modifiers: dict[character_models.CharacterAbility, int] | None = None,
+    skill_modifiers: dict[character_models.CharacterSkill, int] | None = None,
+    initiative_modifier: int = 0,
+    death_saving_throw_modifier: int = 0,
+) -> character_models.Character:
+    return character_models.Character.from_mappings(
+        id=entity_id,
+        name=f"Character {entity_id}",
+        abilities={ability: 10 for ability in character_models.ABILITIES} | (abilities or {}),
+        saving_throw_modifiers={ability: 0 for ability in character_models.ABILITIES} | (saving_throw_modifiers or {}),
+        skill_modifiers={skill: 0 for skill in character_models.SKILLS} | (skill_modifiers or {}),
+        initiative_modifier=initiative_modifier,
+        death_saving_throw_modifier=death_saving_throw_modifier,
+    )
+
+
+@dataclasses.dataclass
+class FakeCharacterService(character_protocols.CharacterServiceProtocol):
+    characters: dict[int, character_models.Character] = dataclasses.field(default_factory=dict)
+
+    async def get(self, entity_id: int) -> character_models.Character:
+        if entity_id not in self.characters:
+            raise character_protocols.CharacterServiceProtocol.NotFoundError
+        return self.characters[entity_id]
+
+    async def import_campaign(self, campaign_id: int) -> character_models.CampaignImportResult:
+        raise character_protocols.CharacterServiceProtocol.NotFoundError
+
+
+__all__ = [
+    "FakeCharacterService",
+    "make_character",
+    "make_character_data",
+    "make_character_response",
+]
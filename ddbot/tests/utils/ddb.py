@@ -0,0 +1,249 @@
+import argparse
+import asyncio
+import contextlib
+import dataclasses
+import logging
+import math
+import pathlib
+import random
+import typing
+
+import aiohttp.web as aiohttp_web
+
+import lib.character.archives.compression as archive_compression
+import lib.character.archives.local as local_archives
+import lib.utils.json as json_utils
+import tests.utils.character as character_utils
+
+logger = logging.getLogger(__name__)
+
+NOT_FOUND_DATA = {"serverMessage": "The resource requested was not found.", "errorCode": "404"}
+PRIVATE_DATA = {"serverMessage": "Unauthorized Access Attempt.", "errorCode": "403"}
+
+
+class LatencyProtocol(typing.Protocol):
+    def sample(self, rng: random.Random) -> float: ...
+
+
+@dataclasses.dataclass(frozen=True)
+class ConstantLatency(LatencyProtocol):
+    seconds: float = 0
+
+    def sample(self, rng: random.Random) -> float:
+        return self.seconds
+
+
+@dataclasses.dataclass(frozen=True)
+class UniformLatency(LatencyProtocol):
+    min_seconds: float
+    max_seconds: float
+
+    def sample(self, rng: random.Random) -> float:
+        return rng.uniform(self.min_seconds, self.max_seconds)
+
+
+@dataclasses.dataclass(frozen=True)
+class LogNormalLatency(LatencyProtocol):
+    median_seconds: float
+    sigma: float = 0.5
+    max_seconds: float = 10
+
+    def sample(self, rng: random.Random) -> float:
+        return min(self.max_seconds, rng.lognormvariate(math.log(self.median_seconds), self.sigma))
+
+
+@dataclasses.dataclass(frozen=True)
+class FakeDdbProfile:
+    latency: LatencyProtocol = ConstantLatency()
+    error_rate: float = 0
+    error_status: int = 500
+    oversized_rate: float = 0
+    oversized_body_bytes: int = 32 * 1024 * 1024
+
+
+PROFILES: dict[str, FakeDdbProfile] = {
+    "instant": FakeDdbProfile(),
+    "realistic": FakeDdbProfile(latency=LogNormalLatency(median_seconds=0.25, sigma=0.6)),
+    "slow": FakeDdbProfile(latency=UniformLatency(min_seconds=1, max_seconds=3)),
+    "flaky": FakeDdbProfile(latency=LogNormalLatency(median_seconds=0.25, sigma=0.6), error_rate=0.1),
+    "oversized": FakeDdbProfile(oversized_rate=0.5),
+}
+
+
+def load_recorded_characters(path: pathlib.Path) -> dict[int, dict[str, typing.Any]]:
+    """
+    Loads raw character payloads from `*.json` response dumps and `*.json.zlib` archive files.
+    """
+    result: dict[int, dict[str, typing.Any]] = {}
+
+    for file_path in sorted(path.glob("*.json")):
+        raw_data = json_utils.loads_bytes(file_path.read_bytes())
+        raw_data = raw_data.get("data", raw_data)
+        result[raw_data["id"]] = raw_data
+
+    for file_path in sorted(path.glob(f"*{local_archives.FILE_SUFFIX}")):
+        raw_data = archive_compression.decompress_raw_data(file_path.read_bytes())
+        result[raw_data["id"]] = raw_data
+
+    return result
+
+
+@dataclasses.dataclass
+class FakeDdbServer:
+    characters: dict[int, dict[str, typing.Any]] = dataclasses.field(default_factory=dict)
+    campaigns: dict[int, list[int]] = dataclasses.field(default_factory=dict)
+    private_entity_ids: set[int] = dataclasses.field(default_factory=set)
+    synthetic_characters_enabled: bool = False
+    profile: FakeDdbProfile = FakeDdbProfile()
+    rng: random.Random = dataclasses.field(default_factory=lambda: random.Random(42))
+
+    requests_count: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+    def _get_character_data(self, entity_id: int) -> dict[str, typing.Any] | None:
+        if entity_id in self.characters:
+            return self.characters[entity_id]
+
+        if self.synthetic_characters_enabled:
+            return character_utils.make_character_data(entity_id)
+
+        return None
+
+    def _make_error_response(self, entity_id: int, status: int, data: dict[str, typing.Any]) -> aiohttp_web.Response:
+        return aiohttp_web.json_response(
+            {"id": entity_id, "success": False, "message": "Request failed", "data": data},
+            status=status,
+            dumps=json_utils.dumps_str,
+        )
+
+    @contextlib.asynccontextmanager
+    async def _track(self) -> typing.AsyncGenerator[None, None]:
+        self.requests_count += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            await asyncio.sleep(self.profile.latency.sample(self.rng))
+            yield
+        finally:
+            self.in_flight -= 1
+
+    async def get_character(self, request: aiohttp_web.Request) -> aiohttp_web.Response:
+        entity_id = int(request.match_info["entity_id"])
+
+        async with self._track():
+            if self.rng.random() < self.profile.error_rate:
+                return aiohttp_web.Response(status=self.profile.error_status, text="Internal Server Error")
+
+            if entity_id in self.private_entity_ids:
+                return self._make_error_response(entity_id, 403, PRIVATE_DATA)
+
+            raw_data = self._get_character_data(entity_id)
+            if raw_data is None:
+                return self._make_error_response(entity_id, 404, NOT_FOUND_DATA)
+
+            if self.rng.random() < self.profile.oversized_rate:
+                raw_data = {**raw_data, "padding": "x" * self.profile.oversized_body_bytes}
+
+            return aiohttp_web.json_response(
+                character_utils.make_character_response(raw_data),
+                dumps=json_utils.dumps_str,
+            )
+
+    async def get_campaign(self, request: aiohttp_web.Request) -> aiohttp_web.Response:
+        campaign_id = int(request.match_info["campaign_id"])
+
+        async with self._track():
+            if self.rng.random() < self.profile.error_rate:
+                return aiohttp_web.Response(status=self.profile.error_status, text="Internal Server Error")
+
+            if campaign_id not in self.campaigns:
+                return self._make_error_response(campaign_id, 404, NOT_FOUND_DATA)
+
+            return aiohttp_web.json_response(
+                {
+                    "id": campaign_id,
+                    "success": True,
+                    "message": "Active characters successfully received.",
+                    "data": [
+                        {
+                            "id": entity_id,
+                            "name": f"Character {entity_id}",
+                            "userId": entity_id,
+                            "userName": f"player_{entity_id}",
+                        }
+                        for entity_id in self.campaigns[campaign_id]
+                    ],
+                },
+                dumps=json_utils.dumps_str,
+            )
+
+    def make_app(self) -> aiohttp_web.Application:
+        app = aiohttp_web.Application()
+        app.router.add_get("/character/v5/character/{entity_id}", self.get_character)
+        app.router.add_get("/api/campaign/stt/active-short-characters/{campaign_id}", self.get_campaign)
+
+        return app
+
+
+@contextlib.asynccontextmanager
+async def run_fake_ddb_server(
+    server: FakeDdbServer,
+    host: str = "127.0.0.1",
+    port: int = 0,
+) -> typing.AsyncGenerator[str, None]:
+    runner = aiohttp_web.AppRunner(server.make_app())
+    await runner.setup()
+    site = aiohttp_web.TCPSite(runner, host=host, port=port)
+    await site.start()
+
+    try:
+        yield f"http://{host}:{runner.addresses[0][1]}"
+    finally:
+        await runner.cleanup()
+
+
+async def _serve(server: FakeDdbServer, host: str, port: int) -> None:
+    async with run_fake_ddb_server(server, host=host, port=port) as base_url:
+        logger.info("Fake D&D Beyond server is listening on %s", base_url)
+        await asyncio.Event().wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local D&D Beyond character service stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="realistic")
+    parser.add_argument("--recorded", type=pathlib.Path, help="directory with recorded payloads")
+    parser.add_argument("--private", type=int, nargs="*", default=[], help="entity ids to answer as private")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = FakeDdbServer(
+        characters=load_recorded_characters(args.recorded) if args.recorded else {},
+        private_entity_ids=set(args.private),
+        synthetic_characters_enabled=True,
+        profile=PROFILES[args.profile],
+    )
+
+    try:
+        asyncio.run(_serve(server, host=args.host, port=args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
+
+
+__all__ = [
+    "PROFILES",
+    "ConstantLatency",
+    "FakeDdbProfile",
+    "FakeDdbServer",
+    "LogNormalLatency",
+    "UniformLatency",
+    "load_recorded_characters",
+    "run_fake_ddb_server",
+]
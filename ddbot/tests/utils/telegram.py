@@ -0,0 +1,180 @@
+import argparse
+import asyncio
+import contextlib
+import dataclasses
+import logging
+import typing
+
+import aiogram.types as aiogram_types
+import aiohttp.web as aiohttp_web
+
+import lib.utils.json as json_utils
+
+logger = logging.getLogger(__name__)
+
+BOT_ID = 123456
+
+
+def make_user(user_id: int = 1) -> aiogram_types.User:
+    return aiogram_types.User(id=user_id, is_bot=False, first_name="User")
+
+
+def make_message(
+    text: str | None,
+    user_id: int = 1,
+    chat_id: int = 1,
+    chat_type: str = "group",
+    message_id: int = 1,
+    message_thread_id: int | None = None,
+    caption: str | None = None,
+) -> aiogram_types.Message:
+    return aiogram_types.Message.model_validate(
+        {
+            "message_id": message_id,
+            "date": 0,
+            "chat": {"id": chat_id, "type": chat_type},
+            "from": make_user(user_id),
+            "text": text,
+            "caption": caption,
+            "message_thread_id": message_thread_id,
+        }
+    )
+
+
+def make_inline_query(query: str = "", user_id: int = 1) -> aiogram_types.InlineQuery:
+    return aiogram_types.InlineQuery(id="1", from_user=make_user(user_id), query=query, offset="")
+
+
+@dataclasses.dataclass(frozen=True)
+class FakeTelegramCall:
+    token: str
+    method: str
+    data: dict[str, str]
+
+
+@dataclasses.dataclass
+class FakeTelegramServer:
+    """
+    Minimal Bot API answering `getMe`, `sendMessage` and the bot metadata methods, which keep what `setMy*` set.
+    Every other method is acknowledged with `true`.
+    """
+
+    bot_username: str = "ddbot_test_bot"
+
+    calls: list[FakeTelegramCall] = dataclasses.field(default_factory=list)
+    message_id: int = 0
+    name: str = ""
+    description: str = ""
+    short_description: str = ""
+    commands: list[typing.Any] = dataclasses.field(default_factory=list)
+
+    def _make_user(self) -> dict[str, typing.Any]:
+        return {"id": BOT_ID, "is_bot": True, "first_name": "DDBot", "username": self.bot_username}
+
+    def _make_message(self, data: dict[str, str]) -> dict[str, typing.Any]:
+        self.message_id += 1
+        chat_id = int(data["chat_id"])
+
+        return {
+            "message_id": self.message_id,
+            "date": 0,
+            "chat": {"id": chat_id, "type": "private" if chat_id > 0 else "group"},
+            "from": self._make_user(),
+            "text": data.get("text", ""),
+        }
+
+    def _make_result(self, method: str, data: dict[str, str]) -> typing.Any:
+        match method.lower():
+            case "getme":
+                return self._make_user()
+            case "sendmessage":
+                return self._make_message(data)
+            case "getmyname":
+                return {"name": self.name}
+            case "setmyname":
+                self.name = data.get("name", "")
+            case "getmydescription":
+                return {"description": self.description}
+            case "setmydescription":
+                self.description = data.get("description", "")
+            case "getmyshortdescription":
+                return {"short_description": self.short_description}
+            case "setmyshortdescription":
+                self.short_description = data.get("short_description", "")
+            case "getmycommands":
+                return self.commands
+            case "setmycommands":
+                self.commands = json_utils.loads_str(data["commands"])  # pyright: ignore[reportAttributeAccessIssue]
+            case _:
+                pass
+
+        return True
+
+    async def call_method(self, request: aiohttp_web.Request) -> aiohttp_web.Response:
+        token = request.match_info["token"]
+        method = request.match_info["method"]
+        data = {key: str(value) for key, value in (await request.post()).items()}
+        self.calls.append(FakeTelegramCall(token=token, method=method, data=data))
+
+        return aiohttp_web.json_response(
+            {"ok": True, "result": self._make_result(method, data)},
+            dumps=json_utils.dumps_str,
+        )
+
+    def make_app(self) -> aiohttp_web.Application:
+        app = aiohttp_web.Application()
+        app.router.add_post("/bot{token}/{method}", self.call_method)
+
+        return app
+
+
+@contextlib.asynccontextmanager
+async def run_fake_telegram_server(
+    server: FakeTelegramServer,
+    host: str = "127.0.0.1",
+    port: int = 0,
+) -> typing.AsyncGenerator[str, None]:
+    runner = aiohttp_web.AppRunner(server.make_app())
+    await runner.setup()
+    site = aiohttp_web.TCPSite(runner, host=host, port=port)
+    await site.start()
+
+    try:
+        yield f"http://{host}:{runner.addresses[0][1]}"
+    finally:
+        await runner.cleanup()
+
+
+async def _serve(server: FakeTelegramServer, host: str, port: int) -> None:
+    async with run_fake_telegram_server(server, host=host, port=port) as base_url:
+        logger.info("Fake Telegram Bot API server is listening on %s", base_url)
+        await asyncio.Event().wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local Telegram Bot API stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8091)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    try:
+        asyncio.run(_serve(FakeTelegramServer(), host=args.host, port=args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
+
+
+__all__ = [
+    "BOT_ID",
+    "FakeTelegramCall",
+    "FakeTelegramServer",
+    "make_inline_query",
+    "make_message",
+    "make_user",
+    "run_fake_telegram_server",
+]